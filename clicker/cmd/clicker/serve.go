@@ -22,18 +22,43 @@ func newServeCmd() *cobra.Command {
   # Starts server on port 8080
 
   clicker serve --headless
-  # Starts server with headless browser`,
+  # Starts server with headless browser
+
+  clicker serve --headless --prewarm 2
+  # Keeps 2 browsers launched so new clients don't wait for Chrome to start
+
+  clicker serve --socket /tmp/clicker.sock
+  # Listens on a Unix domain socket instead of a TCP port
+
+  clicker serve --idle-timeout 10m
+  # Exits after 10 minutes without connected clients
+
+  clicker serve --log-max-size 1048576 >>server.log 2>&1
+  # Keeps the log file server.log under 1 MiB while the server runs`,
 		Run: func(cmd *cobra.Command, args []string) {
 			process.WithCleanup(func() {
 				port, _ := cmd.Flags().GetInt("port")
+				prewarm, _ := cmd.Flags().GetInt("prewarm")
+				socketPath, _ := cmd.Flags().GetString("socket")
+				idleTimeout, _ := cmd.Flags().GetDuration("idle-timeout")
+				logMaxSize, _ := cmd.Flags().GetInt64("log-max-size")
 
-				fmt.Printf("Starting Clicker proxy server on port %d...\n", port)
+				// stdout and stderr usually share one file when this is set
+				process.CapOutput(os.Stdout, logMaxSize, time.Second)
+
+				if socketPath != "" {
+					fmt.Printf("Starting Clicker proxy server on %s...\n", socketPath)
+				} else {
+					fmt.Printf("Starting Clicker proxy server on port %d...\n", port)
+				}
 
 				// Create router to manage browser sessions
 				router := proxy.NewRouter(headless)
+				router.Prewarm(prewarm)
 
 				server := proxy.NewServer(
 					proxy.WithPort(port),
+					proxy.WithSocketPath(socketPath),
 					proxy.WithOnConnect(router.OnClientConnect),
 					proxy.WithOnMessage(router.OnClientMessage),
 					proxy.WithOnClose(router.OnClientDisconnect),
@@ -44,11 +69,19 @@ func newServeCmd() *cobra.Command {
 					os.Exit(1)
 				}
 
-				fmt.Printf("Server listening on ws://localhost:%d\n", server.Port())
+				if server.SocketPath() != "" {
+					fmt.Printf("Server listening on ws+unix://%s\n", server.SocketPath())
+				} else {
+					fmt.Printf("Server listening on ws://localhost:%d\n", server.Port())
+				}
 				fmt.Println("Press Ctrl+C to stop...")
 
-				// Wait for signal
-				process.WaitForSignal()
+				// Wait for signal, or until no client has been connected for idleTimeout
+				idle := make(chan struct{})
+				if idleTimeout > 0 {
+					go watchIdle(server, idleTimeout, idle)
+				}
+				process.WaitForSignalOr(idle)
 
 				fmt.Println("\nShutting down...")
 
@@ -62,5 +95,27 @@ func newServeCmd() *cobra.Command {
 		},
 	}
 	cmd.Flags().IntP("port", "p", 9515, "Port to listen on")
+	cmd.Flags().String("socket", "", "Listen on this Unix domain socket instead of a TCP port")
+	cmd.Flags().Duration("idle-timeout", 0, "Exit after this long without connected clients (0 = never)")
+	cmd.Flags().Int("prewarm", 0, "Number of browsers to keep launched ahead of client connections")
+	cmd.Flags().Int64("log-max-size", 0, "Keep stdout under this many bytes when it is a file (0 = no limit)")
 	return cmd
 }
+
+// watchIdle closes idle once the server has had no clients for timeout.
+func watchIdle(server *proxy.Server, timeout time.Duration, idle chan struct{}) {
+	interval := timeout / 10
+	if interval > time.Second {
+		interval = time.Second
+	}
+	ticker := time.NewTicker(interval)
+	defer ticker.Stop()
+
+	for range ticker.C {
+		if server.IdleFor() >= timeout {
+			fmt.Printf("No clients for %v, shutting down\n", timeout)
+			close(idle)
+			return
+		}
+	}
+}
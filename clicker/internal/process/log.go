@@ -0,0 +1,48 @@
+package process
+
+import (
+	"io"
+	"os"
+	"time"
+)
+
+// CapOutput keeps the regular file f below maxSize bytes for the life of the
+// process. Every interval, once f has grown past maxSize it is cut down to
+// its last maxSize/2 bytes, so a long-running server that logs to a file
+// does not fill the disk. f should be opened with O_APPEND, so writers keep
+// appending at the new end after a cut. Does nothing if f is not a regular
+// file (a terminal or pipe) or maxSize is not positive.
+func CapOutput(f *os.File, maxSize int64, interval time.Duration) {
+	if maxSize <= 0 {
+		return
+	}
+	if info, err := f.Stat(); err != nil || !info.Mode().IsRegular() {
+		return
+	}
+	go func() {
+		ticker := time.NewTicker(interval)
+		defer ticker.Stop()
+		for range ticker.C {
+			trimFile(f, maxSize)
+		}
+	}()
+}
+
+// trimFile cuts f down to its last maxSize/2 bytes if it is over maxSize,
+// or empties it if f was not opened for reading. Lines written between
+// reading the tail and truncating are lost.
+func trimFile(f *os.File, maxSize int64) {
+	info, err := f.Stat()
+	if err != nil || info.Size() <= maxSize {
+		return
+	}
+	tail := make([]byte, maxSize/2)
+	n, err := f.ReadAt(tail, info.Size()-int64(len(tail)))
+	if err != nil && err != io.EOF {
+		n = 0
+	}
+	if err := f.Truncate(0); err != nil {
+		return
+	}
+	f.Write(tail[:n])
+}
@@ -72,3 +72,15 @@ func WaitForSignal() {
 	<-c
 	KillAll()
 }
+
+// WaitForSignalOr blocks until SIGINT/SIGTERM is received or done is closed,
+// then cleans up.
+func WaitForSignalOr(done <-chan struct{}) {
+	c := make(chan os.Signal, 1)
+	setupSignalNotify(c)
+	select {
+	case <-c:
+	case <-done:
+	}
+	KillAll()
+}
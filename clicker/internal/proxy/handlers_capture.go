@@ -6,7 +6,7 @@ import (
 )
 
 // handlePageScreenshot handles vibium:page.screenshot — captures a page screenshot.
-// Options: fullPage (boolean), clip ({x, y, width, height}).
+// Options: fullPage (boolean), clip ({x, y, width, height}), stream (boolean).
 func (r *Router) handlePageScreenshot(session *BrowserSession, cmd bidiCommand) {
 	context, err := r.resolveContext(session, cmd.Params)
 	if err != nil {
@@ -55,11 +55,11 @@ func (r *Router) handlePageScreenshot(session *BrowserSession, cmd bidiCommand)
 		return
 	}
 
-	r.sendSuccess(session, cmd.ID, map[string]interface{}{"data": ssResult.Result.Data})
+	r.sendBase64Data(session, cmd, "data", ssResult.Result.Data)
 }
 
 // handlePagePDF handles vibium:page.pdf — prints the page to PDF.
-// Returns base64-encoded PDF data.
+// Returns base64-encoded PDF data, or a stream handle when stream is true.
 func (r *Router) handlePagePDF(session *BrowserSession, cmd bidiCommand) {
 	context, err := r.resolveContext(session, cmd.Params)
 	if err != nil {
@@ -92,5 +92,5 @@ func (r *Router) handlePagePDF(session *BrowserSession, cmd bidiCommand) {
 		return
 	}
 
-	r.sendSuccess(session, cmd.ID, map[string]interface{}{"data": printResult.Result.Data})
+	r.sendBase64Data(session, cmd, "data", printResult.Result.Data)
 }
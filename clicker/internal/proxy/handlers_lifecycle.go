@@ -150,7 +150,7 @@ func (r *Router) handleBrowserClose(session *BrowserSession, cmd bidiCommand) {
 	r.sendSuccess(session, cmd.ID, map[string]interface{}{})
 
 	// Close the session (browser + connections)
-	r.sessions.Delete(session.Client.ID)
+	r.sessions.Delete(session.client().ID)
 	r.closeSession(session)
 }
 
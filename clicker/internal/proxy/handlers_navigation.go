@@ -169,6 +169,7 @@ func (r *Router) handlePageTitle(session *BrowserSession, cmd bidiCommand) {
 }
 
 // handlePageContent handles vibium:page.content — returns the page's full HTML.
+// With stream: true, returns a stream handle over the UTF-8 bytes instead.
 func (r *Router) handlePageContent(session *BrowserSession, cmd bidiCommand) {
 	context, err := r.resolveContext(session, cmd.Params)
 	if err != nil {
@@ -182,6 +183,10 @@ func (r *Router) handlePageContent(session *BrowserSession, cmd bidiCommand) {
 		return
 	}
 
+	if wantsStream(cmd) {
+		r.sendData(session, cmd, "content", []byte(content))
+		return
+	}
 	r.sendSuccess(session, cmd.ID, map[string]interface{}{"content": content})
 }
 
@@ -0,0 +1,89 @@
+package proxy
+
+import (
+	"crypto/rand"
+	"encoding/hex"
+	"fmt"
+	"time"
+)
+
+// handleSessionResumable handles vibium:session.resumable — keeps the browser
+// session alive for a while after the client disconnects.
+// Options: timeout (ms to wait for a reconnect; 0 disables).
+// Returns {"token": token}. A client that reconnects to ws://host:port/?resume=token
+// within the timeout is attached to the same browser, with its pages,
+// intercepts, data collectors and subscriptions intact. Events sent while no
+// client is attached are dropped.
+func (r *Router) handleSessionResumable(session *BrowserSession, cmd bidiCommand) {
+	timeout, _ := cmd.Params["timeout"].(float64)
+
+	session.mu.Lock()
+	if session.resumeToken == "" {
+		buf := make([]byte, 16)
+		if _, err := rand.Read(buf); err != nil {
+			session.mu.Unlock()
+			r.sendError(session, cmd.ID, fmt.Errorf("failed to create resume token: %w", err))
+			return
+		}
+		session.resumeToken = hex.EncodeToString(buf)
+	}
+	session.resumeWindow = time.Duration(timeout) * time.Millisecond
+	token := session.resumeToken
+	session.mu.Unlock()
+
+	r.sendSuccess(session, cmd.ID, map[string]interface{}{"token": token})
+}
+
+// resumeSession attaches a reconnecting client to its detached session.
+// Returns false if the token is unknown or has expired.
+func (r *Router) resumeSession(client *ClientConn) bool {
+	if client.ResumeToken == "" {
+		return false
+	}
+	val, ok := r.detached.LoadAndDelete(client.ResumeToken)
+	if !ok {
+		return false
+	}
+	session := val.(*BrowserSession)
+
+	session.mu.Lock()
+	if session.detachTimer != nil {
+		session.detachTimer.Stop()
+		session.detachTimer = nil
+	}
+	session.Client = client
+	session.mu.Unlock()
+
+	r.sessions.Store(client.ID, session)
+	fmt.Printf("[router] Client %d resumed browser session\n", client.ID)
+	return true
+}
+
+// detachSession keeps a resumable session's browser running after its client
+// disconnects. Returns false if the session is not resumable.
+func (r *Router) detachSession(session *BrowserSession) bool {
+	session.mu.Lock()
+	defer session.mu.Unlock()
+
+	if session.closed || session.resumeToken == "" || session.resumeWindow <= 0 {
+		return false
+	}
+
+	token := session.resumeToken
+	r.detached.Store(token, session)
+	session.detachTimer = time.AfterFunc(session.resumeWindow, func() {
+		if r.detached.CompareAndDelete(token, session) {
+			fmt.Printf("[router] Resume window expired for client %d\n", session.client().ID)
+			r.closeSession(session)
+		}
+	})
+	fmt.Printf("[router] Client %d detached, keeping browser for %v\n", session.Client.ID, session.resumeWindow)
+	return true
+}
+
+// client returns the client currently attached to the session.
+func (session *BrowserSession) client() *ClientConn {
+	session.mu.Lock()
+	defer session.mu.Unlock()
+	return session.Client
+}
@@ -0,0 +1,109 @@
+package proxy
+
+import (
+	"encoding/base64"
+	"fmt"
+	"strconv"
+)
+
+// defaultStreamChunkSize is the number of raw bytes returned per vibium:stream.read
+// when the client does not ask for a size.
+const defaultStreamChunkSize = 1024 * 1024
+
+// resultStream holds a large command result on the server so the client can
+// read it in chunks instead of receiving it as one base64 WebSocket frame.
+type resultStream struct {
+	data   []byte
+	offset int
+}
+
+// wantsStream reports whether a command asked for its result as a stream handle.
+func wantsStream(cmd bidiCommand) bool {
+	stream, _ := cmd.Params["stream"].(bool)
+	return stream
+}
+
+// openStream stores data on the session and returns the stream handle.
+func (r *Router) openStream(session *BrowserSession, data []byte) string {
+	session.streamsMu.Lock()
+	defer session.streamsMu.Unlock()
+
+	if session.streams == nil {
+		session.streams = make(map[string]*resultStream)
+	}
+	session.nextStreamID++
+	id := "stream-" + strconv.Itoa(session.nextStreamID)
+	session.streams[id] = &resultStream{data: data}
+	return id
+}
+
+// sendData responds with binary data, either base64-encoded under key or, when
+// the command set "stream": true, as {"stream": id, "size": n}.
+func (r *Router) sendData(session *BrowserSession, cmd bidiCommand, key string, data []byte) {
+	if wantsStream(cmd) {
+		id := r.openStream(session, data)
+		r.sendSuccess(session, cmd.ID, map[string]interface{}{"stream": id, "size": len(data)})
+		return
+	}
+	r.sendSuccess(session, cmd.ID, map[string]interface{}{key: base64.StdEncoding.EncodeToString(data)})
+}
+
+// sendBase64Data is sendData for results that arrive from the browser already base64-encoded.
+func (r *Router) sendBase64Data(session *BrowserSession, cmd bidiCommand, key string, encoded string) {
+	if !wantsStream(cmd) {
+		r.sendSuccess(session, cmd.ID, map[string]interface{}{key: encoded})
+		return
+	}
+	data, err := base64.StdEncoding.DecodeString(encoded)
+	if err != nil {
+		r.sendError(session, cmd.ID, fmt.Errorf("failed to decode %s: %w", key, err))
+		return
+	}
+	r.sendData(session, cmd, key, data)
+}
+
+// handleStreamRead handles vibium:stream.read — returns the next chunk of a stream.
+// Options: stream (handle), size (max raw bytes, default 1 MiB).
+// The stream is released once the last chunk has been read.
+func (r *Router) handleStreamRead(session *BrowserSession, cmd bidiCommand) {
+	id, _ := cmd.Params["stream"].(string)
+	size := defaultStreamChunkSize
+	if s, ok := cmd.Params["size"].(float64); ok && s > 0 {
+		size = int(s)
+	}
+
+	session.streamsMu.Lock()
+	stream, ok := session.streams[id]
+	if !ok {
+		session.streamsMu.Unlock()
+		r.sendError(session, cmd.ID, fmt.Errorf("no such stream: %s", id))
+		return
+	}
+	end := stream.offset + size
+	if end > len(stream.data) {
+		end = len(stream.data)
+	}
+	chunk := stream.data[stream.offset:end]
+	stream.offset = end
+	eof := end == len(stream.data)
+	if eof {
+		delete(session.streams, id)
+	}
+	session.streamsMu.Unlock()
+
+	r.sendSuccess(session, cmd.ID, map[string]interface{}{
+		"data": base64.StdEncoding.EncodeToString(chunk),
+		"eof":  eof,
+	})
+}
+
+// handleStreamClose handles vibium:stream.close — releases a stream before it is fully read.
+func (r *Router) handleStreamClose(session *BrowserSession, cmd bidiCommand) {
+	id, _ := cmd.Params["stream"].(string)
+
+	session.streamsMu.Lock()
+	delete(session.streams, id)
+	session.streamsMu.Unlock()
+
+	r.sendSuccess(session, cmd.ID, map[string]interface{}{})
+}
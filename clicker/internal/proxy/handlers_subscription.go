@@ -0,0 +1,121 @@
+package proxy
+
+import (
+	"encoding/json"
+	"fmt"
+	"strconv"
+)
+
+// eventSubscription is a client's interest in a set of events, optionally
+// limited to some browsing contexts (empty contexts = all contexts).
+type eventSubscription struct {
+	events   map[string]bool
+	contexts map[string]bool
+}
+
+// handleSessionSubscribe handles vibium:session.subscribe — asks for events to be forwarded.
+// Options: events (list of method names), contexts (optional list of context IDs).
+//
+// The first call switches the session to filtered mode: from then on, browser
+// events are only forwarded to the client if some subscription matches them.
+// Clients that never subscribe keep receiving every event.
+//
+// Runs synchronously in OnClientMessage so the subscription is in place before
+// any command the client sends after it.
+func (r *Router) handleSessionSubscribe(session *BrowserSession, cmd bidiCommand) {
+	sub := &eventSubscription{
+		events:   make(map[string]bool),
+		contexts: make(map[string]bool),
+	}
+	if events, ok := cmd.Params["events"].([]interface{}); ok {
+		for _, e := range events {
+			if name, ok := e.(string); ok {
+				sub.events[name] = true
+			}
+		}
+	}
+	if len(sub.events) == 0 {
+		r.sendError(session, cmd.ID, fmt.Errorf("events is required"))
+		return
+	}
+	if contexts, ok := cmd.Params["contexts"].([]interface{}); ok {
+		for _, c := range contexts {
+			if id, ok := c.(string); ok {
+				sub.contexts[id] = true
+			}
+		}
+	}
+
+	session.subsMu.Lock()
+	if session.subscriptions == nil {
+		session.subscriptions = make(map[string]*eventSubscription)
+	}
+	session.nextSubID++
+	id := "sub-" + strconv.Itoa(session.nextSubID)
+	session.subscriptions[id] = sub
+	session.subsMu.Unlock()
+
+	r.sendSuccess(session, cmd.ID, map[string]interface{}{"subscription": id})
+}
+
+// handleSessionUnsubscribe handles vibium:session.unsubscribe — removes a subscription.
+// The session stays in filtered mode even when no subscriptions remain.
+func (r *Router) handleSessionUnsubscribe(session *BrowserSession, cmd bidiCommand) {
+	id, _ := cmd.Params["subscription"].(string)
+
+	session.subsMu.Lock()
+	delete(session.subscriptions, id)
+	session.subsMu.Unlock()
+
+	r.sendSuccess(session, cmd.ID, map[string]interface{}{})
+}
+
+// clientWantsEvent reports whether a browser event should be forwarded to the client.
+func (r *Router) clientWantsEvent(session *BrowserSession, method string, msg string) bool {
+	session.subsMu.Lock()
+	defer session.subsMu.Unlock()
+
+	if session.subscriptions == nil {
+		return true // not in filtered mode
+	}
+
+	var context string
+	contextParsed := false
+	for _, sub := range session.subscriptions {
+		if !sub.events[method] {
+			continue
+		}
+		if len(sub.contexts) == 0 {
+			return true
+		}
+		if !contextParsed {
+			context = eventContext(msg)
+			contextParsed = true
+		}
+		// Events without a context cannot be scoped, so any subscriber gets them
+		if context == "" || sub.contexts[context] {
+			return true
+		}
+	}
+	return false
+}
+
+// eventContext returns the browsing context of an event (params.context, or
+// params.source.context for log.entryAdded), or "" if it has none.
+func eventContext(msg string) string {
+	var event struct {
+		Params struct {
+			Context string `json:"context"`
+			Source  struct {
+				Context string `json:"context"`
+			} `json:"source"`
+		} `json:"params"`
+	}
+	if err := json.Unmarshal([]byte(msg), &event); err != nil {
+		return ""
+	}
+	if event.Params.Context != "" {
+		return event.Params.Context
+	}
+	return event.Params.Source.Context
+}
@@ -1,7 +1,6 @@
 package proxy
 
 import (
-	"encoding/base64"
 	"encoding/json"
 	"fmt"
 )
@@ -46,7 +45,7 @@ func (r *Router) handleTracingStart(session *BrowserSession, cmd bidiCommand) {
 }
 
 // handleTracingStop handles vibium:tracing.stop — stops recording and returns trace data.
-// Options: path (file path to save zip).
+// Options: path (file path to save zip), stream (return a stream handle instead of base64).
 func (r *Router) handleTracingStop(session *BrowserSession, cmd bidiCommand) {
 	session.mu.Lock()
 	recorder := session.traceRecorder
@@ -77,7 +76,7 @@ func (r *Router) handleTracingStop(session *BrowserSession, cmd bidiCommand) {
 	session.traceRecorder = nil
 	session.mu.Unlock()
 
-	// Write to file or return base64
+	// Write to file, or return base64 / a stream handle
 	if path, ok := cmd.Params["path"].(string); ok && path != "" {
 		if err := WriteTraceToFile(zipData, path); err != nil {
 			r.sendError(session, cmd.ID, fmt.Errorf("failed to write trace: %w", err))
@@ -85,8 +84,7 @@ func (r *Router) handleTracingStop(session *BrowserSession, cmd bidiCommand) {
 		}
 		r.sendSuccess(session, cmd.ID, map[string]interface{}{"path": path})
 	} else {
-		encoded := base64.StdEncoding.EncodeToString(zipData)
-		r.sendSuccess(session, cmd.ID, map[string]interface{}{"data": encoded})
+		r.sendData(session, cmd, "data", zipData)
 	}
 }
 
@@ -110,7 +108,7 @@ func (r *Router) handleTracingStartChunk(session *BrowserSession, cmd bidiComman
 }
 
 // handleTracingStopChunk handles vibium:tracing.stopChunk — stops the current chunk.
-// Options: path (file path to save zip).
+// Options: path (file path to save zip), stream (return a stream handle instead of base64).
 func (r *Router) handleTracingStopChunk(session *BrowserSession, cmd bidiCommand) {
 	session.mu.Lock()
 	recorder := session.traceRecorder
@@ -139,8 +137,7 @@ func (r *Router) handleTracingStopChunk(session *BrowserSession, cmd bidiCommand
 		}
 		r.sendSuccess(session, cmd.ID, map[string]interface{}{"path": path})
 	} else {
-		encoded := base64.StdEncoding.EncodeToString(zipData)
-		r.sendSuccess(session, cmd.ID, map[string]interface{}{"data": encoded})
+		r.sendData(session, cmd, "data", zipData)
 	}
 }
 
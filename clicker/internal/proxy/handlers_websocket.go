@@ -240,5 +240,5 @@ func (r *Router) translateWsEvent(session *BrowserSession, wsEvent map[string]in
 		"params": params,
 	}
 	data, _ := json.Marshal(eventMsg)
-	session.Client.Send(string(data))
+	session.client().Send(string(data))
 }
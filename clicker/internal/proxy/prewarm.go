@@ -0,0 +1,93 @@
+package proxy
+
+import (
+	"fmt"
+
+	"github.com/vibium/clicker/internal/bidi"
+	"github.com/vibium/clicker/internal/browser"
+)
+
+// warmBrowser is a browser launched ahead of time, waiting for a client.
+type warmBrowser struct {
+	launchResult *browser.LaunchResult
+	bidiConn     *bidi.Connection
+}
+
+// Prewarm keeps n browsers launched and connected ahead of time, so a client
+// that connects is handed a ready browser instead of waiting for Chrome to
+// start. Each browser taken by a client is replaced in the background.
+// Call before the server starts accepting clients.
+func (r *Router) Prewarm(n int) {
+	if n <= 0 {
+		return
+	}
+	r.warm = make(chan *warmBrowser, n)
+	for i := 0; i < n; i++ {
+		go r.refillWarm()
+	}
+}
+
+// takeWarmBrowser returns a pre-launched browser, or nil if none is ready.
+func (r *Router) takeWarmBrowser() *warmBrowser {
+	if r.warm == nil {
+		return nil
+	}
+	select {
+	case warm := <-r.warm:
+		go r.refillWarm()
+		return warm
+	default:
+		return nil
+	}
+}
+
+// refillWarm launches one browser into the warm pool.
+func (r *Router) refillWarm() {
+	launchResult, err := browser.Launch(browser.LaunchOptions{
+		Headless: r.headless,
+	})
+	if err != nil {
+		fmt.Printf("[router] Failed to pre-launch browser: %v\n", err)
+		return
+	}
+	bidiConn, err := bidi.Connect(launchResult.WebSocketURL)
+	if err != nil {
+		fmt.Printf("[router] Failed to connect to pre-launched browser: %v\n", err)
+		launchResult.Close()
+		return
+	}
+
+	r.warmMu.Lock()
+	defer r.warmMu.Unlock()
+	if r.shuttingDown {
+		bidiConn.Close()
+		launchResult.Close()
+		return
+	}
+	select {
+	case r.warm <- &warmBrowser{launchResult: launchResult, bidiConn: bidiConn}:
+		fmt.Printf("[router] Browser pre-launched, WebSocket: %s\n", launchResult.WebSocketURL)
+	default:
+		bidiConn.Close()
+		launchResult.Close()
+	}
+}
+
+// closeWarm closes every pre-launched browser and stops refilling the pool.
+func (r *Router) closeWarm() {
+	r.warmMu.Lock()
+	defer r.warmMu.Unlock()
+	r.shuttingDown = true
+	if r.warm == nil {
+		return
+	}
+	for {
+		select {
+		case warm := <-r.warm:
+			warm.bidiConn.Close()
+			warm.launchResult.Close()
+		default:
+			return
+		}
+	}
+}
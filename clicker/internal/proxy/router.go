@@ -41,6 +41,21 @@ type BrowserSession struct {
 
 	// Tracing support
 	traceRecorder *TraceRecorder
+
+	// Large results held for chunked reads (vibium:stream.read)
+	streams      map[string]*resultStream
+	streamsMu    sync.Mutex
+	nextStreamID int
+
+	// Client event subscriptions (nil until the first vibium:session.subscribe)
+	subscriptions map[string]*eventSubscription
+	subsMu        sync.Mutex
+	nextSubID     int
+
+	// Reconnect support (vibium:session.resumable); guarded by mu, as is Client
+	resumeToken  string
+	resumeWindow time.Duration
+	detachTimer  *time.Timer
 }
 
 // BiDi command structure for parsing incoming messages
@@ -62,7 +77,13 @@ type bidiResponse struct {
 // Router manages browser sessions for connected clients.
 type Router struct {
 	sessions sync.Map // map[uint64]*BrowserSession (client ID -> session)
+	detached sync.Map // map[string]*BrowserSession (resume token -> session awaiting reconnect)
 	headless bool
+
+	// Browsers launched ahead of time (see Prewarm); nil when disabled
+	warm         chan *warmBrowser
+	warmMu       sync.Mutex
+	shuttingDown bool
 }
 
 // NewRouter creates a new router.
@@ -75,33 +96,22 @@ func NewRouter(headless bool) *Router {
 // OnClientConnect is called when a new client connects.
 // It launches a browser and establishes a BiDi connection.
 func (r *Router) OnClientConnect(client *ClientConn) {
-	fmt.Printf("[router] Launching browser for client %d...\n", client.ID)
-
-	// Launch browser
-	launchResult, err := browser.Launch(browser.LaunchOptions{
-		Headless: r.headless,
-	})
-	if err != nil {
-		fmt.Printf("[router] Failed to launch browser for client %d: %v\n", client.ID, err)
-		client.Send(fmt.Sprintf(`{"error":{"code":-32000,"message":"Failed to launch browser: %s"}}`, err.Error()))
-		client.Close()
+	if r.resumeSession(client) {
 		return
 	}
 
-	fmt.Printf("[router] Browser launched for client %d, WebSocket: %s\n", client.ID, launchResult.WebSocketURL)
-
-	// Connect to browser BiDi WebSocket
-	bidiConn, err := bidi.Connect(launchResult.WebSocketURL)
-	if err != nil {
-		fmt.Printf("[router] Failed to connect to browser BiDi for client %d: %v\n", client.ID, err)
-		launchResult.Close()
-		client.Send(fmt.Sprintf(`{"error":{"code":-32000,"message":"Failed to connect to browser: %s"}}`, err.Error()))
-		client.Close()
-		return
+	var launchResult *browser.LaunchResult
+	var bidiConn *bidi.Connection
+	if warm := r.takeWarmBrowser(); warm != nil {
+		fmt.Printf("[router] Using pre-launched browser for client %d\n", client.ID)
+		launchResult, bidiConn = warm.launchResult, warm.bidiConn
+	} else {
+		var ok bool
+		if launchResult, bidiConn, ok = r.launchBrowser(client); !ok {
+			return
+		}
 	}
 
-	fmt.Printf("[router] BiDi connection established for client %d\n", client.ID)
-
 	// Create a BiDi client for handling custom commands
 	bidiClient := bidi.NewClient(bidiConn)
 
@@ -138,6 +148,38 @@ func (r *Router) OnClientConnect(client *ClientConn) {
 	}()
 }
 
+// launchBrowser launches a browser for a client and connects to it over BiDi.
+// On failure the client is sent an error and closed.
+func (r *Router) launchBrowser(client *ClientConn) (*browser.LaunchResult, *bidi.Connection, bool) {
+	fmt.Printf("[router] Launching browser for client %d...\n", client.ID)
+
+	// Launch browser
+	launchResult, err := browser.Launch(browser.LaunchOptions{
+		Headless: r.headless,
+	})
+	if err != nil {
+		fmt.Printf("[router] Failed to launch browser for client %d: %v\n", client.ID, err)
+		client.Send(fmt.Sprintf(`{"error":{"code":-32000,"message":"Failed to launch browser: %s"}}`, err.Error()))
+		client.Close()
+		return nil, nil, false
+	}
+
+	fmt.Printf("[router] Browser launched for client %d, WebSocket: %s\n", client.ID, launchResult.WebSocketURL)
+
+	// Connect to browser BiDi WebSocket
+	bidiConn, err := bidi.Connect(launchResult.WebSocketURL)
+	if err != nil {
+		fmt.Printf("[router] Failed to connect to browser BiDi for client %d: %v\n", client.ID, err)
+		launchResult.Close()
+		client.Send(fmt.Sprintf(`{"error":{"code":-32000,"message":"Failed to connect to browser: %s"}}`, err.Error()))
+		client.Close()
+		return nil, nil, false
+	}
+
+	fmt.Printf("[router] BiDi connection established for client %d\n", client.ID)
+	return launchResult, bidiConn, true
+}
+
 // OnClientMessage is called when a message is received from a client.
 // It handles custom vibium: extension commands or forwards to the browser.
 func (r *Router) OnClientMessage(client *ClientConn, msg string) {
@@ -168,6 +210,17 @@ func (r *Router) OnClientMessage(client *ClientConn, msg string) {
 
 	// Handle vibium: extension commands (per WebDriver BiDi spec for extensions)
 	switch cmd.Method {
+	// Event subscriptions run inline so they apply to every later command
+	case "vibium:session.subscribe":
+		r.handleSessionSubscribe(session, cmd)
+		return
+	case "vibium:session.unsubscribe":
+		r.handleSessionUnsubscribe(session, cmd)
+		return
+	case "vibium:session.resumable":
+		r.handleSessionResumable(session, cmd)
+		return
+
 	// Element interaction commands
 	case "vibium:click":
 		go r.handleVibiumClick(session, cmd)
@@ -307,6 +360,14 @@ func (r *Router) OnClientMessage(client *ClientConn, msg string) {
 		go r.handlePagePDF(session, cmd)
 		return
 
+	// Chunked reads of large results
+	case "vibium:stream.read":
+		go r.handleStreamRead(session, cmd)
+		return
+	case "vibium:stream.close":
+		go r.handleStreamClose(session, cmd)
+		return
+
 	// Page-level evaluation commands
 	case "vibium:page.eval":
 		go r.handlePageEval(session, cmd)
@@ -574,7 +635,7 @@ func (r *Router) getContext(session *BrowserSession) (string, error) {
 func (r *Router) sendSuccess(session *BrowserSession, id int, result interface{}) {
 	resp := bidiResponse{ID: id, Type: "success", Result: result}
 	data, _ := json.Marshal(resp)
-	session.Client.Send(string(data))
+	session.client().Send(string(data))
 }
 
 // sendError sends an error response to the client (follows WebDriver BiDi spec).
@@ -586,11 +647,12 @@ func (r *Router) sendError(session *BrowserSession, id int, err error) {
 		Message: err.Error(),
 	}
 	data, _ := json.Marshal(resp)
-	session.Client.Send(string(data))
+	session.client().Send(string(data))
 }
 
 // OnClientDisconnect is called when a client disconnects.
-// It closes the browser session.
+// It closes the browser session, unless the connection dropped and the
+// session is resumable.
 func (r *Router) OnClientDisconnect(client *ClientConn) {
 	sessionVal, ok := r.sessions.LoadAndDelete(client.ID)
 	if !ok {
@@ -598,6 +660,9 @@ func (r *Router) OnClientDisconnect(client *ClientConn) {
 	}
 
 	session := sessionVal.(*BrowserSession)
+	if !client.CleanClose && r.detachSession(session) {
+		return
+	}
 	r.closeSession(session)
 }
 
@@ -617,16 +682,17 @@ func (r *Router) routeBrowserToClient(session *BrowserSession) {
 			session.mu.Unlock()
 
 			if !closed {
-				fmt.Printf("[router] Browser connection closed for client %d: %v\n", session.Client.ID, err)
+				fmt.Printf("[router] Browser connection closed for client %d: %v\n", session.client().ID, err)
 				// Browser died, close the client
-				session.Client.Close()
+				session.client().Close()
 			}
 			return
 		}
 
 		// Check if this is a response to an internal command
 		var resp struct {
-			ID int `json:"id"`
+			ID     int    `json:"id"`
+			Method string `json:"method"`
 		}
 		if err := json.Unmarshal([]byte(msg), &resp); err == nil && resp.ID > 0 {
 			session.internalCmdsMu.Lock()
@@ -653,9 +719,22 @@ func (r *Router) routeBrowserToClient(session *BrowserSession) {
 			continue
 		}
 
+		// Skip events the client has not subscribed to
+		if resp.ID == 0 && resp.Method != "" && !r.clientWantsEvent(session, resp.Method, msg) {
+			continue
+		}
+
 		// Forward message to client
-		if err := session.Client.Send(msg); err != nil {
-			fmt.Printf("[router] Failed to send to client %d: %v\n", session.Client.ID, err)
+		client := session.client()
+		if err := client.Send(msg); err != nil {
+			session.mu.Lock()
+			resumable := session.resumeToken != "" && session.resumeWindow > 0
+			session.mu.Unlock()
+			if resumable {
+				// Client may reconnect; drop messages until it does
+				continue
+			}
+			fmt.Printf("[router] Failed to send to client %d: %v\n", client.ID, err)
 			return
 		}
 	}
@@ -708,7 +787,7 @@ func (r *Router) closeSession(session *BrowserSession) {
 	session.closed = true
 	session.mu.Unlock()
 
-	fmt.Printf("[router] Closing browser session for client %d\n", session.Client.ID)
+	fmt.Printf("[router] Closing browser session for client %d\n", session.client().ID)
 
 	// Signal the routing goroutine to stop
 	close(session.stopChan)
@@ -733,15 +812,21 @@ func (r *Router) closeSession(session *BrowserSession) {
 		session.LaunchResult.Close()
 	}
 
-	fmt.Printf("[router] Browser session closed for client %d\n", session.Client.ID)
+	fmt.Printf("[router] Browser session closed for client %d\n", session.client().ID)
 }
 
 // CloseAll closes all browser sessions.
 func (r *Router) CloseAll() {
+	r.closeWarm()
 	r.sessions.Range(func(key, value interface{}) bool {
 		session := value.(*BrowserSession)
 		r.closeSession(session)
 		r.sessions.Delete(key)
 		return true
 	})
+	r.detached.Range(func(key, value interface{}) bool {
+		r.closeSession(value.(*BrowserSession))
+		r.detached.Delete(key)
+		return true
+	})
 }
@@ -5,8 +5,10 @@ import (
 	"fmt"
 	"net"
 	"net/http"
+	"os"
 	"sync"
 	"sync/atomic"
+	"time"
 
 	"github.com/gorilla/websocket"
 )
@@ -18,10 +20,13 @@ const maxMessageSize = 10 * 1024 * 1024
 // Server is a WebSocket server that accepts client connections.
 type Server struct {
 	port       int
+	socketPath string
 	httpServer *http.Server
 	upgrader   websocket.Upgrader
 	clients    sync.Map // map[uint64]*ClientConn
 	nextID     atomic.Uint64
+	connected  atomic.Int64 // number of connected clients
+	lastActive atomic.Int64 // UnixNano when the last client disconnected (or the server started)
 	onConnect  func(*ClientConn)
 	onMessage  func(*ClientConn, string)
 	onClose    func(*ClientConn)
@@ -34,6 +39,13 @@ type ClientConn struct {
 	mu     sync.Mutex
 	closed bool
 	server *Server
+
+	// ResumeToken is the ?resume= query parameter, set by clients
+	// reconnecting to a resumable session.
+	ResumeToken string
+	// CleanClose is set when the client ended the connection with a close
+	// frame, as opposed to the socket dropping.
+	CleanClose bool
 }
 
 // ServerOption configures a Server.
@@ -46,6 +58,13 @@ func WithPort(port int) ServerOption {
 	}
 }
 
+// WithSocketPath makes the server listen on a Unix domain socket instead of a TCP port.
+func WithSocketPath(path string) ServerOption {
+	return func(s *Server) {
+		s.socketPath = path
+	}
+}
+
 // WithOnConnect sets a callback for when a client connects.
 func WithOnConnect(fn func(*ClientConn)) ServerOption {
 	return func(s *Server) {
@@ -87,26 +106,26 @@ func NewServer(opts ...ServerOption) *Server {
 	return s
 }
 
-// Port returns the port the server is listening on.
+// Port returns the port the server is listening on (0 on a Unix socket).
 func (s *Server) Port() int {
 	return s.port
 }
 
+// SocketPath returns the Unix socket path, or "" when listening on TCP.
+func (s *Server) SocketPath() string {
+	return s.socketPath
+}
+
 // Start starts the WebSocket server.
 func (s *Server) Start() error {
 	mux := http.NewServeMux()
 	mux.HandleFunc("/", s.handleWebSocket)
 
-	addr := fmt.Sprintf(":%d", s.port)
-
-	// Bind to the port (port 0 = OS-assigned random port)
-	listener, err := net.Listen("tcp", addr)
+	listener, err := s.listen()
 	if err != nil {
-		return fmt.Errorf("failed to listen on port %d: %w", s.port, err)
+		return err
 	}
-
-	// Store actual port (important when port=0 for OS-assigned)
-	s.port = listener.Addr().(*net.TCPAddr).Port
+	s.lastActive.Store(time.Now().UnixNano())
 
 	s.httpServer = &http.Server{
 		Handler: mux,
@@ -118,6 +137,41 @@ func (s *Server) Start() error {
 	return nil
 }
 
+// IdleFor returns how long the server has had no connected clients, or 0
+// while any client is connected.
+func (s *Server) IdleFor() time.Duration {
+	if s.connected.Load() > 0 {
+		return 0
+	}
+	return time.Since(time.Unix(0, s.lastActive.Load()))
+}
+
+// listen binds the TCP port or Unix socket the server accepts clients on.
+func (s *Server) listen() (net.Listener, error) {
+	if s.socketPath != "" {
+		// Remove a stale socket left by a server that did not shut down cleanly
+		os.Remove(s.socketPath)
+		listener, err := net.Listen("unix", s.socketPath)
+		if err != nil {
+			return nil, fmt.Errorf("failed to listen on socket %s: %w", s.socketPath, err)
+		}
+		s.port = 0
+		return listener, nil
+	}
+
+	addr := fmt.Sprintf(":%d", s.port)
+
+	// Bind to the port (port 0 = OS-assigned random port)
+	listener, err := net.Listen("tcp", addr)
+	if err != nil {
+		return nil, fmt.Errorf("failed to listen on port %d: %w", s.port, err)
+	}
+
+	// Store actual port (important when port=0 for OS-assigned)
+	s.port = listener.Addr().(*net.TCPAddr).Port
+	return listener, nil
+}
+
 // Stop stops the WebSocket server gracefully.
 func (s *Server) Stop(ctx context.Context) error {
 	if s.httpServer == nil {
@@ -146,12 +200,14 @@ func (s *Server) handleWebSocket(w http.ResponseWriter, r *http.Request) {
 	conn.SetReadLimit(maxMessageSize)
 
 	client := &ClientConn{
-		ID:     s.nextID.Add(1),
-		conn:   conn,
-		server: s,
+		ID:          s.nextID.Add(1),
+		ResumeToken: r.URL.Query().Get("resume"),
+		conn:        conn,
+		server:      s,
 	}
 
 	s.clients.Store(client.ID, client)
+	s.connected.Add(1)
 	fmt.Printf("[proxy] Client %d connected from %s\n", client.ID, r.RemoteAddr)
 
 	if s.onConnect != nil {
@@ -165,6 +221,8 @@ func (s *Server) handleWebSocket(w http.ResponseWriter, r *http.Request) {
 func (s *Server) handleClient(client *ClientConn) {
 	defer func() {
 		s.clients.Delete(client.ID)
+		s.lastActive.Store(time.Now().UnixNano())
+		s.connected.Add(-1)
 		client.Close()
 		fmt.Printf("[proxy] Client %d disconnected\n", client.ID)
 		if s.onClose != nil {
@@ -178,6 +236,7 @@ func (s *Server) handleClient(client *ClientConn) {
 			if websocket.IsUnexpectedCloseError(err, websocket.CloseGoingAway, websocket.CloseNormalClosure) {
 				fmt.Printf("[proxy] Client %d read error: %v\n", client.ID, err)
 			}
+			client.CleanClose = websocket.IsCloseError(err, websocket.CloseGoingAway, websocket.CloseNormalClosure)
 			return
 		}
 
@@ -15,11 +15,46 @@ Usage (async):
     await bro.close()
 """
 
-from .sync_api.browser import browser, Browser
-from .sync_api.page import Page
-from .sync_api.element import Element
-from .sync_api.element_list import ElementList
-from .sync_api.context import BrowserContext
+# The public names are imported on first access (PEP 562), so importing
+# vibium stays cheap. The module-level flag avoids importing typing just
+# for TYPE_CHECKING; type checkers treat it the same way.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .sync_api.browser import browser, Browser
+    from .sync_api.page import Page
+    from .sync_api.element import Element
+    from .sync_api.element_list import ElementList
+    from .sync_api.context import BrowserContext
+    from .sync_api.pool import BrowserPool
+    from .sync_api._parallel import parallel
+    from ._sync_base import set_loop_threads
 
 __version__ = "0.1.8"
-__all__ = ["browser", "Browser", "Page", "Element", "ElementList", "BrowserContext"]
+__all__ = ["browser", "Browser", "Page", "Element", "ElementList", "BrowserContext", "BrowserPool", "parallel", "set_loop_threads"]
+
+# name -> defining module
+_LAZY = {
+    "browser": ".sync_api.browser",
+    "Browser": ".sync_api.browser",
+    "Page": ".sync_api.page",
+    "Element": ".sync_api.element",
+    "ElementList": ".sync_api.element_list",
+    "BrowserContext": ".sync_api.context",
+    "BrowserPool": ".sync_api.pool",
+    "parallel": ".sync_api._parallel",
+    "set_loop_threads": "._sync_base",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,102 @@
+"""JSON codecs for the BiDi transport.
+
+The receive loop decodes every frame the binary sends, including network
+events and base64 screenshots, so the codec is on the hot path. orjson or
+msgspec are used when installed; the stdlib json module is the fallback.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+
+class Codec:
+    """Encodes outgoing commands to text and decodes incoming frames.
+
+    decode() accepts the raw frame as str or bytes, so fast codecs can parse
+    the UTF-8 payload without an intermediate str copy.
+    """
+
+    name = "json"
+
+    def encode(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def encode(self, obj: Any) -> str:
+        return self._dumps(obj).decode("utf-8")
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(Codec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode("utf-8")
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        return self._decoder.decode(data)
+
+
+# Preference order for automatic selection.
+_CODECS: Dict[str, Callable[[], Codec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": Codec,
+}
+
+
+def get_codec(codec: Union[str, Codec, None] = None) -> Codec:
+    """Resolve a codec by name, instance, or automatically.
+
+    Args:
+        codec: "orjson", "msgspec", "json", a Codec instance, or None to
+            pick the fastest installed codec.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the named codec's package is not installed.
+    """
+    if isinstance(codec, Codec):
+        return codec
+    if codec is not None:
+        if codec not in _CODECS:
+            raise ValueError(f"Unknown codec {codec!r}. Choose from: {', '.join(_CODECS)}")
+        return _CODECS[codec]()
+
+    for factory in _CODECS.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return Codec()
+
+
+def available_codecs() -> Dict[str, Optional[Codec]]:
+    """Return every known codec name mapped to an instance, or None if not installed."""
+    result: Dict[str, Optional[Codec]] = {}
+    for name, factory in _CODECS.items():
+        try:
+            result[name] = factory()
+        except ImportError:
+            result[name] = None
+    return result
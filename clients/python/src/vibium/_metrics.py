@@ -0,0 +1,157 @@
+"""Client-side metrics for the BiDi transport.
+
+BiDiClient records command latency per method, bytes on the wire, event
+counts and event handler time here, so a slow run can be attributed to
+Python (handler time), the socket (bytes, in-flight commands) or the
+browser (command latency).
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+# Called for every observation as exporter(name, method, value). Names:
+#   command.latency_ms, command.error, event, handler.time_ms,
+#   bytes.sent, bytes.received (method is None for the byte counters).
+MetricsExporter = Callable[[str, Optional[str], float], None]
+
+# Histogram bucket upper bounds, in milliseconds.
+LATENCY_BUCKETS_MS = (
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000,
+)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket it falls in."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(LATENCY_BUCKETS_MS[i], self.max) if i < len(LATENCY_BUCKETS_MS) else self.max
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+            "buckets": {
+                **{str(bound): n for bound, n in zip(LATENCY_BUCKETS_MS, self.counts)},
+                "inf": self.counts[-1],
+            },
+        }
+
+
+class Metrics:
+    """Counters and histograms for one BiDiClient connection."""
+
+    def __init__(self) -> None:
+        self._exporters: List[MetricsExporter] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear every measurement and restart the event-rate clock."""
+        self.started = time.monotonic()
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.command_latency: Dict[str, Histogram] = {}
+        self.command_errors: Counter = Counter()
+        self.events: Counter = Counter()
+        self.handler_time: Dict[str, Histogram] = {}
+
+    def add_exporter(self, exporter: MetricsExporter) -> None:
+        """Forward every observation to exporter(name, method, value)."""
+        self._exporters.append(exporter)
+
+    def remove_exporter(self, exporter: MetricsExporter) -> None:
+        if exporter in self._exporters:
+            self._exporters.remove(exporter)
+
+    def _export(self, name: str, method: Optional[str], value: float) -> None:
+        for exporter in self._exporters:
+            try:
+                exporter(name, method, value)
+            except Exception:
+                pass
+
+    def sent(self, size: int) -> None:
+        # Commands are counted by encoded length, which equals their UTF-8
+        # size unless they contain non-ASCII text.
+        self.bytes_sent += size
+        if self._exporters:
+            self._export("bytes.sent", None, size)
+
+    def received(self, size: int) -> None:
+        self.bytes_received += size
+        if self._exporters:
+            self._export("bytes.received", None, size)
+
+    def command(self, method: str, ms: float, error: bool) -> None:
+        histogram = self.command_latency.get(method)
+        if histogram is None:
+            histogram = self.command_latency[method] = Histogram()
+        histogram.observe(ms)
+        if error:
+            self.command_errors[method] += 1
+        if self._exporters:
+            self._export("command.latency_ms", method, ms)
+            if error:
+                self._export("command.error", method, 1)
+
+    def event(self, method: str) -> None:
+        self.events[method] += 1
+        if self._exporters:
+            self._export("event", method, 1)
+
+    def handler(self, method: str, ms: float) -> None:
+        histogram = self.handler_time.get(method)
+        if histogram is None:
+            histogram = self.handler_time[method] = Histogram()
+        histogram.observe(ms)
+        if self._exporters:
+            self._export("handler.time_ms", method, ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all measurements as plain dicts (latencies in ms)."""
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return {
+            "elapsed_s": elapsed,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "commands": {
+                method: {**h.summary(), "errors": self.command_errors[method]}
+                for method, h in self.command_latency.items()
+            },
+            "events": {
+                method: {"count": n, "per_s": n / elapsed}
+                for method, n in self.events.items()
+            },
+            "handlers": {method: h.summary() for method, h in self.handler_time.items()},
+        }
@@ -0,0 +1,275 @@
+"""One vibium server per user, shared by Python processes.
+
+browser.launch_shared() looks up the running server in
+<cache dir>/server-<mode>.json (mode is "headless" or "headed") and attaches
+to it; if there is none, it starts one detached from the calling process
+and records it there. The server is started with --idle-timeout, so it
+exits on its own once no client has been connected for that long, and with
+--prewarm, so attaching does not wait for Chrome to start.
+
+On Unix the server listens on a socket in the cache dir, which only the
+user can reach (or in a private temp dir if that path is too long for a
+socket); on Windows it listens on a random TCP port. The server's output
+goes to <cache dir>/server-<mode>.log, which it keeps under LOG_MAX_BYTES.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .binary import _LISTENING, _FileLock, ensure_browser_installed_async, find_vibium_bin, get_cache_dir
+
+# Server state file contents: {"pid", "pid_started", "url", "socket", "socket_dir", "started"}
+ServerState = Dict[str, Any]
+
+# The server cuts its log back to the last half once it grows past this
+LOG_MAX_BYTES = 1024 * 1024
+
+# sun_path holds 104 bytes on macOS and 108 on Linux, including the NUL
+_MAX_SOCKET_PATH = 100
+
+
+def _mode(headless: bool) -> str:
+    return "headless" if headless else "headed"
+
+
+def _state_path(headless: bool) -> Path:
+    return get_cache_dir() / f"server-{_mode(headless)}.json"
+
+
+def read_state(headless: bool) -> Optional[ServerState]:
+    """Return the recorded shared server for a mode, or None."""
+    try:
+        state = json.loads(_state_path(headless).read_text())
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) and "url" in state else None
+
+
+def _write_state(headless: bool, state: ServerState) -> None:
+    path = _state_path(headless)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(state))
+    os.replace(tmp, path)
+
+
+def _alive(pid: int) -> bool:
+    if sys.platform == "win32":
+        # No cheap check without extra dependencies; a dead server is
+        # detected when connecting to it fails instead
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _process_started(pid: int) -> Optional[str]:
+    """When a process started, as an opaque token; None if unknown.
+
+    The server exits on its own once idle, after which its pid may be
+    reused; comparing this with the token recorded at start tells the two
+    apart. Not available on Windows.
+    """
+    if sys.platform == "win32":
+        return None
+    if sys.platform.startswith("linux"):
+        try:
+            stat = Path(f"/proc/{pid}/stat").read_text()
+        except OSError:
+            return None
+        # The command name may contain spaces; starttime is the 22nd field
+        return stat.rpartition(")")[2].split()[19]
+    try:
+        output = subprocess.run(
+            ["ps", "-o", "lstart=", "-p", str(pid)], capture_output=True, text=True, timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output or None
+
+
+def _running(state: ServerState) -> bool:
+    """Whether the recorded server process is still running."""
+    if state.get("pid_started") is None:
+        return _alive(state["pid"])
+    return _process_started(state["pid"]) == state["pid_started"]
+
+
+def _answers(state: ServerState) -> bool:
+    """Whether something accepts connections at the recorded server's address."""
+    try:
+        if state.get("socket"):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            address: Any = state["socket"]
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            address = ("localhost", int(state["url"].rstrip("/").rpartition(":")[2]))
+    except (OSError, ValueError):
+        return False
+    with sock:
+        sock.settimeout(1)
+        try:
+            sock.connect(address)
+        except OSError:
+            return False
+    return True
+
+
+def _discard(state: ServerState, stale: bool = False) -> bool:
+    """Stop a recorded server, if still running, and remove its socket dir.
+
+    The pid is only signalled if it still is the server: its start time
+    matches the recorded one or, where that is unknown, its address still
+    answers (never for a stale state, which by definition did not).
+    Returns True if the process was signalled.
+    """
+    if state.get("pid_started") is not None:
+        owned = _running(state)
+    else:
+        owned = not stale and _alive(state["pid"]) and _answers(state)
+    signalled = False
+    if owned:
+        try:
+            os.kill(state["pid"], signal.SIGTERM)
+            signalled = True
+        except OSError:
+            pass
+    if state.get("socket_dir"):
+        shutil.rmtree(state["socket_dir"], ignore_errors=True)
+    return signalled
+
+
+async def shared_server(
+    headless: bool = False,
+    executable_path: Optional[str] = None,
+    idle_timeout: Optional[int] = 600000,
+    prewarm: int = 1,
+    startup_timeout: Optional[int] = 30000,
+    stale: Optional[ServerState] = None,
+) -> ServerState:
+    """Return the shared server for a mode, starting it if needed.
+
+    Args:
+        stale: A state that turned out to be unreachable; it is replaced by
+            a new server, and its process terminated if still running.
+    """
+    state = read_state(headless)
+    if state and state != stale and _running(state):
+        return state
+
+    lock = _FileLock(f"server-{_mode(headless)}.lock", "start the shared vibium server")
+    await lock.acquire_async()
+    try:
+        # Another process may have started it while we waited
+        state = read_state(headless)
+        if state and state != stale and _running(state):
+            return state
+        if state:
+            # Unreachable or dead: don't leave it running next to the new one
+            _discard(state, stale=True)
+        state = await _start(headless, executable_path, idle_timeout, prewarm, startup_timeout)
+        _write_state(headless, state)
+        return state
+    finally:
+        lock.release()
+
+
+async def _start(
+    headless: bool,
+    executable_path: Optional[str],
+    idle_timeout: Optional[int],
+    prewarm: int,
+    startup_timeout: Optional[int],
+) -> ServerState:
+    """Start a detached vibium server and wait until it is listening."""
+    binary = executable_path or find_vibium_bin()
+    await ensure_browser_installed_async(binary)
+
+    cache_dir = get_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    args = [binary, "serve", "--idle-timeout", f"{idle_timeout or 0}ms", "--prewarm", str(prewarm)]
+    if headless:
+        args.append("--headless")
+    socket_dir = None
+    if sys.platform == "win32":
+        args.extend(["--port", "0"])
+        detach: Dict[str, Any] = {
+            "creationflags": subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS,
+        }
+    else:
+        socket_path = str(cache_dir / f"server-{_mode(headless)}.sock")
+        if len(os.fsencode(socket_path)) > _MAX_SOCKET_PATH:
+            # A deep cache dir would not fit in sun_path; like VibiumProcess,
+            # fall back to a private temp dir
+            socket_dir = tempfile.mkdtemp(prefix="vibium-")
+            socket_path = os.path.join(socket_dir, f"server-{_mode(headless)}.sock")
+        args.extend(["--socket", socket_path])
+        detach = {"start_new_session": True}
+
+    # The server outlives this process, so its output goes to a log file
+    # (truncated on each start) rather than a pipe nobody would drain. It is
+    # opened for appending, so the server can cut it back while writing
+    args.extend(["--log-max-size", str(LOG_MAX_BYTES)])
+    log_path = cache_dir / f"server-{_mode(headless)}.log"
+    try:
+        open(log_path, "wb").close()
+        with open(log_path, "a+b") as log:
+            process = subprocess.Popen(
+                args, stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT, **detach
+            )
+
+        deadline = time.monotonic() + startup_timeout / 1000 if startup_timeout is not None else None
+        while True:
+            output = log_path.read_bytes()
+            match = _LISTENING.search(output)
+            if match:
+                break
+            if process.poll() is not None:
+                raise RuntimeError(f"Vibium failed to start (status {process.returncode}); see {log_path}")
+            if deadline is not None and time.monotonic() > deadline:
+                process.kill()
+                process.wait()
+                raise TimeoutError(f"Vibium did not start listening within {startup_timeout}ms; see {log_path}")
+            await asyncio.sleep(0.05)
+    except BaseException:
+        if socket_dir:
+            shutil.rmtree(socket_dir, ignore_errors=True)
+        raise
+
+    if match.group(2):
+        url, socket_path = "ws://localhost/", match.group(2).decode()
+    else:
+        url, socket_path = f"ws://localhost:{int(match.group(1))}", None
+    # The server outlives this call; reap it once it exits, so it does not
+    # linger as a zombie while this process runs
+    threading.Thread(target=process.wait, name="vibium-server-reaper", daemon=True).start()
+    return {
+        "pid": process.pid, "pid_started": _process_started(process.pid), "url": url,
+        "socket": socket_path, "socket_dir": socket_dir, "started": time.time(),
+    }
+
+
+def stop_shared_server(headless: bool = False) -> bool:
+    """Stop the shared server for a mode, if one is recorded. Returns True if one was signalled."""
+    state = read_state(headless)
+    try:
+        _state_path(headless).unlink()
+    except OSError:
+        pass
+    return _discard(state) if state else False
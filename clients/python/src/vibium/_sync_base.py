@@ -3,44 +3,284 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import itertools
 import threading
-from typing import Any, Optional
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+
+from ._waiter import _Waiter
+
+if TYPE_CHECKING:
+    from .client import BiDiClient
+    from ._types import _Command
+
+_thread_numbers = itertools.count(1)
 
 
 class _EventLoopThread:
-    """Manages a background thread running an asyncio event loop."""
+    """Manages a background thread running an asyncio event loop.
+
+    run(), send() and call() may be used from any number of threads at once;
+    each caller only blocks until its own work is done.
+    """
 
     def __init__(self) -> None:
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
 
     def start(self) -> asyncio.AbstractEventLoop:
         """Start the background event loop thread."""
-        if self._loop is not None:
-            return self._loop
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
 
-        self._loop = asyncio.new_event_loop()
-        self._thread = threading.Thread(target=self._run_loop, daemon=True)
-        self._thread.start()
-        return self._loop
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._run_loop, args=(self._loop,),
+                name=f"vibium-loop-{next(_thread_numbers)}", daemon=True,
+            )
+            self._thread.start()
+            return self._loop
 
-    def _run_loop(self) -> None:
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
         """Run the event loop in the background thread."""
-        asyncio.set_event_loop(self._loop)
-        self._loop.run_forever()  # type: ignore[union-attr]
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
 
-    def run(self, coro: Any) -> Any:
-        """Run a coroutine in the background loop and wait for result."""
+    def _check_caller(self) -> None:
         if self._loop is None:
             raise RuntimeError("Event loop not started")
-        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
-        return future.result()
+        if threading.current_thread() is self._thread:
+            # Waiting here would block the loop that has to do the work
+            raise RuntimeError(
+                "The vibium sync API was called from its own event loop thread, "
+                "e.g. from inside an event callback; call it from another thread"
+            )
+        if _active.callbacks is not None:
+            _active.callbacks._hand_off()
+
+    def run(self, coro: Any) -> Any:
+        """Run a coroutine in the background loop and wait for result."""
+        try:
+            self._check_caller()
+        except RuntimeError:
+            coro.close()
+            raise
+        waiter = _Waiter()
+        loop = self._loop
+
+        def _done(task: asyncio.Task) -> None:
+            if task.cancelled():
+                waiter.set_exception(concurrent.futures.CancelledError())
+            elif task.exception() is not None:
+                waiter.set_exception(task.exception())
+            else:
+                waiter.set_result(task.result())
+
+        def _start() -> None:
+            loop.create_task(coro).add_done_callback(_done)
+
+        loop.call_soon_threadsafe(_start)  # type: ignore[union-attr]
+        waiter.wait()
+        return waiter.result()
+
+    def send(self, client: BiDiClient, command: _Command, timeout: Optional[int] = None) -> Any:
+        """Send one command built by an async class and wait for its result.
+
+        Cheaper than run() for wrappers that map onto a single command: no
+        coroutine or task is created; see BiDiClient.send_threadsafe().
+        """
+        self._check_caller()
+        return command.result(client.send_threadsafe(command.method, command.params, timeout))
+
+    def call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a plain function on the loop thread and wait for its result.
+
+        For wrappers that change state the loop also uses, such as the
+        callback lists of a page. Runs fn directly if already on the loop.
+        """
+        if threading.current_thread() is self._thread:
+            return fn(*args)
+        self._check_caller()
+        waiter = _Waiter()
+
+        def _call() -> None:
+            try:
+                waiter.set_result(fn(*args))
+            except BaseException as e:
+                waiter.set_exception(e)
+
+        self._loop.call_soon_threadsafe(_call)  # type: ignore[union-attr]
+        waiter.wait()
+        return waiter.result()
+
+    def spawn(self, coro: Any) -> None:
+        """Start a coroutine on the loop without waiting for it."""
+        loop = self._loop
+        if loop is None:
+            coro.close()
+            return
+        loop.call_soon_threadsafe(loop.create_task, coro)
 
     def stop(self) -> None:
         """Stop the event loop and thread."""
-        if self._loop:
-            self._loop.call_soon_threadsafe(self._loop.stop)
-        if self._thread:
-            self._thread.join(timeout=5)
-        self._loop = None
-        self._thread = None
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop:
+            loop.call_soon_threadsafe(loop.stop)
+        if thread:
+            thread.join(timeout=5)
+
+
+_callback_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_callback_pool_lock = threading.Lock()
+
+
+def _callback_workers() -> concurrent.futures.ThreadPoolExecutor:
+    global _callback_pool
+    with _callback_pool_lock:
+        if _callback_pool is None:
+            _callback_pool = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="vibium-callback")
+        return _callback_pool
+
+
+class _ActiveCallback(threading.local):
+    """Per thread: the _SerialCallbacks whose callback it is running."""
+
+    callbacks: Optional[_SerialCallbacks] = None
+    # Whether that callback already let the ones behind it start
+    handed_off = False
+
+
+_active = _ActiveCallback()
+
+
+class _SerialCallbacks:
+    """Runs sync user callbacks off the event loop thread, in order.
+
+    Callbacks submitted to one instance (one per page or browser) run one
+    at a time, in submission order, on a shared worker pool; different
+    instances run concurrently. So a slow callback never stalls the loop,
+    and callbacks may call the sync API themselves. Exceptions raised by a
+    callback are dropped, as they are for async event handlers.
+
+    Once a callback waits on a sync API call, the callbacks queued behind
+    it may start, much as async handlers interleave at each await: the
+    call may be waiting on one of them, such as a route handler loading
+    another URL routed on its own page.
+    """
+
+    def __init__(self) -> None:
+        self._queue: deque = deque()
+        self._lock = threading.Lock()
+        self._running = False
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        with self._lock:
+            self._queue.append((fn, args))
+            if self._running:
+                return
+            self._running = True
+        _callback_workers().submit(self._drain)
+
+    def _drain(self) -> None:
+        active = _active
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._running = False
+                    return
+                fn, args = self._queue.popleft()
+            active.callbacks, active.handed_off = self, False
+            try:
+                fn(*args)
+            except Exception:
+                pass
+            finally:
+                active.callbacks = None
+            if active.handed_off:
+                return  # another worker drains the rest
+
+    def _hand_off(self) -> None:
+        """Let the callbacks queued behind the running one start.
+
+        Called by that callback's thread before a sync API call blocks;
+        does nothing if the callback already did so.
+        """
+        if _active.handed_off:
+            return
+        _active.handed_off = True
+        with self._lock:
+            if not self._queue:
+                self._running = False
+                return
+        _callback_workers().submit(self._drain)
+
+
+class _LoopThreadPool:
+    """Event loop threads shared by all sync browsers in the process.
+
+    Each browser is pinned to the thread with the fewest browsers, so many
+    browsers cost a fixed number of threads. Threads start on demand and
+    stop when their last browser is closed. Any number of caller threads
+    can drive browsers concurrently: sync calls only wait for their own
+    command, while the loop keeps serving the others.
+    """
+
+    def __init__(self, size: int = 1) -> None:
+        self._size = size
+        self._lock = threading.Lock()
+        self._threads: List[_EventLoopThread] = []
+        self._users: Dict[_EventLoopThread, int] = {}
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def set_size(self, size: int) -> None:
+        """Use up to ``size`` threads for browsers created from now on."""
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        with self._lock:
+            self._size = size
+
+    def acquire(self) -> _EventLoopThread:
+        """Return a running loop thread and count one more user of it."""
+        with self._lock:
+            idle = not self._threads or min(self._users.values()) > 0
+            if len(self._threads) < self._size and idle:
+                thread = _EventLoopThread()
+                thread.start()
+                self._threads.append(thread)
+                self._users[thread] = 0
+            thread = min(self._threads[:self._size], key=self._users.__getitem__)
+            self._users[thread] += 1
+            return thread
+
+    def release(self, thread: _EventLoopThread) -> None:
+        """Count one user less; the thread stops once it has none."""
+        with self._lock:
+            self._users[thread] -= 1
+            if self._users[thread] > 0:
+                return
+            del self._users[thread]
+            self._threads.remove(thread)
+        thread.stop()
+
+
+_loop_threads = _LoopThreadPool()
+
+
+def set_loop_threads(count: int) -> None:
+    """Set how many event loop threads sync browsers share (default 1).
+
+    One thread can serve many browsers; more threads help only when event
+    handling or message decoding for many busy browsers saturates it.
+    Browsers already running keep their thread.
+    """
+    _loop_threads.set_size(count)
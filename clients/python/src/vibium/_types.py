@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Union
 
 
 @dataclass
@@ -25,6 +25,22 @@ class ElementInfo:
     box: BoundingBox
 
 
+class _Command(NamedTuple):
+    """A command as the API classes build it: wire method, params, and the
+    result field returned to the caller (None for commands with no value).
+
+    The async and sync wrappers of a single-command method share one
+    builder, so the wire format is only spelled out once.
+    """
+
+    method: str
+    params: Dict[str, Any]
+    field: Optional[str] = None
+
+    def result(self, result: Any) -> Any:
+        return None if self.field is None else result[self.field]
+
+
 # --- TypedDicts as plain dicts (for Python 3.9 compat) ---
 
 # Cookie: {name, value, domain, path, size, httpOnly, secure, sameSite, expiry?}
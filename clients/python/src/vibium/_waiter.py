@@ -0,0 +1,47 @@
+"""A result handed from an event loop to a thread blocked on it."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional
+
+
+class _Waiter:
+    """One result handed from the event loop to a blocked caller thread.
+
+    A lighter stand-in for concurrent.futures.Future: the caller sleeps on a
+    plain lock that the loop releases once the result or error is set. It
+    also stands in for the asyncio future of a command sent with
+    BiDiClient.send_threadsafe(), so it has the few methods the client
+    calls on those.
+    """
+
+    __slots__ = ("_lock", "_result", "_exception")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._lock.acquire()
+        self._result: Any = None
+        self._exception: Optional[BaseException] = None
+
+    def done(self) -> bool:
+        return not self._lock.locked()
+
+    def set_result(self, result: Any) -> None:
+        if not self.done():
+            self._result = result
+            self._lock.release()
+
+    def set_exception(self, exception: BaseException) -> None:
+        if not self.done():
+            self._exception = exception
+            self._lock.release()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until done or timeout seconds pass; True if done."""
+        return self._lock.acquire(timeout=-1 if timeout is None else max(timeout, 0))
+
+    def result(self) -> Any:
+        if self._exception is not None:
+            raise self._exception
+        return self._result
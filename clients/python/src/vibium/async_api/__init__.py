@@ -8,19 +8,25 @@ Usage:
     await bro.close()
 """
 
+# Imported eagerly: importing the browser submodule would otherwise bind the
+# module, not the launcher, to the package attribute "browser"
 from .browser import browser, Browser
-from .page import Page, Keyboard, Mouse, Touch
-from .element import Element
-from .element_list import ElementList
-from .context import BrowserContext
-from .clock import Clock
-from .tracing import Tracing
-from .dialog import Dialog
-from .route import Route
-from .network import Request, Response
-from .download import Download
-from .console import ConsoleMessage
-from .websocket_info import WebSocketInfo
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .page import Page, Keyboard, Mouse, Touch
+    from .element import Element
+    from .element_list import ElementList
+    from .context import BrowserContext
+    from .pool import BrowserPool
+    from .clock import Clock
+    from .tracing import Tracing
+    from .dialog import Dialog
+    from .route import Route
+    from .network import Request, Response
+    from .download import Download
+    from .console import ConsoleMessage
+    from .websocket_info import WebSocketInfo
 
 __all__ = [
     "browser",
@@ -32,6 +38,7 @@ __all__ = [
     "Element",
     "ElementList",
     "BrowserContext",
+    "BrowserPool",
     "Clock",
     "Tracing",
     "Dialog",
@@ -42,3 +49,38 @@ __all__ = [
     "ConsoleMessage",
     "WebSocketInfo",
 ]
+
+# name -> defining module; imported on first access, see vibium/__init__.py
+_LAZY = {
+    "Page": ".page",
+    "Keyboard": ".page",
+    "Mouse": ".page",
+    "Touch": ".page",
+    "Element": ".element",
+    "ElementList": ".element_list",
+    "BrowserContext": ".context",
+    "BrowserPool": ".pool",
+    "Clock": ".clock",
+    "Tracing": ".tracing",
+    "Dialog": ".dialog",
+    "Route": ".route",
+    "Request": ".network",
+    "Response": ".network",
+    "Download": ".download",
+    "ConsoleMessage": ".console",
+    "WebSocketInfo": ".websocket_info",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Callable, Dict, List, Optional, Set, TYPE_CHECKING
 
-from .page import Page
+from .page import Page, _registered_pages
 from .context import BrowserContext
 
 if TYPE_CHECKING:
@@ -15,56 +16,101 @@ if TYPE_CHECKING:
 class Browser:
     """Async browser automation entry point."""
 
-    def __init__(self, client: BiDiClient, process: Optional[VibiumProcess]) -> None:
+    def __init__(
+        self,
+        client: BiDiClient,
+        process: Optional[VibiumProcess],
+        shards: Optional[List[BiDiClient]] = None,
+    ) -> None:
         self._client = client
         self._process = process
         self._page_callbacks: List[Callable[[Page], None]] = []
         self._popup_callbacks: List[Callable[[Page], None]] = []
         self._seen_context_ids: Set[str] = set()
 
-        # Listen for browsingContext.contextCreated events
-        self._client.on_event(self._handle_event)
+        # Extra connections to the same server. The server gives each
+        # connection its own browser session, so sharding is done per
+        # BrowserContext: new contexts are spread round-robin over all
+        # connections, while default-context pages stay on the primary one.
+        self._clients: List[BiDiClient] = [client, *(shards or [])]
+        self._next_shard = 0
+        self._context_subscriptions: List[Any] = []
 
-    def _handle_event(self, event: Dict[str, Any]) -> None:
-        if event.get("method") != "browsingContext.contextCreated":
-            return
-        params = event.get("params", {})
-        context_id = params.get("context")
-        if not context_id or context_id in self._seen_context_ids:
-            return
-        self._seen_context_ids.add(context_id)
-        callbacks = self._popup_callbacks if params.get("originalOpener") else self._page_callbacks
-        if callbacks:
-            page = Page(self._client, params["context"])
-            for cb in callbacks:
-                cb(page)
+        # Listen for browsingContext.contextCreated events; the server only
+        # forwards them while on_page/on_popup callbacks are registered.
+        # contextDestroyed events (forwarded for the page registry) prune
+        # the seen ids. Dialogs are always needed, since pages auto-dismiss
+        # unhandled ones.
+        for c in self._clients:
+            c.on_event(
+                self._event_handler_for(c),
+                ["browsingContext.contextCreated", "browsingContext.contextDestroyed"],
+            )
+            c.subscribe_soon(["browsingContext.userPromptOpened"]).add_done_callback(
+                lambda f: f.cancelled() or f.exception()
+            )
+
+    def _event_handler_for(self, client: BiDiClient) -> Callable[[Dict[str, Any]], None]:
+        def _handle_event(event: Dict[str, Any]) -> None:
+            params = event.get("params", {})
+            context_id = params.get("context")
+            if event.get("method") == "browsingContext.contextDestroyed":
+                self._seen_context_ids.discard(context_id)
+                return
+            if not context_id or context_id in self._seen_context_ids:
+                return
+            self._seen_context_ids.add(context_id)
+            callbacks = self._popup_callbacks if params.get("originalOpener") else self._page_callbacks
+            if callbacks:
+                page = Page._for(client, params["context"])
+                for cb in callbacks:
+                    cb(page)
+        return _handle_event
+
+    @property
+    def startup_timings(self) -> Dict[str, float]:
+        """Milliseconds from launch to each startup phase: binary_found,
+        chrome_checked, server_listening and first_command."""
+        return dict(self._process.startup_timings) if self._process else {}
 
     async def page(self) -> Page:
         """Get the default page (first browsing context)."""
         result = await self._client.send("vibium:browser.page", {})
-        return Page(self._client, result["context"])
+        return Page._for(self._client, result["context"])
 
     async def new_page(self) -> Page:
         """Create a new page (tab) in the default context."""
         result = await self._client.send("vibium:browser.newPage", {})
-        return Page(self._client, result["context"])
+        return Page._for(self._client, result["context"])
 
     async def new_context(self) -> BrowserContext:
-        """Create a new browser context (isolated, incognito-like)."""
-        result = await self._client.send("vibium:browser.newContext", {})
-        return BrowserContext(self._client, result["userContext"])
+        """Create a new browser context (isolated, incognito-like).
+
+        With several connections, the context and all its pages are pinned
+        to the next connection in turn.
+        """
+        client = self._clients[self._next_shard % len(self._clients)]
+        self._next_shard += 1
+        result = await client.send("vibium:browser.newContext", {})
+        return BrowserContext(client, result["userContext"])
 
     async def pages(self) -> List[Page]:
-        """Get all open pages."""
-        result = await self._client.send("vibium:browser.pages", {})
-        return [Page(self._client, p["context"]) for p in result["pages"]]
+        """Get all open pages (across every connection)."""
+        results = await asyncio.gather(*(c.send("vibium:browser.pages", {}) for c in self._clients))
+        return [
+            Page._for(client, p["context"])
+            for client, result in zip(self._clients, results)
+            for p in result["pages"]
+        ]
 
     def on_page(self, callback: Callable[[Page], None]) -> None:
         """Register a callback for when a new page is created."""
+        self._subscribe_contexts()
         self._page_callbacks.append(callback)
 
     def on_popup(self, callback: Callable[[Page], None]) -> None:
         """Register a callback for when a popup is opened."""
+        self._subscribe_contexts()
         self._popup_callbacks.append(callback)
 
     def remove_all_listeners(self, event: Optional[str] = None) -> None:
@@ -73,13 +119,68 @@ class Browser:
             self._page_callbacks.clear()
         if not event or event == "popup":
             self._popup_callbacks.clear()
+        if not self._page_callbacks and not self._popup_callbacks:
+            for client, future in zip(self._clients, self._context_subscriptions):
+                client.unsubscribe_soon(future)
+            self._context_subscriptions = []
+
+    def _subscribe_contexts(self) -> None:
+        if self._context_subscriptions:
+            return
+        for client in self._clients:
+            future = client.subscribe_soon(["browsingContext.contextCreated"])
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._context_subscriptions.append(future)
+
+    async def _reset(self) -> None:
+        """Return to a freshly launched state, for reuse by BrowserPool.
+
+        Removes listeners (the browser's, and every page's routes,
+        intercepts, callbacks and subscriptions) and every non-default user
+        context, closes all pages but one, navigates that page to
+        about:blank and clears the default context's cookies. Page objects
+        from before the reset are detached; page() returns fresh ones.
+        Other default-context storage (e.g. localStorage, cache) is kept.
+        """
+        self.remove_all_listeners()
+
+        async def _reset_client(client: BiDiClient) -> None:
+            await asyncio.gather(*(page._clear() for page in _registered_pages(client)))
+            result = await client.send("browser.getUserContexts", {})
+            await asyncio.gather(*(
+                client.send("browser.removeUserContext", {"userContext": c["userContext"]})
+                for c in result["userContexts"]
+                if c["userContext"] != "default"
+            ))
+            pages = (await client.send("vibium:browser.pages", {}))["pages"]
+            # Closing the last tab would end the browser, so keep one
+            await asyncio.gather(*(
+                client.send("browsingContext.close", {"context": p["context"]}) for p in pages[1:]
+            ))
+            if pages:
+                await client.send("browsingContext.navigate", {
+                    "context": pages[0]["context"], "url": "about:blank", "wait": "complete",
+                })
+            await client.send("vibium:context.clearCookies", {"userContext": "default"})
+
+        await asyncio.gather(*(_reset_client(c) for c in self._clients))
 
     async def close(self) -> None:
         """Close the browser and clean up."""
-        await self._client.send("vibium:browser.close", {})
-        await self._client.close()
-        if self._process:
-            await self._process.stop()
+        async def _close(client: BiDiClient) -> None:
+            try:
+                await client.send("vibium:browser.close", {})
+            finally:
+                await client.close()
+
+        try:
+            results = await asyncio.gather(*(_close(c) for c in self._clients), return_exceptions=True)
+        finally:
+            if self._process:
+                await self._process.stop()
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
 
 class _BrowserLauncher:
@@ -90,18 +191,207 @@ class _BrowserLauncher:
         headless: bool = False,
         port: Optional[int] = None,
         executable_path: Optional[str] = None,
+        command_timeout: Optional[int] = 60000,
+        max_frame_size: Optional[int] = 64 * 1024 * 1024,
+        connections: int = 1,
+        reconnect_timeout: Optional[int] = None,
+        startup_timeout: Optional[int] = 30000,
+        log_output: bool = False,
+        unix_socket: bool = False,
     ) -> Browser:
-        """Launch a new browser instance."""
-        from ..binary import VibiumProcess
-        from ..client import BiDiClient
+        """Launch a new browser instance.
+
+        Args:
+            headless: Run browser in headless mode.
+            port: WebSocket port (default: auto-assigned).
+            executable_path: Path to vibium binary (default: auto-detect).
+            command_timeout: Default time to wait for each command's response,
+                in milliseconds (default: 60s). None waits forever.
+            max_frame_size: Largest WebSocket frame accepted, in bytes
+                (default: 64 MiB). None removes the limit. Larger results can
+                be streamed with the ``path`` option of screenshot/pdf/content.
+            connections: Number of WebSocket connections to open to the
+                server. Each extra connection runs its own browser session,
+                and new_context() spreads contexts across them so encoding,
+                decoding and dispatch for parallel work is not funneled
+                through one socket.
+            reconnect_timeout: If set, a dropped WebSocket is reconnected
+                transparently as long as it comes back within this many
+                milliseconds; the server keeps the browser running meanwhile.
+                In-flight read-only commands are resent, others fail with
+                ConnectionError.
+            startup_timeout: Time allowed for the server to start listening
+                and for the browser to answer its first command, each in
+                milliseconds (default: 30s). None waits forever.
+            log_output: Forward the server's stdout/stderr to the
+                "vibium.server" logger. Recent output is always kept and
+                included in launch and connection errors.
+            unix_socket: Connect to the server over a Unix domain socket
+                instead of TCP loopback, which avoids port allocation and has
+                lower per-command latency. Not supported on Windows.
+
+        The returned browser's startup_timings reports how long each startup
+        phase took.
+        """
+        from ..binary import VibiumConnectError, VibiumProcess
+
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
 
         process = await VibiumProcess.start(
             headless=headless,
             port=port,
             executable_path=executable_path,
+            startup_timeout=startup_timeout,
+            log_output=log_output,
+            unix_socket=unix_socket,
+        )
+        try:
+            clients = await _connect_clients(
+                f"ws://localhost:{process.port}" if process.socket_path is None else "ws://localhost/",
+                connections,
+                command_timeout=command_timeout,
+                max_frame_size=max_frame_size,
+                reconnect_timeout=reconnect_timeout,
+                startup_timeout=startup_timeout,
+                unix_socket=process.socket_path,
+                close_detail=process.describe,
+            )
+        except (TimeoutError, ConnectionError, OSError) as e:
+            await process.stop()
+            if hasattr(e, "add_note"):  # Python 3.11+: keep the error as is
+                e.add_note(process.describe())
+                raise
+            raise VibiumConnectError(f"{e}\n{process.describe()}") from e
+        except BaseException:
+            await process.stop()
+            raise
+        process.mark_phase("first_command")
+        return Browser(clients[0], process, list(clients[1:]))
+
+    async def connect(
+        self,
+        url: str,
+        command_timeout: Optional[int] = 60000,
+        max_frame_size: Optional[int] = 64 * 1024 * 1024,
+        connections: int = 1,
+        reconnect_timeout: Optional[int] = None,
+        startup_timeout: Optional[int] = 30000,
+        unix_socket: Optional[str] = None,
+    ) -> Browser:
+        """Attach to an already running ``vibium serve``.
+
+        The server is not owned by the returned browser: close() ends this
+        browser session but leaves the server running for other clients.
+        Start the server with ``--prewarm N`` to also skip waiting for the
+        browser to start on connect.
+
+        Args:
+            url: Server WebSocket URL, e.g. "ws://localhost:9515".
+            startup_timeout: Time allowed for the server's browser to answer
+                its first command, in milliseconds (default: 30s).
+            unix_socket: Socket path of a server started with ``--socket``;
+                url is then only used for the handshake ("ws://localhost/").
+
+        The other options are as for launch().
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+
+        clients = await _connect_clients(
+            url,
+            connections,
+            command_timeout=command_timeout,
+            max_frame_size=max_frame_size,
+            reconnect_timeout=reconnect_timeout,
+            startup_timeout=startup_timeout,
+            unix_socket=unix_socket,
+        )
+        return Browser(clients[0], None, list(clients[1:]))
+
+    async def launch_shared(
+        self,
+        headless: bool = False,
+        executable_path: Optional[str] = None,
+        idle_timeout: Optional[int] = 600000,
+        prewarm: int = 1,
+        command_timeout: Optional[int] = 60000,
+        max_frame_size: Optional[int] = 64 * 1024 * 1024,
+        startup_timeout: Optional[int] = 30000,
+    ) -> Browser:
+        """Attach to this user's shared vibium server, starting it if needed.
+
+        Unlike launch(), the server is not tied to this process: later
+        Python processes reuse it, and it exits by itself after
+        ``idle_timeout`` milliseconds without clients (None = never). It
+        keeps ``prewarm`` browsers launched ahead of time, so attaching
+        usually does not wait for Chrome either. close() ends only this
+        browser session. Headless and headed servers are kept separately.
+        """
+        from .._shared_server import shared_server
+
+        options = dict(
+            headless=headless,
+            executable_path=executable_path,
+            idle_timeout=idle_timeout,
+            prewarm=prewarm,
+            startup_timeout=startup_timeout,
+        )
+        state = await shared_server(**options)
+        try:
+            return await self.connect(
+                state["url"], command_timeout=command_timeout, max_frame_size=max_frame_size,
+                startup_timeout=startup_timeout, unix_socket=state["socket"],
+            )
+        except (ConnectionError, OSError):
+            # The server exited since it was recorded, e.g. on idle timeout
+            state = await shared_server(**options, stale=state)
+            return await self.connect(
+                state["url"], command_timeout=command_timeout, max_frame_size=max_frame_size,
+                startup_timeout=startup_timeout, unix_socket=state["socket"],
+            )
+
+
+async def _connect_clients(
+    url: str,
+    connections: int,
+    command_timeout: Optional[int],
+    max_frame_size: Optional[int],
+    reconnect_timeout: Optional[int],
+    startup_timeout: Optional[int],
+    unix_socket: Optional[str] = None,
+    close_detail: Optional[Callable[[], str]] = None,
+) -> List[BiDiClient]:
+    """Open connections to a server and wait until their browsers are ready.
+
+    If any connection fails, the others are closed before the error is raised.
+    """
+    from ..client import BiDiClient
+
+    results = await asyncio.gather(*(
+        BiDiClient.connect(
+            url,
+            command_timeout=command_timeout,
+            max_frame_size=max_frame_size,
+            reconnect_timeout=reconnect_timeout,
+            unix_socket=unix_socket,
         )
-        client = await BiDiClient.connect(f"ws://localhost:{process.port}")
-        return Browser(client, process)
+        for _ in range(connections)
+    ), return_exceptions=True)
+    clients = [c for c in results if not isinstance(c, BaseException)]
+    try:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        # The server launches each connection's browser on connect; a
+        # first command confirms they are ready to serve
+        for client in clients:
+            client.close_detail = close_detail
+        await asyncio.gather(*(c.send("session.status", {}, timeout=startup_timeout) for c in clients))
+    except BaseException:
+        await asyncio.gather(*(c.close() for c in clients), return_exceptions=True)
+        raise
+    return clients
 
 
 browser = _BrowserLauncher()
@@ -5,12 +5,28 @@ from __future__ import annotations
 import base64
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
-from .._types import BoundingBox, ElementInfo
+from .._types import BoundingBox, ElementInfo, _Command
 
 if TYPE_CHECKING:
     from ..client import BiDiClient
     from .element_list import ElementList
 
+# State getter -> (command, result field); see Element._state_command
+_STATE_COMMANDS = {
+    "text": ("vibium:el.text", "text"),
+    "inner_text": ("vibium:el.innerText", "text"),
+    "html": ("vibium:el.html", "html"),
+    "value": ("vibium:el.value", "value"),
+    "attr": ("vibium:el.attr", "value"),
+    "is_visible": ("vibium:el.isVisible", "visible"),
+    "is_hidden": ("vibium:el.isHidden", "hidden"),
+    "is_enabled": ("vibium:el.isEnabled", "enabled"),
+    "is_checked": ("vibium:el.isChecked", "checked"),
+    "is_editable": ("vibium:el.isEditable", "editable"),
+    "role": ("vibium:el.role", "role"),
+    "label": ("vibium:el.label", "label"),
+}
+
 
 class Element:
     """Represents a DOM element that can be interacted with."""
@@ -118,25 +134,25 @@ class Element:
 
     # --- State ---
 
+    def _state_command(self, name: str, extra: Optional[Dict[str, Any]] = None) -> _Command:
+        """Build a state getter's command; the sync Element sends these directly."""
+        method, field = _STATE_COMMANDS[name]
+        return _Command(method, self._command_params(extra), field)
+
     async def text(self) -> str:
-        result = await self._client.send("vibium:el.text", self._command_params())
-        return result["text"]
+        return await self._client.send_command(self._state_command("text"))
 
     async def inner_text(self) -> str:
-        result = await self._client.send("vibium:el.innerText", self._command_params())
-        return result["text"]
+        return await self._client.send_command(self._state_command("inner_text"))
 
     async def html(self) -> str:
-        result = await self._client.send("vibium:el.html", self._command_params())
-        return result["html"]
+        return await self._client.send_command(self._state_command("html"))
 
     async def value(self) -> str:
-        result = await self._client.send("vibium:el.value", self._command_params())
-        return result["value"]
+        return await self._client.send_command(self._state_command("value"))
 
     async def attr(self, name: str) -> Optional[str]:
-        result = await self._client.send("vibium:el.attr", self._command_params({"name": name}))
-        return result["value"]
+        return await self._client.send_command(self._state_command("attr", {"name": name}))
 
     async def get_attribute(self, name: str) -> Optional[str]:
         """Alias for attr()."""
@@ -151,32 +167,25 @@ class Element:
         return await self.bounds()
 
     async def is_visible(self) -> bool:
-        result = await self._client.send("vibium:el.isVisible", self._command_params())
-        return result["visible"]
+        return await self._client.send_command(self._state_command("is_visible"))
 
     async def is_hidden(self) -> bool:
-        result = await self._client.send("vibium:el.isHidden", self._command_params())
-        return result["hidden"]
+        return await self._client.send_command(self._state_command("is_hidden"))
 
     async def is_enabled(self) -> bool:
-        result = await self._client.send("vibium:el.isEnabled", self._command_params())
-        return result["enabled"]
+        return await self._client.send_command(self._state_command("is_enabled"))
 
     async def is_checked(self) -> bool:
-        result = await self._client.send("vibium:el.isChecked", self._command_params())
-        return result["checked"]
+        return await self._client.send_command(self._state_command("is_checked"))
 
     async def is_editable(self) -> bool:
-        result = await self._client.send("vibium:el.isEditable", self._command_params())
-        return result["editable"]
+        return await self._client.send_command(self._state_command("is_editable"))
 
     async def role(self) -> str:
-        result = await self._client.send("vibium:el.role", self._command_params())
-        return result["role"]
+        return await self._client.send_command(self._state_command("role"))
 
     async def label(self) -> str:
-        result = await self._client.send("vibium:el.label", self._command_params())
-        return result["label"]
+        return await self._client.send_command(self._state_command("label"))
 
     async def eval(self, fn: str) -> Any:
         result = await self._client.send("vibium:el.eval", self._command_params({"fn": fn}))
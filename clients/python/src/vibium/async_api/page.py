@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import base64
 import fnmatch
+import os
 import re
-from typing import Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
+import weakref
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
-from .._types import A11yNode, BoundingBox, ElementInfo
+from .._types import A11yNode, BoundingBox, ElementInfo, _Command
 from .element import Element
 from .element_list import ElementList
 from .clock import Clock
@@ -22,6 +24,67 @@ if TYPE_CHECKING:
     from ..client import BiDiClient
 
 
+# Events a Page dispatches on; see Page._handle_event.
+_PAGE_EVENTS = (
+    "network.beforeRequestSent",
+    "network.responseCompleted",
+    "browsingContext.userPromptOpened",
+    "browsingContext.downloadWillBegin",
+    "browsingContext.downloadEnd",
+    "log.entryAdded",
+    "vibium:ws.created",
+    "vibium:ws.message",
+    "vibium:ws.closed",
+)
+
+# Events the server only forwards while the page has a listener for them,
+# grouped by the listeners that need them. Dialogs are subscribed to by the
+# Browser (they are auto-dismissed without a listener) and vibium:ws.* events
+# are always forwarded.
+_SUBSCRIPTION_EVENTS = {
+    "network": ("network.beforeRequestSent", "network.responseCompleted"),
+    "log": ("log.entryAdded",),
+    "download": ("browsingContext.downloadWillBegin", "browsingContext.downloadEnd"),
+}
+
+
+class _PageRegistry:
+    """The Pages of one connection, at most one per browsing context.
+
+    A Page registers an event handler on its client, so building a new one
+    for every lookup would leak handlers. The registry hands out the
+    existing Page instead, and detaches it once its context is destroyed;
+    after that it lives only as long as the caller keeps it.
+    """
+
+    def __init__(self, client: BiDiClient) -> None:
+        self.pages: weakref.WeakValueDictionary[str, Page] = weakref.WeakValueDictionary()
+        client.on_event(self._handle_destroyed, ["browsingContext.contextDestroyed"])
+        client.subscribe_soon(["browsingContext.contextDestroyed"]).add_done_callback(
+            lambda f: f.cancelled() or f.exception()
+        )
+
+    def _handle_destroyed(self, event: Dict[str, Any]) -> None:
+        # Child contexts (frames) are destroyed with their parent
+        infos = [event.get("params") or {}]
+        while infos:
+            info = infos.pop()
+            page = self.pages.get(info.get("context"))
+            if page is not None:
+                page._detach()
+            infos.extend(info.get("children") or ())
+
+
+# client -> its registry (dropped along with the client)
+_registries: weakref.WeakKeyDictionary[BiDiClient, _PageRegistry] = weakref.WeakKeyDictionary()
+
+
+def _registered_pages(client: BiDiClient) -> List[Page]:
+    """The Pages currently handed out for a client's browsing contexts."""
+    registry = _registries.get(client)
+    return list(registry.pages.values()) if registry is not None else []
+
+
 def _match_pattern(pattern: str, url: str) -> bool:
     """Match a URL against a glob-like pattern."""
     if pattern == "**":
@@ -38,17 +101,25 @@ class Keyboard:
         self._client = client
         self._context_id = context_id
 
+    # Commands are built separately so the sync Keyboard can send them directly
+
+    def _key_command(self, action: str, key: str) -> _Command:
+        return _Command(f"vibium:keyboard.{action}", {"context": self._context_id, "key": key})
+
+    def _type_command(self, text: str) -> _Command:
+        return _Command("vibium:keyboard.type", {"context": self._context_id, "text": text})
+
     async def press(self, key: str) -> None:
-        await self._client.send("vibium:keyboard.press", {"context": self._context_id, "key": key})
+        await self._client.send_command(self._key_command("press", key))
 
     async def down(self, key: str) -> None:
-        await self._client.send("vibium:keyboard.down", {"context": self._context_id, "key": key})
+        await self._client.send_command(self._key_command("down", key))
 
     async def up(self, key: str) -> None:
-        await self._client.send("vibium:keyboard.up", {"context": self._context_id, "key": key})
+        await self._client.send_command(self._key_command("up", key))
 
     async def type(self, text: str) -> None:
-        await self._client.send("vibium:keyboard.type", {"context": self._context_id, "text": text})
+        await self._client.send_command(self._type_command(text))
 
 
 class Mouse:
@@ -58,23 +129,34 @@ class Mouse:
         self._client = client
         self._context_id = context_id
 
+    # Commands are built separately so the sync Mouse can send them directly
+
+    def _point_command(self, action: str, x: float, y: float) -> _Command:
+        return _Command(f"vibium:mouse.{action}", {"context": self._context_id, "x": x, "y": y})
+
+    def _button_command(self, action: str) -> _Command:
+        return _Command(f"vibium:mouse.{action}", {"context": self._context_id})
+
+    def _wheel_command(self, delta_x: float, delta_y: float) -> _Command:
+        return _Command("vibium:mouse.wheel", {
+            "context": self._context_id, "x": 0, "y": 0,
+            "deltaX": delta_x, "deltaY": delta_y,
+        })
+
     async def click(self, x: float, y: float) -> None:
-        await self._client.send("vibium:mouse.click", {"context": self._context_id, "x": x, "y": y})
+        await self._client.send_command(self._point_command("click", x, y))
 
     async def move(self, x: float, y: float) -> None:
-        await self._client.send("vibium:mouse.move", {"context": self._context_id, "x": x, "y": y})
+        await self._client.send_command(self._point_command("move", x, y))
 
     async def down(self) -> None:
-        await self._client.send("vibium:mouse.down", {"context": self._context_id})
+        await self._client.send_command(self._button_command("down"))
 
     async def up(self) -> None:
-        await self._client.send("vibium:mouse.up", {"context": self._context_id})
+        await self._client.send_command(self._button_command("up"))
 
     async def wheel(self, delta_x: float, delta_y: float) -> None:
-        await self._client.send("vibium:mouse.wheel", {
-            "context": self._context_id, "x": 0, "y": 0,
-            "deltaX": delta_x, "deltaY": delta_y,
-        })
+        await self._client.send_command(self._wheel_command(delta_x, delta_y))
 
 
 class Touch:
@@ -84,8 +166,11 @@ class Touch:
         self._client = client
         self._context_id = context_id
 
+    def _tap_command(self, x: float, y: float) -> _Command:
+        return _Command("vibium:touch.tap", {"context": self._context_id, "x": x, "y": y})
+
     async def tap(self, x: float, y: float) -> None:
-        await self._client.send("vibium:touch.tap", {"context": self._context_id, "x": x, "y": y})
+        await self._client.send_command(self._tap_command(x, y))
 
 
 class Page:
@@ -113,10 +198,43 @@ class Page:
         self._ws_connections: Dict[int, WebSocketInfo] = {}
         self._intercept_id: Optional[str] = None
         self._data_collector_id: Optional[str] = None
+        self._subscriptions: Dict[str, Any] = {}
 
-        # Register event handler
+        # Register event handler (the client only delivers this context's events)
         self._event_handler = self._handle_event
-        self._client.on_event(self._event_handler)
+        self._client.on_event(self._event_handler, _PAGE_EVENTS, context_id)
+
+    @classmethod
+    def _for(cls, client: BiDiClient, context_id: str) -> Page:
+        """Return the Page for a browsing context, creating it on first use."""
+        registry = _registries.get(client)
+        if registry is None:
+            registry = _registries[client] = _PageRegistry(client)
+        page = registry.pages.get(context_id)
+        if page is None:
+            page = registry.pages[context_id] = cls(client, context_id)
+        return page
+
+    async def _clear(self) -> None:
+        """Drop routes, listeners and subscriptions and detach, for BrowserPool reuse."""
+        self._routes = []
+        if self._intercept_id:
+            intercept, self._intercept_id = self._intercept_id, None
+            try:
+                await self._client.send("network.removeIntercept", {"intercept": intercept})
+            except Exception:
+                pass  # the context may already be gone
+        self.remove_all_listeners()
+        self._detach()
+
+    def _detach(self) -> None:
+        """Stop receiving events, once the browsing context is gone."""
+        registry = _registries.get(self._client)
+        if registry is not None and registry.pages.get(self._context_id) is self:
+            del registry.pages[self._context_id]
+        self._client.remove_event_handler(self._event_handler)
+        for group in list(self._subscriptions):
+            self._unsubscribe(group)
 
     @property
     def id(self) -> str:
@@ -139,18 +257,52 @@ class Page:
 
     # --- Info ---
 
+    # Single-command getters build their command separately, so the sync
+    # Page can send it without a coroutine round trip
+
+    def _info_command(self, name: str) -> _Command:
+        return _Command(f"vibium:page.{name}", {"context": self._context_id}, name)
+
+    def _eval_command(self, expression: str) -> _Command:
+        return _Command("vibium:page.eval", {"context": self._context_id, "expression": expression}, "value")
+
     async def url(self) -> str:
-        result = await self._client.send("vibium:page.url", {"context": self._context_id})
-        return result["url"]
+        return await self._client.send_command(self._info_command("url"))
 
     async def title(self) -> str:
-        result = await self._client.send("vibium:page.title", {"context": self._context_id})
-        return result["title"]
+        return await self._client.send_command(self._info_command("title"))
+
+    async def content(self, path: Optional[Union[str, os.PathLike, BinaryIO]] = None) -> Optional[str]:
+        """Get the page HTML.
 
-    async def content(self) -> str:
-        result = await self._client.send("vibium:page.content", {"context": self._context_id})
+        With ``path`` (a file path or binary file object), the UTF-8 HTML is
+        streamed there in chunks and None is returned.
+        """
+        params = {"context": self._context_id}
+        if path is not None:
+            await self._client.send_streamed("vibium:page.content", params, path)
+            return None
+        result = await self._client.send("vibium:page.content", params)
         return result["content"]
 
+    # --- Batching ---
+
+    async def batch(self, commands: Sequence[Union[str, Tuple[str, Dict[str, Any]]]]) -> List[Any]:
+        """Send several commands in one pipelined round trip.
+
+        Each command is a method name or a (method, params) tuple. The page's
+        context is added to params unless already set. Returns raw results in
+        order; a failed command has its exception in its slot.
+
+            title, url = await vibe.batch(["vibium:page.title", "vibium:page.url"])
+            print(title["title"], url["url"])
+        """
+        prepared: List[Tuple[str, Dict[str, Any]]] = []
+        for command in commands:
+            method, params = (command, {}) if isinstance(command, str) else command
+            prepared.append((method, {"context": self._context_id, **params}))
+        return await self._client.send_many(prepared)
+
     # --- Finding ---
 
     async def find(
@@ -292,28 +444,42 @@ class Page:
         self,
         full_page: Optional[bool] = None,
         clip: Optional[Dict[str, Any]] = None,
-    ) -> bytes:
-        """Take a screenshot. Returns PNG bytes."""
-        result = await self._client.send("vibium:page.screenshot", {
+        path: Optional[Union[str, os.PathLike, BinaryIO]] = None,
+    ) -> Optional[bytes]:
+        """Take a screenshot. Returns PNG bytes.
+
+        With ``path`` (a file path or binary file object), the image is
+        streamed there in chunks instead and None is returned. Use this for
+        full-page captures that would not fit in one WebSocket frame.
+        """
+        params = {
             "context": self._context_id,
             "fullPage": full_page,
             "clip": clip,
-        })
+        }
+        if path is not None:
+            await self._client.send_streamed("vibium:page.screenshot", params, path)
+            return None
+        result = await self._client.send("vibium:page.screenshot", params)
         return base64.b64decode(result["data"])
 
-    async def pdf(self) -> bytes:
-        """Print the page to PDF. Returns PDF bytes. Only works in headless mode."""
-        result = await self._client.send("vibium:page.pdf", {"context": self._context_id})
+    async def pdf(self, path: Optional[Union[str, os.PathLike, BinaryIO]] = None) -> Optional[bytes]:
+        """Print the page to PDF. Returns PDF bytes. Only works in headless mode.
+
+        With ``path``, the PDF is streamed there in chunks and None is returned.
+        """
+        params = {"context": self._context_id}
+        if path is not None:
+            await self._client.send_streamed("vibium:page.pdf", params, path)
+            return None
+        result = await self._client.send("vibium:page.pdf", params)
         return base64.b64decode(result["data"])
 
     # --- Evaluation ---
 
     async def eval(self, expression: str) -> Any:
         """Evaluate a JS expression and return the deserialized value."""
-        result = await self._client.send("vibium:page.eval", {
-            "context": self._context_id, "expression": expression,
-        })
-        return result["value"]
+        return await self._client.send_command(self._eval_command(expression))
 
     async def evaluate(self, script: str) -> Any:
         """Execute a JS script (multi-statement, use 'return' for values)."""
@@ -416,7 +582,7 @@ class Page:
     async def frames(self) -> List[Page]:
         """Get all child frames of this page."""
         result = await self._client.send("vibium:page.frames", {"context": self._context_id})
-        return [Page(self._client, f["context"]) for f in result["frames"]]
+        return [Page._for(self._client, f["context"]) for f in result["frames"]]
 
     async def frame(self, name_or_url: str) -> Optional[Page]:
         """Find a frame by name or URL substring."""
@@ -425,7 +591,7 @@ class Page:
         })
         if not result or not result.get("context"):
             return None
-        return Page(self._client, result["context"])
+        return Page._for(self._client, result["context"])
 
     def main_frame(self) -> Page:
         """Returns this page — the page IS its own main frame."""
@@ -438,6 +604,7 @@ class Page:
 
     async def close(self) -> None:
         await self._client.send("browsingContext.close", {"context": self._context_id})
+        self._detach()
 
     # --- Network Interception ---
 
@@ -448,6 +615,7 @@ class Page:
             self._intercept_id = result["intercept"]
 
         self._ensure_data_collector()
+        self._subscribe("network")
         self._routes.append({"pattern": pattern, "handler": handler, "interceptId": self._intercept_id})
 
     async def unroute(self, pattern: str) -> None:
@@ -456,15 +624,19 @@ class Page:
         if not self._routes and self._intercept_id:
             await self._client.send("network.removeIntercept", {"intercept": self._intercept_id})
             self._intercept_id = None
+        if not self._routes and not self._request_callbacks and not self._response_callbacks:
+            self._unsubscribe("network")
 
     def on_request(self, fn: Callable[[Request], None]) -> None:
         """Register a callback for every outgoing request."""
         self._ensure_data_collector()
+        self._subscribe("network")
         self._request_callbacks.append(fn)
 
     def on_response(self, fn: Callable[[Response], None]) -> None:
         """Register a callback for every completed response."""
         self._ensure_data_collector()
+        self._subscribe("network")
         self._response_callbacks.append(fn)
 
     async def set_headers(self, headers: Dict[str, str]) -> None:
@@ -478,6 +650,7 @@ class Page:
             import asyncio
             asyncio.ensure_future(route.continue_(headers=merged))
 
+        self._subscribe("network")
         self._routes.append({
             "pattern": "**",
             "handler": _header_handler,
@@ -507,6 +680,7 @@ class Page:
                     future.set_result(request)
 
         self._ensure_data_collector()
+        self._subscribe("network")
         self._request_callbacks.append(handler)
 
         try:
@@ -529,6 +703,7 @@ class Page:
                     future.set_result(response)
 
         self._ensure_data_collector()
+        self._subscribe("network")
         self._response_callbacks.append(handler)
 
         try:
@@ -544,12 +719,15 @@ class Page:
         self._dialog_callbacks.append(handler)
 
     def on_console(self, handler: Callable[[ConsoleMessage], None]) -> None:
+        self._subscribe("log")
         self._console_callbacks.append(handler)
 
     def on_error(self, handler: Callable[[Exception], None]) -> None:
+        self._subscribe("log")
         self._error_callbacks.append(handler)
 
     def on_download(self, handler: Callable[[Download], None]) -> None:
+        self._subscribe("download")
         self._download_callbacks.append(handler)
 
     def remove_all_listeners(self, event: Optional[str] = None) -> None:
@@ -570,9 +748,27 @@ class Page:
             self._ws_callbacks.clear()
         if (not self._request_callbacks and not self._response_callbacks and not self._routes):
             self._teardown_data_collector()
+            self._unsubscribe("network")
+        if not self._console_callbacks and not self._error_callbacks:
+            self._unsubscribe("log")
+        if not self._download_callbacks and not self._pending_downloads:
+            self._unsubscribe("download")
 
     # --- Internal Event Handling ---
 
+    def _subscribe(self, group: str) -> None:
+        """Have the server forward a group of this page's events."""
+        if group in self._subscriptions:
+            return
+        future = self._client.subscribe_soon(_SUBSCRIPTION_EVENTS[group], [self._context_id])
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._subscriptions[group] = future
+
+    def _unsubscribe(self, group: str) -> None:
+        future = self._subscriptions.pop(group, None)
+        if future is not None:
+            self._client.unsubscribe_soon(future)
+
     def _ensure_data_collector(self) -> None:
         if self._data_collector_id is not None:
             return
@@ -605,19 +801,6 @@ class Page:
     def _handle_event(self, event: Dict[str, Any]) -> None:
         """Dispatch a BiDi event to the appropriate handler."""
         params = event.get("params", {})
-        event_context = params.get("context")
-
-        # Filter events to this page's context
-        if event_context and event_context != self._context_id:
-            # log.entryAdded uses source.context
-            method = event.get("method", "")
-            if method == "log.entryAdded":
-                source = params.get("source", {})
-                if source.get("context") != self._context_id:
-                    return
-            else:
-                return
-
         method = event.get("method", "")
 
         if method == "network.beforeRequestSent":
@@ -0,0 +1,245 @@
+"""Async pool of pre-launched browsers."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+
+from .browser import Browser, browser as _launcher
+
+
+class BrowserPool:
+    """Keeps browsers launched and connected so acquiring one is instant.
+
+    Usage:
+        pool = await BrowserPool(min_size=2, max_size=8, headless=True).start()
+        bro = await pool.acquire()
+        try:
+            vibe = await bro.page()
+            ...
+        finally:
+            await pool.release(bro)
+        await pool.close()
+
+    At least min_size browsers are kept idle or launching (never more than
+    max_size in total), and browsers handed out are replaced in the
+    background. Idle browsers beyond min_size are closed after idle_timeout
+    milliseconds (None keeps them). Other keyword arguments are passed to
+    browser.launch().
+
+    A released browser is reset before it is handed out again: listeners
+    are removed, contexts from new_context() and all pages but one are
+    closed, and default-context cookies are cleared. Use new_context() for
+    work that must not see earlier jobs' storage.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 4,
+        idle_timeout: Optional[int] = 300000,
+        **launch_options: Any,
+    ) -> None:
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ValueError("BrowserPool needs 0 <= min_size <= max_size and max_size >= 1")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._launch_options = launch_options
+
+        # Idle browsers with the time they were released, oldest first
+        self._idle: Deque[Tuple[Browser, float]] = deque()
+        # Handed out, or being reset after release()
+        self._in_use: Set[Browser] = set()
+        # The part of _in_use being reset after release()
+        self._released: Set[Browser] = set()
+        self._launching = 0
+        self._changed: Optional[asyncio.Condition] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._evictor: Optional[asyncio.Task] = None
+        self._closed = False
+        # Most recent background launch failure, if any
+        self.last_error: Optional[BaseException] = None
+
+    @property
+    def size(self) -> int:
+        """Browsers owned by the pool: idle, in use or launching."""
+        return len(self._idle) + len(self._in_use) + self._launching
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of idle, in-use and launching browsers."""
+        return {"idle": len(self._idle), "in_use": len(self._in_use), "launching": self._launching}
+
+    async def start(self) -> BrowserPool:
+        """Launch min_size browsers and wait until they are ready."""
+        self._changed = asyncio.Condition()
+        self._launching += self.min_size
+        results = await asyncio.gather(
+            *(self._launch() for _ in range(self.min_size)), return_exceptions=True
+        )
+        now = time.monotonic()
+        for result in results:
+            if isinstance(result, Browser):
+                self._idle.append((result, now))
+        for result in results:
+            if isinstance(result, BaseException):
+                await self.close()
+                raise result
+        if self.idle_timeout is not None:
+            self._evictor = asyncio.ensure_future(self._evict_idle())
+        return self
+
+    async def acquire(self, timeout: Optional[int] = None) -> Browser:
+        """Take a browser from the pool.
+
+        Launches one if none is idle and the pool is below max_size;
+        otherwise waits up to ``timeout`` milliseconds (None waits forever).
+
+        Raises:
+            TimeoutError: If no browser became available in time.
+        """
+        if self._changed is None:
+            raise RuntimeError("BrowserPool.start() has not been called")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout / 1000 if timeout is not None else None
+
+        async with self._changed:
+            while True:
+                if self._closed:
+                    raise RuntimeError("BrowserPool is closed")
+                while self._idle:
+                    browser, _ = self._idle.pop()
+                    if browser._client.closed:
+                        self._spawn(self._close_browser(browser))
+                        continue
+                    self._in_use.add(browser)
+                    self._refill()
+                    return browser
+                if self.size < self.max_size:
+                    self._launching += 1
+                    break
+                remaining = None if deadline is None else deadline - loop.time()
+                try:
+                    await asyncio.wait_for(self._changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"No browser available within {timeout}ms") from None
+
+        try:
+            browser = await self._launch()
+        except BaseException:
+            await self._notify()
+            raise
+        if self._closed:
+            await self._close_browser(browser)
+            raise RuntimeError("BrowserPool is closed")
+        self._in_use.add(browser)
+        self._refill()
+        return browser
+
+    async def release(self, browser: Browser) -> None:
+        """Give a browser back. It is reset in the background, then reused.
+
+        Raises:
+            ValueError: If the browser is not checked out from this pool,
+                e.g. because it was already released.
+        """
+        if browser not in self._in_use:
+            raise ValueError("Browser was not acquired from this pool")
+        if browser in self._released:
+            raise ValueError("Browser was already released")
+        self._released.add(browser)
+        self._spawn(self._recycle(browser))
+
+    async def close(self) -> None:
+        """Close every browser, idle or in use, and stop refilling."""
+        self._closed = True
+        if self._evictor:
+            self._evictor.cancel()
+        await self._notify()
+        # Let launches and resets finish so their browsers are not orphaned
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        browsers = [b for b, _ in self._idle] + list(self._in_use)
+        self._idle.clear()
+        self._in_use.clear()
+        await asyncio.gather(*(self._close_browser(b) for b in browsers))
+
+    async def __aenter__(self) -> BrowserPool:
+        return await self.start()
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def _launch(self) -> Browser:
+        """Launch one browser; the caller has already counted it in _launching."""
+        try:
+            return await _launcher.launch(**self._launch_options)
+        finally:
+            self._launching -= 1
+
+    def _refill(self) -> None:
+        """Launch browsers in the background until min_size are idle or launching."""
+        while not self._closed and len(self._idle) + self._launching < self.min_size and self.size < self.max_size:
+            self._launching += 1
+            self._spawn(self._add())
+
+    async def _add(self) -> None:
+        try:
+            browser = await self._launch()
+        except Exception as e:
+            # Don't retry here: a broken install would spin. The next
+            # acquire() or release() tries again.
+            self.last_error = e
+        else:
+            if self._closed:
+                await self._close_browser(browser)
+            else:
+                self._idle.append((browser, time.monotonic()))
+        await self._notify()
+
+    async def _recycle(self, browser: Browser) -> None:
+        try:
+            if not self._closed:
+                await browser._reset()
+            reusable = not self._closed
+        except Exception:
+            reusable = False
+        self._in_use.discard(browser)
+        self._released.discard(browser)
+        if reusable:
+            self._idle.append((browser, time.monotonic()))
+        else:
+            await self._close_browser(browser)
+            self._refill()
+        await self._notify()
+
+    async def _evict_idle(self) -> None:
+        """Close browsers idle for longer than idle_timeout, down to min_size."""
+        timeout = self.idle_timeout / 1000  # type: ignore[operator]
+        while not self._closed:
+            await asyncio.sleep(min(max(timeout / 2, 0.05), 1.0))
+            now = time.monotonic()
+            while len(self._idle) > self.min_size and now - self._idle[0][1] > timeout:
+                browser, _ = self._idle.popleft()
+                self._spawn(self._close_browser(browser))
+
+    async def _notify(self) -> None:
+        if self._changed is None:
+            return
+        async with self._changed:
+            self._changed.notify_all()
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _close_browser(browser: Browser) -> None:
+        try:
+            await browser.close()
+        except Exception:
+            pass
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import base64
+import io
 from typing import Any, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -43,13 +43,15 @@ class Tracing:
         params: Dict[str, Any] = {"userContext": self._user_context_id}
         if path is not None:
             params["path"] = path
-        result = await self._client.send("vibium:tracing.stop", params)
-
-        if path and result.get("path"):
-            with open(result["path"], "rb") as f:
-                return f.read()
+        if not path:
+            # Stream the zip back in chunks rather than one large base64 frame
+            buffer = io.BytesIO()
+            await self._client.send_streamed("vibium:tracing.stop", params, buffer)
+            return buffer.getvalue()
 
-        return base64.b64decode(result.get("data", ""))
+        result = await self._client.send("vibium:tracing.stop", params)
+        with open(result["path"], "rb") as f:
+            return f.read()
 
     async def start_chunk(
         self,
@@ -69,13 +71,15 @@ class Tracing:
         params: Dict[str, Any] = {"userContext": self._user_context_id}
         if path is not None:
             params["path"] = path
-        result = await self._client.send("vibium:tracing.stopChunk", params)
-
-        if path and result.get("path"):
-            with open(result["path"], "rb") as f:
-                return f.read()
+        if not path:
+            # Stream the zip back in chunks rather than one large base64 frame
+            buffer = io.BytesIO()
+            await self._client.send_streamed("vibium:tracing.stopChunk", params, buffer)
+            return buffer.getvalue()
 
-        return base64.b64decode(result.get("data", ""))
+        result = await self._client.send("vibium:tracing.stopChunk", params)
+        with open(result["path"], "rb") as f:
+            return f.read()
 
     async def start_group(
         self,
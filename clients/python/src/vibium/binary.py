@@ -2,13 +2,20 @@
 
 import asyncio
 import importlib.util
+import json
+import logging
 import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class VibiumNotFoundError(Exception):
@@ -16,6 +23,15 @@ class VibiumNotFoundError(Exception):
     pass
 
 
+class VibiumConnectError(ConnectionError):
+    """Raised when a started vibium server cannot be connected to.
+
+    Only on Python < 3.11; newer versions re-raise the original error with
+    the server's recent output added as a note.
+    """
+    pass
+
+
 def get_platform_package_name() -> str:
     """Get the platform-specific package name."""
     system = sys.platform
@@ -103,12 +119,142 @@ def find_vibium_bin() -> str:
     )
 
 
-def ensure_browser_installed(vibium_path: str) -> None:
-    """Ensure Chrome for Testing is installed.
+def _installed_chrome_path(paths_output: str) -> Optional[str]:
+    """Return the Chrome binary from 'vibium paths' output, if it exists."""
+    for line in paths_output.split("\n"):
+        if line.startswith("Chrome:"):
+            chrome_path = line.split(":", 1)[1].strip()
+            if os.path.isfile(chrome_path):
+                return chrome_path
+    return None
+
+
+def _chrome_cache_file() -> Path:
+    return get_cache_dir() / "chrome-check.json"
+
+
+def _chrome_cache_key(vibium_path: str) -> Optional[Tuple[str, int]]:
+    try:
+        real = os.path.realpath(vibium_path)
+        return real, os.stat(real).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_chrome_cache() -> Dict[str, Any]:
+    try:
+        with open(_chrome_cache_file(), encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _cached_chrome_ok(vibium_path: str) -> bool:
+    """Check the on-disk result of a previous 'vibium paths' run.
 
-    Runs 'vibium install' if Chrome is not found.
+    An entry is valid while the vibium binary and the Chrome binary it
+    reported are unchanged (same mtimes), so revalidating costs two stats.
     """
-    # Check if Chrome is installed by running 'vibium paths'
+    key = _chrome_cache_key(vibium_path)
+    if key is None:
+        return False
+    entry = _load_chrome_cache().get(key[0])
+    if not isinstance(entry, dict) or entry.get("vibium_mtime") != key[1]:
+        return False
+    try:
+        return os.stat(entry["chrome"]).st_mtime_ns == entry.get("chrome_mtime")
+    except (OSError, KeyError, TypeError):
+        return False
+
+
+def _save_chrome_cache(vibium_path: str, chrome_path: str) -> None:
+    """Record a successful Chrome check; failures to write are ignored."""
+    key = _chrome_cache_key(vibium_path)
+    if key is None:
+        return
+    try:
+        entries = _load_chrome_cache()
+        entries[key[0]] = {
+            "vibium_mtime": key[1],
+            "chrome": chrome_path,
+            "chrome_mtime": os.stat(chrome_path).st_mtime_ns,
+        }
+        cache_file = _chrome_cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent launches never read a partial file
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entries), encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+# How long to wait for another process's Chrome install (the install
+# itself times out after 5 minutes), and how often to retry the lock.
+_INSTALL_LOCK_TIMEOUT = 600
+_INSTALL_LOCK_POLL = 0.2
+
+
+class _FileLock:
+    """Exclusive cross-process lock on a file in the cache dir.
+
+    install.lock serializes Chrome installs: concurrent workers on a fresh
+    machine would otherwise all download Chrome into the same directory.
+    """
+
+    def __init__(self, name: str = "install.lock", purpose: str = "install Chrome") -> None:
+        self._path = get_cache_dir() / name
+        self._purpose = purpose
+        self._fd: Optional[int] = None
+
+    def try_acquire(self) -> bool:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def acquire(self) -> None:
+        deadline = time.monotonic() + _INSTALL_LOCK_TIMEOUT
+        while not self.try_acquire():
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Timed out waiting for another process to {self._purpose}")
+            time.sleep(_INSTALL_LOCK_POLL)
+
+    async def acquire_async(self) -> None:
+        deadline = time.monotonic() + _INSTALL_LOCK_TIMEOUT
+        while not self.try_acquire():
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Timed out waiting for another process to {self._purpose}")
+            await asyncio.sleep(_INSTALL_LOCK_POLL)
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _check_chrome(vibium_path: str) -> bool:
+    """Run 'vibium paths' and cache the result if Chrome is installed."""
     try:
         result = subprocess.run(
             [vibium_path, "paths"],
@@ -116,39 +262,203 @@ def ensure_browser_installed(vibium_path: str) -> None:
             text=True,
             timeout=10,
         )
-        output = result.stdout
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
+        return False
+    chrome_path = _installed_chrome_path(result.stdout)
+    if chrome_path:
+        _save_chrome_cache(vibium_path, chrome_path)
+    return chrome_path is not None
 
-        # Check if Chrome path exists
-        for line in output.split("\n"):
-            if line.startswith("Chrome:"):
-                chrome_path = line.split(":", 1)[1].strip()
-                if os.path.isfile(chrome_path):
-                    return  # Chrome is installed
 
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-        pass
+def ensure_browser_installed(vibium_path: str) -> None:
+    """Ensure Chrome for Testing is installed.
+
+    Runs 'vibium install' if Chrome is not found. A successful check is
+    cached on disk, so later calls skip the 'vibium paths' subprocess until
+    the vibium or Chrome binary changes. Installs are serialized across
+    processes by a lock file in the cache dir; processes that wait for it
+    reuse the finished install.
+    """
+    if _cached_chrome_ok(vibium_path) or _check_chrome(vibium_path):
+        return
 
-    # Chrome not found, run install
-    print("Downloading Chrome for Testing...", flush=True)
+    lock = _FileLock()
+    if not lock.try_acquire():
+        print("Waiting for another process to install Chrome...", flush=True)
+        lock.acquire()
     try:
-        subprocess.run(
-            [vibium_path, "install"],
-            check=True,
-            timeout=300,  # 5 minute timeout for download
-        )
+        # Another process may have finished the install while we waited
+        if _check_chrome(vibium_path):
+            return
+
+        print("Downloading Chrome for Testing...", flush=True)
+        try:
+            subprocess.run(
+                [vibium_path, "install"],
+                check=True,
+                timeout=300,  # 5 minute timeout for download
+            )
+            print("Chrome installed successfully.", flush=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to install Chrome: {e}")
+        except subprocess.TimeoutExpired:
+            raise RuntimeError("Chrome installation timed out")
+    finally:
+        lock.release()
+
+
+async def _run(args: List[str], timeout: float, capture: bool = False) -> Tuple[int, str]:
+    """Run a command without blocking the event loop; kill it on timeout."""
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE if capture else None,
+        stderr=asyncio.subprocess.DEVNULL if capture else None,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    return process.returncode or 0, (stdout or b"").decode("utf-8", "replace")
+
+
+async def _check_chrome_async(vibium_path: str) -> bool:
+    try:
+        _, output = await _run([vibium_path, "paths"], timeout=10, capture=True)
+    except (asyncio.TimeoutError, OSError):
+        return False
+    chrome_path = _installed_chrome_path(output)
+    if chrome_path:
+        _save_chrome_cache(vibium_path, chrome_path)
+    return chrome_path is not None
+
+
+async def ensure_browser_installed_async(vibium_path: str) -> None:
+    """Async ensure_browser_installed: runs the checks without blocking the event loop."""
+    if _cached_chrome_ok(vibium_path) or await _check_chrome_async(vibium_path):
+        return
+
+    lock = _FileLock()
+    if not lock.try_acquire():
+        print("Waiting for another process to install Chrome...", flush=True)
+        await lock.acquire_async()
+    try:
+        if await _check_chrome_async(vibium_path):
+            return
+
+        print("Downloading Chrome for Testing...", flush=True)
+        try:
+            returncode, _ = await _run([vibium_path, "install"], timeout=300)
+        except asyncio.TimeoutError:
+            raise RuntimeError("Chrome installation timed out")
+        if returncode != 0:
+            raise RuntimeError(f"Failed to install Chrome: 'vibium install' exited with status {returncode}")
         print("Chrome installed successfully.", flush=True)
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Failed to install Chrome: {e}")
-    except subprocess.TimeoutExpired:
-        raise RuntimeError("Chrome installation timed out")
+    finally:
+        lock.release()
+
+
+# The serve command's readiness line: "Server listening on ws://localhost:PORT",
+# or "Server listening on ws+unix://PATH" with --socket
+_LISTENING = re.compile(rb"listening on (?:ws://[^\s:/]+:(\d+)|ws\+unix://(\S+))", re.IGNORECASE)
+
+# Component tag at the start of a server log line, e.g. "[router] ..."
+_SOURCE = re.compile(r"^\[([\w-]+)\]\s*")
+
+# Number of server output lines kept for diagnostics.
+OUTPUT_BUFFER_LINES = 500
+
+# Server output is forwarded here when launched with log_output=True.
+server_logger = logging.getLogger("vibium.server")
+
+
+@dataclass
+class OutputLine:
+    """One line of vibium server output."""
+
+    time: float
+    stream: str  # "stdout" or "stderr"
+    source: Optional[str]  # component tag, e.g. "router" for "[router] ..."
+    text: str
+
+    def __str__(self) -> str:
+        return f"[{self.stream}] {self.text}"
 
 
 class VibiumProcess:
-    """Manages a vibium subprocess."""
+    """Manages a vibium subprocess.
 
-    def __init__(self, process: subprocess.Popen, port: int):
+    The server's stdout and stderr are read continuously, so it never blocks
+    on a full pipe; the most recent lines are kept for diagnostics.
+    """
+
+    def __init__(self, process: asyncio.subprocess.Process, port: int = 0, log_output: bool = False):
         self._process = process
         self.port = port
+        # Unix socket path when started with unix_socket=True (port is then 0)
+        self.socket_path: Optional[str] = None
+        self._socket_dir: Optional[str] = None
+        self._started_at = time.perf_counter()
+        # Startup phase -> milliseconds since start() was called
+        self.startup_timings: Dict[str, float] = {}
+
+        self._output: deque = deque(maxlen=OUTPUT_BUFFER_LINES)
+        self._log_output = log_output
+        self._listening: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._drainers = [
+            asyncio.ensure_future(self._drain(stream, name))
+            for stream, name in ((process.stdout, "stdout"), (process.stderr, "stderr"))
+            if stream is not None
+        ]
+        if process.stdout is None:
+            self._listening.set_result(None)
+
+    def mark_phase(self, phase: str) -> None:
+        """Record that a startup phase completed (see startup_timings)."""
+        self.startup_timings[phase] = (time.perf_counter() - self._started_at) * 1000
+
+    def recent_output(self, lines: Optional[int] = None) -> List[OutputLine]:
+        """Return the last ``lines`` lines of server output (default: all kept)."""
+        output = list(self._output)
+        return output[-lines:] if lines else output
+
+    def describe(self, lines: int = 20) -> str:
+        """Exit status (if exited) and recent output, for error messages."""
+        parts = []
+        if self._process.returncode is not None:
+            parts.append(f"vibium exited with status {self._process.returncode}")
+        recent = self.recent_output(lines)
+        if recent:
+            parts.append("Recent server output:\n" + "\n".join(f"  {line}" for line in recent))
+        return "\n".join(parts)
+
+    async def _drain(self, stream: asyncio.StreamReader, name: str) -> None:
+        """Read one output stream until EOF, recording each line."""
+        while True:
+            try:
+                raw = await stream.readline()
+            except ValueError:
+                # Line longer than the stream limit; take what is buffered
+                raw = await stream.read(64 * 1024)
+            if not raw:
+                break
+            if name == "stdout" and not self._listening.done():
+                match = _LISTENING.search(raw)
+                if match:
+                    self._listening.set_result(match)
+            self._record(name, raw.decode("utf-8", "replace").rstrip("\r\n"))
+        if name == "stdout" and not self._listening.done():
+            self._listening.set_result(None)
+
+    def _record(self, stream: str, text: str) -> None:
+        match = _SOURCE.match(text)
+        source = match.group(1) if match else None
+        self._output.append(OutputLine(time.time(), stream, source, text))
+        if self._log_output:
+            level = logging.WARNING if stream == "stderr" else logging.INFO
+            if server_logger.isEnabledFor(level):
+                server_logger.log(level, text, extra={"vibium_source": source, "vibium_stream": stream})
 
     @classmethod
     async def start(
@@ -156,6 +466,9 @@ class VibiumProcess:
         headless: bool = False,
         port: Optional[int] = None,
         executable_path: Optional[str] = None,
+        startup_timeout: Optional[int] = 30000,
+        log_output: bool = False,
+        unix_socket: bool = False,
     ) -> "VibiumProcess":
         """Start a vibium process.
 
@@ -163,61 +476,128 @@ class VibiumProcess:
             headless: Run browser in headless mode.
             port: WebSocket port (default: auto-assigned).
             executable_path: Path to vibium binary (default: auto-detect).
+            startup_timeout: Time to wait for the server to start listening,
+                in milliseconds (default: 30s). None waits forever. A Chrome
+                download, if needed, is not counted.
+            log_output: Forward server output to the "vibium.server" logger
+                (stdout at INFO, stderr at WARNING).
+            unix_socket: Listen on a Unix domain socket in a private temp
+                directory instead of a TCP port (see socket_path). Not
+                supported on Windows.
 
         Returns:
-            A VibiumProcess instance.
+            A VibiumProcess instance. startup_timings holds the binary_found,
+            chrome_checked and server_listening phases.
+
+        Raises:
+            RuntimeError: If the process exits before it is listening.
+            TimeoutError: If it is not listening within startup_timeout.
         """
+        started_at = time.perf_counter()
+        timings: Dict[str, float] = {}
+
+        def mark(phase: str) -> None:
+            timings[phase] = (time.perf_counter() - started_at) * 1000
+
         binary = executable_path or find_vibium_bin()
+        mark("binary_found")
+
+        # Ensure Chrome is installed (auto-download if needed). Everything
+        # below awaits instead of blocking, so concurrent launches overlap.
+        await ensure_browser_installed_async(binary)
+        mark("chrome_checked")
 
-        # Ensure Chrome is installed (auto-download if needed)
-        ensure_browser_installed(binary)
+        if unix_socket and sys.platform == "win32":
+            raise ValueError("unix_socket is not supported on Windows")
 
         args = [binary, "serve"]
         if headless:
             args.append("--headless")
-        # Use port 0 (OS-assigned random port) by default to avoid conflicts
-        # when multiple browser instances run concurrently
-        args.extend(["--port", str(port if port is not None else 0)])
+        socket_dir = None
+        if unix_socket:
+            # A private directory keeps the path short (sun_path is limited
+            # to ~104 bytes) and the socket unreachable by other users
+            socket_dir = tempfile.mkdtemp(prefix="vibium-")
+            args.extend(["--socket", os.path.join(socket_dir, "vibium.sock")])
+        else:
+            # Use port 0 (OS-assigned random port) by default to avoid conflicts
+            # when multiple browser instances run concurrently
+            args.extend(["--port", str(port if port is not None else 0)])
 
         # Start the process
-        process = subprocess.Popen(
-            args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-
-        # Read the port from stdout
-        # Vibium prints "Server listening on ws://localhost:PORT"
-        actual_port = port or 0
-
-        if process.stdout:
-            # First line: "Starting Clicker proxy server on port ..."
-            # Second line: "Server listening on ws://localhost:PORT"
-            for _ in range(2):
-                line = process.stdout.readline()
-                if "listening on" in line.lower():
-                    try:
-                        actual_port = int(line.strip().split(":")[-1])
-                    except (ValueError, IndexError):
-                        pass
-                    break
-
-        # Give it a moment to start
-        await asyncio.sleep(0.1)
-
-        # Check if process is still running
-        if process.poll() is not None:
-            stderr = process.stderr.read() if process.stderr else ""
-            raise RuntimeError(f"Vibium failed to start: {stderr}")
-
-        return cls(process, actual_port)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except BaseException:
+            if socket_dir:
+                shutil.rmtree(socket_dir, ignore_errors=True)
+            raise
+        instance = cls(process, log_output=log_output)
+        instance._socket_dir = socket_dir
+        instance._started_at = started_at
+        instance.startup_timings = timings
+
+        try:
+            listening = await asyncio.wait_for(
+                asyncio.shield(instance._listening),
+                startup_timeout / 1000 if startup_timeout is not None else None,
+            )
+        except asyncio.TimeoutError:
+            await instance._kill()
+            raise TimeoutError(
+                f"Vibium did not start listening within {startup_timeout}ms\n{instance.describe()}"
+            ) from None
+        except BaseException:
+            await instance._kill()
+            raise
+
+        if listening is None:
+            # stdout closed before the readiness line: the process exited
+            await instance._kill()
+            raise RuntimeError(f"Vibium failed to start\n{instance.describe()}")
+
+        if listening.group(2):
+            instance.socket_path = listening.group(2).decode()
+        else:
+            instance.port = int(listening.group(1))
+        mark("server_listening")
+        return instance
+
+    async def _finish_draining(self, timeout: float = 1.0) -> None:
+        """Wait briefly for the drainers to reach EOF after the process exits."""
+        if not self._drainers:
+            return
+        _, pending = await asyncio.wait(self._drainers, timeout=timeout)
+        for task in pending:
+            task.cancel()
+
+    def _remove_socket_dir(self) -> None:
+        if self._socket_dir:
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+            self._socket_dir = None
+
+    async def _kill(self) -> None:
+        if self._process.returncode is None:
+            try:
+                self._process.kill()
+            except ProcessLookupError:
+                pass
+            await self._process.wait()
+        await self._finish_draining()
+        self._remove_socket_dir()
 
     async def stop(self) -> None:
         """Stop the vibium process."""
-        if self._process.poll() is None:
-            self._process.terminate()
+        if self._process.returncode is None:
             try:
-                self._process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self._process.kill()
+                self._process.terminate()
+                await asyncio.wait_for(self._process.wait(), 5)
+            except asyncio.TimeoutError:
+                await self._kill()
+            except ProcessLookupError:
+                pass
+        await self._finish_draining()
+        self._remove_socket_dir()
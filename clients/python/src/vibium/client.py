@@ -3,11 +3,93 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from typing import Any, Callable, Dict, List, Optional
+import base64
+import contextlib
+import contextvars
+import itertools
+import os
+import random
+import time
+from collections import Counter, deque
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from websockets.asyncio.client import ClientConnection, connect as ws_connect
-from websockets.exceptions import ConnectionClosed
+from websockets.exceptions import ConnectionClosed, InvalidHandshake
+
+from ._codec import Codec, get_codec
+from ._metrics import Metrics
+from ._types import _Command
+from ._waiter import _Waiter
+
+
+EventHandler = Callable[[Dict[str, Any]], None]
+
+# Overflow policies for the event queue, applied per event method:
+#   block       — wait, in order, for room in the queue (default; nothing is
+#                 lost). Only delivery waits: the receive loop keeps reading,
+#                 so command responses are never held up behind events
+#   drop_oldest — evict the oldest queued event whose policy is not "block"
+#   coalesce    — keep only the newest queued event per (method, context)
+EVENT_POLICIES = ("block", "drop_oldest", "coalesce")
+
+DEFAULT_EVENT_QUEUE_SIZE = 1000
+
+# Default time to wait for a command response, in milliseconds. Commands that
+# carry their own server-side "timeout" param get that long plus a grace period.
+DEFAULT_COMMAND_TIMEOUT = 60000
+_TIMEOUT_GRACE = 5000
+
+# Commands whose server-side wait is given by a param other than "timeout"
+_WAIT_PARAMS = {"vibium:page.wait": "ms"}
+
+# Largest WebSocket frame accepted from the server. Results bigger than this
+# should be fetched with send_streamed() instead of in a single frame.
+DEFAULT_MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# Raw bytes fetched per vibium:stream.read call.
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Commands that are sent again after a reconnect if their response was lost:
+# reads and waits that do not change the page. Anything else in flight fails
+# with ConnectionError, since it may or may not have run. Subscriptions are
+# included because a duplicate subscription is harmless.
+REPLAYABLE_COMMANDS = frozenset({
+    "vibium:find", "vibium:findAll",
+    "vibium:el.text", "vibium:el.innerText", "vibium:el.html", "vibium:el.value",
+    "vibium:el.attr", "vibium:el.bounds", "vibium:el.isVisible", "vibium:el.isHidden",
+    "vibium:el.isEnabled", "vibium:el.isChecked", "vibium:el.isEditable",
+    "vibium:el.role", "vibium:el.label", "vibium:el.screenshot", "vibium:el.waitFor",
+    "vibium:page.url", "vibium:page.title", "vibium:page.content",
+    "vibium:page.screenshot", "vibium:page.pdf", "vibium:page.a11yTree",
+    "vibium:page.frames", "vibium:page.frame", "vibium:page.viewport", "vibium:page.window",
+    "vibium:page.waitFor", "vibium:page.wait", "vibium:page.waitForURL", "vibium:page.waitForLoad",
+    "vibium:browser.page", "vibium:browser.pages",
+    "vibium:context.cookies", "vibium:context.storageState",
+    "vibium:session.subscribe", "vibium:session.unsubscribe",
+    "browsingContext.getTree",
+})
+
+# Backoff between reconnect attempts, in seconds.
+_RECONNECT_DELAY = 0.05
+_RECONNECT_MAX_DELAY = 2.0
+
+# Absolute event-loop time (seconds) by which commands in the current task
+# must complete; set by BiDiClient.deadline().
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("vibium_deadline", default=None)
+
+
+def _event_context(event: Dict[str, Any]) -> Optional[str]:
+    """Return the browsing context an event belongs to, if any.
+
+    log.entryAdded carries its context under params.source.
+    """
+    params = event.get("params") or {}
+    context = params.get("context")
+    if context is None:
+        source = params.get("source")
+        if isinstance(source, dict):
+            context = source.get("context")
+    return context
 
 
 class BiDiError(Exception):
@@ -19,90 +101,850 @@ class BiDiError(Exception):
         super().__init__(f"{error}: {message}")
 
 
+async def _open_websocket(url: str, max_frame_size: Optional[int], unix_socket: Optional[str]) -> ClientConnection:
+    """Open the WebSocket over TCP, or over a Unix domain socket if one is given."""
+    if unix_socket:
+        return await ws_connect(url, max_size=max_frame_size, unix=True, path=unix_socket)
+    return await ws_connect(url, max_size=max_frame_size)
+
+
 class BiDiClient:
     """WebSocket client for BiDi protocol with event dispatch."""
 
-    def __init__(self, ws: ClientConnection):
+    def __init__(
+        self,
+        ws: ClientConnection,
+        codec: Union[str, Codec, None] = None,
+        event_queue_size: int = DEFAULT_EVENT_QUEUE_SIZE,
+        event_policies: Optional[Dict[str, str]] = None,
+        command_timeout: Optional[int] = DEFAULT_COMMAND_TIMEOUT,
+    ):
         self._ws = ws
-        self._next_id = 1
-        self._pending: Dict[int, asyncio.Future] = {}
+        self._codec = get_codec(codec)
+        # Command ids; next() on a count is atomic, so send_threadsafe()
+        # can allocate them from caller threads
+        self._ids = itertools.count(1)
+        # id -> response future; a _Waiter for send_threadsafe() commands.
+        # Only touched on the client's loop.
+        self._pending: Dict[int, Union[asyncio.Future, _Waiter]] = {}
+        # id -> (method, perf_counter at send), for per-method latency
+        self._sent_at: Dict[int, Tuple[str, float]] = {}
+        self.metrics = Metrics()
+        self._command_timeout = command_timeout
+        self._timed_out: Counter = Counter()
+        self._cancelled: Counter = Counter()
         self._receiver_task: Optional[asyncio.Task] = None
-        self._event_handlers: List[Callable[[Dict[str, Any]], None]] = []
+        self._event_task: Optional[asyncio.Task] = None
+        self._loop = asyncio.get_event_loop()
+
+        # Reconnect state (see enable_reconnect). While reconnecting,
+        # _connected is clear and writes wait for it.
+        self._url: Optional[str] = None
+        self._unix_socket: Optional[str] = None
+        self._max_frame_size: Optional[int] = DEFAULT_MAX_FRAME_SIZE
+        self._resume_token: Optional[str] = None
+        self._reconnect_timeout: Optional[int] = None
+        self._reconnects = 0
+        self._in_flight_messages: Dict[int, str] = {}
+        self._connected = asyncio.Event()
+        self._connected.set()
+        # Optional extra context for "Connection closed" errors, such as the
+        # server's exit status and recent output (set by launch()).
+        self.close_detail: Optional[Callable[[], str]] = None
+
+        # Encoded commands queued by subscribe_soon()/unsubscribe_soon(). They
+        # are written ahead of the next send(), so a subscription is in place
+        # on the server before any command that could trigger its events.
+        self._outbox: deque = deque()
+
+        # Events are queued by the receive loop and delivered by a separate
+        # task, so slow handlers never delay command responses. Entries are
+        # [event, coalesce_key] lists so coalescing can swap the event in place.
+        # Events that arrive while the queue is full and may not be dropped
+        # wait in _event_overflow, which refills the queue as it drains.
+        self._event_queue: deque = deque()
+        self._event_overflow: deque = deque()
+        self._event_queue_size = event_queue_size
+        self._event_policies: Dict[str, str] = {}
+        self._coalesce_slots: Dict[Tuple[str, Optional[str]], list] = {}
+        self._events_ready = asyncio.Event()
+        self._events_dropped: Counter = Counter()
+        self._events_coalesced: Counter = Counter()
+        for method, policy in (event_policies or {}).items():
+            self.set_event_policy(method, policy)
+        # Event dispatch index: method -> context -> handlers. None is a
+        # wildcard key at either level, so delivering an event only touches
+        # the handlers subscribed to its method and context.
+        self._event_handlers: Dict[Optional[str], Dict[Optional[str], List[EventHandler]]] = {}
+        self._handler_keys: Dict[EventHandler, List[Tuple[Optional[str], Optional[str]]]] = {}
 
     @classmethod
-    async def connect(cls, url: str) -> BiDiClient:
-        """Connect to a BiDi WebSocket server."""
-        ws = await ws_connect(url)
-        client = cls(ws)
+    async def connect(
+        cls,
+        url: str,
+        codec: Union[str, Codec, None] = None,
+        event_queue_size: int = DEFAULT_EVENT_QUEUE_SIZE,
+        event_policies: Optional[Dict[str, str]] = None,
+        command_timeout: Optional[int] = DEFAULT_COMMAND_TIMEOUT,
+        max_frame_size: Optional[int] = DEFAULT_MAX_FRAME_SIZE,
+        reconnect_timeout: Optional[int] = None,
+        unix_socket: Optional[str] = None,
+    ) -> BiDiClient:
+        """Connect to a BiDi WebSocket server.
+
+        Args:
+            url: WebSocket URL of the vibium server.
+            codec: JSON codec name ("orjson", "msgspec", "json") or instance.
+                Defaults to the fastest installed codec.
+            event_queue_size: Maximum number of events queued for delivery.
+                When it is full, "block" events wait behind it in order.
+            event_policies: Overflow policy per event method, one of
+                EVENT_POLICIES (default: "block").
+            command_timeout: Default time to wait for a response, in
+                milliseconds. None waits forever.
+            max_frame_size: Largest incoming frame in bytes (None = no limit).
+            reconnect_timeout: If set, reconnect transparently when the
+                socket drops; see enable_reconnect().
+            unix_socket: Path of a Unix domain socket to connect through
+                (a server started with ``serve --socket``). The url's host is
+                then only used for the handshake, e.g. "ws://localhost/".
+        """
+        ws = await _open_websocket(url, max_frame_size, unix_socket)
+        client = cls(ws, codec, event_queue_size, event_policies, command_timeout)
+        client._url = url
+        client._unix_socket = unix_socket
+        client._max_frame_size = max_frame_size
         client._receiver_task = asyncio.create_task(client._receive_loop())
+        client._event_task = asyncio.create_task(client._event_loop())
+        if reconnect_timeout:
+            await client.enable_reconnect(reconnect_timeout)
         return client
 
-    def on_event(self, handler: Callable[[Dict[str, Any]], None]) -> None:
-        """Register an event handler for messages without an id (events)."""
-        self._event_handlers.append(handler)
+    async def enable_reconnect(self, timeout: int) -> None:
+        """Survive dropped connections for up to ``timeout`` ms.
+
+        The server keeps this connection's browser session (pages,
+        intercepts, data collectors, event subscriptions) alive for that long
+        after the socket drops. The client retries with exponential backoff
+        and, once reattached, resends in-flight REPLAYABLE_COMMANDS; other
+        in-flight commands fail with ConnectionError. Events sent while
+        disconnected are lost.
+        """
+        if self._url is None:
+            raise RuntimeError("enable_reconnect() needs a client created with BiDiClient.connect()")
+        result = await self.send("vibium:session.resumable", {"timeout": timeout})
+        self._resume_token = result["token"]
+        self._reconnect_timeout = timeout
+
+    @property
+    def closed(self) -> bool:
+        """True once the connection is closed or lost for good."""
+        return self._receiver_task is None or self._receiver_task.done()
+
+    def set_event_policy(self, method: str, policy: str) -> None:
+        """Set the queue overflow policy for an event method."""
+        if policy not in EVENT_POLICIES:
+            raise ValueError(f"Unknown event policy {policy!r}. Choose from: {', '.join(EVENT_POLICIES)}")
+        self._event_policies[method] = policy
+
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """Return transport metrics as a dict.
+
+        Includes per-method command latency histograms (ms), bytes sent and
+        received, in-flight commands, event counts and rates per method,
+        event handler time per method, and the event queue stats. Use
+        ``client.metrics.add_exporter(fn)`` to stream observations elsewhere.
+        """
+        return {
+            **self.metrics.snapshot(),
+            **self.command_stats(),
+            "event_queue": self.event_queue_stats(),
+        }
+
+    def command_stats(self) -> Dict[str, Any]:
+        """Return the in-flight command count and per-method timeout/cancel counts."""
+        return {
+            "in_flight": len(self._pending),
+            "reconnects": self._reconnects,
+            "timed_out": dict(self._timed_out),
+            "cancelled": dict(self._cancelled),
+        }
+
+    @contextlib.contextmanager
+    def deadline(self, timeout: int) -> Iterator[None]:
+        """Bound every command sent in this block by one shared budget (ms).
+
+        Deadlines carry across a chain of awaits in the same task and nest,
+        with the earliest deadline winning:
+
+            with client.deadline(5000):
+                await page.go(url)
+                await page.find("h1")  # gets whatever is left of the 5s
+        """
+        at = asyncio.get_event_loop().time() + timeout / 1000
+        current = _deadline.get()
+        token = _deadline.set(at if current is None else min(current, at))
+        try:
+            yield
+        finally:
+            _deadline.reset(token)
+
+    def _wait_time(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        timeout: Optional[int],
+    ) -> Optional[float]:
+        """Resolve how long to wait for a response, in seconds (None = forever)."""
+        if timeout is None:
+            timeout = self._command_timeout
+            server_timeout = (params or {}).get(_WAIT_PARAMS.get(method, "timeout"))
+            if timeout is not None and isinstance(server_timeout, (int, float)):
+                timeout = max(timeout, server_timeout + _TIMEOUT_GRACE)
+
+        wait = timeout / 1000 if timeout is not None else None
+        at = _deadline.get()
+        if at is not None:
+            remaining = at - self._loop.time()
+            wait = remaining if wait is None else min(wait, remaining)
+        return wait
+
+    def event_queue_stats(self) -> Dict[str, Any]:
+        """Return the event queue depth and per-method drop/coalesce counts.
+
+        "waiting" counts "block" events held back because the queue is full.
+        """
+        return {
+            "depth": len(self._event_queue),
+            "max_size": self._event_queue_size,
+            "waiting": len(self._event_overflow),
+            "dropped": dict(self._events_dropped),
+            "coalesced": dict(self._events_coalesced),
+        }
+
+    def on_event(
+        self,
+        handler: EventHandler,
+        methods: Optional[Iterable[str]] = None,
+        context: Optional[str] = None,
+    ) -> None:
+        """Register an event handler for messages without an id (events).
 
-    def remove_event_handler(self, handler: Callable[[Dict[str, Any]], None]) -> None:
+        Args:
+            handler: Called with the raw event message.
+            methods: Event methods to receive (default: all).
+            context: Only receive events for this browsing context. Events
+                that carry no context are delivered to every handler
+                registered for their method.
+        """
+        keys = self._handler_keys.setdefault(handler, [])
+        for method in (methods if methods is not None else [None]):
+            self._event_handlers.setdefault(method, {}).setdefault(context, []).append(handler)
+            keys.append((method, context))
+
+    def remove_event_handler(self, handler: EventHandler) -> None:
         """Remove a previously registered event handler."""
+        for method, context in self._handler_keys.pop(handler, []):
+            by_context = self._event_handlers.get(method)
+            if by_context is None:
+                continue
+            handlers = by_context.get(context)
+            if handlers and handler in handlers:
+                handlers.remove(handler)
+                if not handlers:
+                    del by_context[context]
+            if not by_context:
+                del self._event_handlers[method]
+
+    # --- Server-side event subscriptions ---
+
+    def subscribe_soon(
+        self,
+        events: Iterable[str],
+        contexts: Optional[Iterable[str]] = None,
+    ) -> asyncio.Future:
+        """Ask the server to forward these events, ahead of the next command.
+
+        The first subscription switches the connection to filtered mode: from
+        then on the server only forwards events some subscription matches,
+        instead of every event from every page. May be called from any thread.
+
+        Args:
+            events: Event methods to receive.
+            contexts: Only receive events for these browsing contexts
+                (default: all). Events that carry no context always match.
+
+        Returns:
+            A future resolving to the subscription id, for unsubscribe_soon().
+        """
+        params: Dict[str, Any] = {"events": list(events)}
+        if contexts is not None:
+            params["contexts"] = list(contexts)
+        result: asyncio.Future = self._loop.create_future()
+
+        def _queue() -> None:
+            msg_id, message, response = self._register("vibium:session.subscribe", params)
+            response.add_done_callback(lambda r: self._resolve_subscription(msg_id, r, result))
+            self._queue_message(message)
+
+        self._call_soon(_queue)
+        return result
+
+    def unsubscribe_soon(self, subscription: Union[str, asyncio.Future]) -> None:
+        """Drop a subscription (an id, or the future from subscribe_soon()).
+
+        May be called from any thread; the server stays in filtered mode.
+        """
+        def _queue(sub: Union[str, asyncio.Future]) -> None:
+            if isinstance(sub, asyncio.Future):
+                if not sub.done():
+                    sub.add_done_callback(_queue)
+                    return
+                if sub.cancelled() or sub.exception() is not None:
+                    return
+                sub = sub.result()
+            msg_id, message, response = self._register("vibium:session.unsubscribe", {"subscription": sub})
+            response.add_done_callback(lambda r: self._forget(msg_id, r))
+            self._queue_message(message)
+
+        self._call_soon(_queue, subscription)
+
+    def _call_soon(self, fn: Callable[..., None], *args: Any) -> None:
+        """Run fn on the client's loop: now if already there, else thread-safely."""
         try:
-            self._event_handlers.remove(handler)
-        except ValueError:
-            pass
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            fn(*args)
+        else:
+            self._loop.call_soon_threadsafe(fn, *args)
+
+    def _queue_message(self, message: str) -> None:
+        self._outbox.append(message)
+        if len(self._outbox) == 1:
+            # Nothing may be sent soon, so also flush on our own
+            self._loop.create_task(self._flush_outbox(quiet=True))
+
+    async def _flush_outbox(self, quiet: bool = False) -> None:
+        """Write queued commands, in order, before anything else is sent."""
+        try:
+            while self._outbox:
+                await self._write(self._outbox.popleft())
+        except ConnectionClosed:
+            if not quiet:
+                raise
+
+    def _forget(self, msg_id: int, response: asyncio.Future) -> None:
+        """Done-callback for queued commands whose response nobody awaits."""
+        self._release(msg_id)
+        if not response.cancelled():
+            response.exception()
+
+    def _resolve_subscription(self, msg_id: int, response: asyncio.Future, result: asyncio.Future) -> None:
+        self._forget(msg_id, response)
+        if result.done():
+            return
+        if response.cancelled():
+            result.cancel()
+        elif response.exception() is not None:
+            result.set_exception(response.exception())
+        else:
+            error = self._error_from(response.result())
+            if error is not None:
+                result.set_exception(error)
+            else:
+                result.set_result((response.result().get("result") or {}).get("subscription"))
+
+    def _matching_handlers(self, method: Optional[str], context: Optional[str]) -> List[EventHandler]:
+        """Collect the handlers subscribed to an event's method and context."""
+        matched: List[EventHandler] = []
+        for key in (method, None) if method is not None else (None,):
+            by_context = self._event_handlers.get(key)
+            if not by_context:
+                continue
+            if context is None:
+                for handlers in by_context.values():
+                    matched.extend(handlers)
+            else:
+                matched.extend(by_context.get(context, ()))
+                matched.extend(by_context.get(None, ()))
+        return matched
+
+    def _dispatch_event(self, event: Dict[str, Any]) -> None:
+        """Deliver an event to its subscribers."""
+        method = event.get("method")
+        handlers = self._matching_handlers(method, _event_context(event))
+        if not handlers:
+            return
+        start = time.perf_counter()
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                pass
+        self.metrics.handler(method or "", (time.perf_counter() - start) * 1000)
+
+    def _enqueue_event(self, event: Dict[str, Any]) -> None:
+        """Queue an event for delivery, applying its method's overflow policy."""
+        method = event.get("method", "")
+        policy = self._event_policies.get(method, "block")
+
+        key = None
+        if policy == "coalesce":
+            key = (method, _event_context(event))
+            entry = self._coalesce_slots.get(key)
+            if entry is not None:
+                entry[0] = event
+                self._events_coalesced[method] += 1
+                return
+
+        if policy != "block" and len(self._event_queue) >= self._event_queue_size:
+            if not self._drop_oldest_event():
+                # Everything queued must be kept, so this event is the oldest droppable one
+                self._events_dropped[method] += 1
+                return
+
+        entry = [event, key]
+        if key is not None:
+            self._coalesce_slots[key] = entry
+        if self._event_overflow or len(self._event_queue) >= self._event_queue_size:
+            self._event_overflow.append(entry)
+        else:
+            self._event_queue.append(entry)
+        self._events_ready.set()
+
+    def _drop_oldest_event(self) -> bool:
+        """Evict the oldest waiting event that may be dropped. Returns False if none."""
+        for queue in (self._event_queue, self._event_overflow):
+            for i, entry in enumerate(queue):
+                method = entry[0].get("method", "")
+                if self._event_policies.get(method, "block") != "block":
+                    del queue[i]
+                    if entry[1] is not None:
+                        self._coalesce_slots.pop(entry[1], None)
+                    self._events_dropped[method] += 1
+                    self._refill_event_queue()
+                    return True
+        return False
+
+    def _refill_event_queue(self) -> None:
+        """Move events waiting in the overflow into the queue, in order, while it has room."""
+        overflow, queue = self._event_overflow, self._event_queue
+        while overflow and len(queue) < self._event_queue_size:
+            queue.append(overflow.popleft())
+
+    async def _event_loop(self) -> None:
+        """Background task that delivers queued events to handlers."""
+        while True:
+            if not self._event_queue:
+                self._events_ready.clear()
+                await self._events_ready.wait()
+                continue
+
+            entry = self._event_queue.popleft()
+            if entry[1] is not None and self._coalesce_slots.get(entry[1]) is entry:
+                del self._coalesce_slots[entry[1]]
+            if self._event_overflow:
+                self._refill_event_queue()
+
+            self._dispatch_event(entry[0])
+            # Let the receive loop and command callers run between events
+            await asyncio.sleep(0)
 
     async def _receive_loop(self) -> None:
         """Background task to receive and dispatch messages."""
+        while True:
+            try:
+                while True:
+                    # decode=False hands the codec the raw UTF-8 frame as bytes
+                    await self._handle_frame(await self._ws.recv(decode=False))
+            except ConnectionClosed:
+                if self._resume_token is not None and await self._reconnect():
+                    continue
+                self._fail_pending()
+                return
+
+    def _fail_pending(self) -> None:
+        """Fail every command still waiting for a response.
+
+        send() callers forget their own entries; send_threadsafe() waiters
+        are forgotten here, since their threads cannot do it.
+        """
+        message = self._closed_message()
+        for msg_id, future in list(self._pending.items()):
+            if not future.done():
+                future.set_exception(ConnectionError(message))
+            if future.__class__ is _Waiter:
+                self._release(msg_id)
+
+    def _closed_message(self) -> str:
+        message = "Connection closed"
+        detail = self._close_detail()
+        return f"{message}\n{detail}" if detail else message
+
+    def _close_detail(self) -> str:
+        if self.close_detail is None:
+            return ""
+        try:
+            return self.close_detail()
+        except Exception:
+            return ""
+
+    async def _handle_frame(self, message: bytes) -> None:
+        self.metrics.received(len(message))
+        data = self._codec.decode(message)
+        msg_id = data.get("id")
+        future = self._pending.get(msg_id) if msg_id is not None else None
+        if future is not None and not future.done():
+            sent = self._sent_at.pop(msg_id, None)
+            if sent is not None:
+                method, started = sent
+                self.metrics.command(method, (time.perf_counter() - started) * 1000,
+                                     data.get("type") == "error")
+            self._in_flight_messages.pop(msg_id, None)
+            if future.__class__ is _Waiter:
+                # Its caller is on another thread and cannot release it here
+                del self._pending[msg_id]
+            future.set_result(data)
+        elif msg_id is None and "method" in data:
+            self.metrics.event(data["method"])
+            self._enqueue_event(data)
+
+    async def _reconnect(self) -> bool:
+        """Reattach to the server-side session with backoff; True on success."""
+        self._connected.clear()
+        deadline = self._loop.time() + (self._reconnect_timeout or 0) / 1000
+        separator = "&" if "?" in (self._url or "") else "?"
+        url = f"{self._url}{separator}resume={self._resume_token}"
+        delay = _RECONNECT_DELAY
+
+        while self._loop.time() < deadline:
+            try:
+                ws = await asyncio.wait_for(
+                    _open_websocket(url, self._max_frame_size, self._unix_socket),
+                    max(deadline - self._loop.time(), 0.001),
+                )
+            except (OSError, InvalidHandshake, asyncio.TimeoutError):
+                await asyncio.sleep(min(delay * random.uniform(0.5, 1.0), max(deadline - self._loop.time(), 0)))
+                delay = min(delay * 2, _RECONNECT_MAX_DELAY)
+                continue
+
+            if await self._resume_on(ws, max(deadline - self._loop.time(), _TIMEOUT_GRACE / 1000)):
+                self._ws = ws
+                self._reconnects += 1
+                self._replay_in_flight()
+                self._connected.set()
+                return True
+            # The session is gone (the server started a fresh browser instead)
+            await ws.close()
+            break
+
+        self._resume_token = None
+        self._connected.set()
+        return False
+
+    async def _resume_on(self, ws: ClientConnection, timeout: float) -> bool:
+        """Check that a new connection was attached to our old session."""
+        msg_id, message, future = self._register("vibium:session.resumable", {"timeout": self._reconnect_timeout})
+        try:
+            async def _handshake() -> Dict[str, Any]:
+                await ws.send(message)
+                while not future.done():
+                    await self._handle_frame(await ws.recv(decode=False))
+                return future.result()
+
+            response = await asyncio.wait_for(_handshake(), timeout)
+        except (ConnectionClosed, asyncio.TimeoutError):
+            return False
+        finally:
+            self._release(msg_id)
+        result = response.get("result") or {}
+        return self._error_from(response) is None and result.get("token") == self._resume_token
+
+    def _replay_in_flight(self) -> None:
+        """Resend replayable commands whose responses were lost; fail the rest."""
+        for msg_id, future in list(self._pending.items()):
+            if future.done():
+                continue
+            method = self._sent_at.get(msg_id, ("", 0.0))[0]
+            message = self._in_flight_messages.get(msg_id)
+            if method in REPLAYABLE_COMMANDS and message is not None:
+                self._loop.create_task(self._write(message))
+            else:
+                future.set_exception(ConnectionError(f"Connection lost while waiting for {method}"))
+                # The server may still answer it on the new socket; ignore that reply
+                self._release(msg_id)
+
+    async def _write(self, message: str) -> None:
+        """Write a frame, waiting out a reconnect if one is in progress."""
+        if not self._connected.is_set():
+            await self._connected.wait()
         try:
-            async for message in self._ws:
-                data = json.loads(message)
-                msg_id = data.get("id")
-                if msg_id is not None and msg_id in self._pending:
-                    self._pending[msg_id].set_result(data)
-                elif msg_id is None and "method" in data:
-                    # Event message — dispatch to handlers
-                    for handler in self._event_handlers:
-                        try:
-                            handler(data)
-                        except Exception:
-                            pass
+            await self._ws.send(message)
         except ConnectionClosed:
-            for future in self._pending.values():
-                if not future.done():
-                    future.set_exception(ConnectionError("Connection closed"))
+            if self._resume_token is None:
+                raise
+            # The receive loop is reconnecting; it will replay or fail this command
 
-    async def send(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        """Send a command and wait for the response."""
-        msg_id = self._next_id
-        self._next_id += 1
+    def _register(self, method: str, params: Optional[Dict[str, Any]]) -> Tuple[int, str, asyncio.Future]:
+        """Allocate an id and pending future for a command, returning its wire form."""
+        msg_id, message = self._encode(method, params)
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._track(msg_id, method, message, future)
+        return msg_id, message, future
 
+    def _encode(self, method: str, params: Optional[Dict[str, Any]]) -> Tuple[int, str]:
+        """Allocate an id for a command and return its wire form. Safe from any thread."""
+        msg_id = next(self._ids)
         command = {
             "id": msg_id,
             "method": method,
             "params": params or {},
         }
+        return msg_id, self._codec.encode(command)
 
-        future: asyncio.Future = asyncio.get_event_loop().create_future()
+    def _track(self, msg_id: int, method: str, message: str, future: Union[asyncio.Future, _Waiter]) -> None:
+        """Record a command as in flight until its response arrives."""
         self._pending[msg_id] = future
+        # Count UTF-8 bytes; isascii() is O(1), so the usual case skips encoding
+        self.metrics.sent(len(message) if message.isascii() else len(message.encode()))
+        self._sent_at[msg_id] = (method, time.perf_counter())
+        if self._resume_token is not None:
+            self._in_flight_messages[msg_id] = message
+
+    def _release(self, msg_id: int) -> None:
+        """Forget a command that was answered, timed out or cancelled."""
+        self._pending.pop(msg_id, None)
+        self._sent_at.pop(msg_id, None)
+        self._in_flight_messages.pop(msg_id, None)
+
+    @staticmethod
+    def _error_from(response: Dict[str, Any]) -> Optional[BiDiError]:
+        """Return a BiDiError if the response is an error response."""
+        if response.get("type") == "error":
+            return BiDiError(
+                response.get("error", "unknown"),
+                response.get("message", "Unknown error"),
+            )
+        return None
+
+    async def send(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ) -> Any:
+        """Send a command and wait for the response.
+
+        Args:
+            method: BiDi or vibium: command name.
+            params: Command parameters.
+            timeout: Time to wait for the response in milliseconds (default:
+                the client's command_timeout, bounded by any active deadline).
+
+        Raises:
+            BiDiError: If the command fails.
+            TimeoutError: If no response arrives in time. The pending entry is
+                dropped; a late response is ignored.
+        """
+        wait = self._wait_time(method, params, timeout)
+        if wait is not None and wait <= 0:
+            self._timed_out[method] += 1
+            raise TimeoutError(f"Deadline exceeded before sending {method}")
+
+        msg_id, message, future = self._register(method, params)
 
         try:
-            await self._ws.send(json.dumps(command))
-            response = await future
+            if self._outbox:
+                await self._flush_outbox()
+            await self._write(message)
+            try:
+                response = await asyncio.wait_for(future, wait)
+            except asyncio.TimeoutError:
+                self._timed_out[method] += 1
+                raise TimeoutError(f"Timeout after {wait * 1000:.0f}ms waiting for {method}") from None
 
-            if response.get("type") == "error":
-                raise BiDiError(
-                    response.get("error", "unknown"),
-                    response.get("message", "Unknown error"),
-                )
+            error = self._error_from(response)
+            if error is not None:
+                raise error
 
             return response.get("result")
+        except asyncio.CancelledError:
+            self._cancelled[method] += 1
+            raise
+        finally:
+            self._release(msg_id)
+
+    async def send_command(self, command: _Command) -> Any:
+        """Send a built command and return its result field."""
+        return command.result(await self.send(command.method, command.params))
+
+    def send_threadsafe(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+    ) -> Any:
+        """Send a command from another thread and block until the response.
+
+        The calling thread encodes the command and then sleeps on a lock;
+        the client's loop only queues the frame for writing and wakes the
+        caller when the response arrives, without creating a coroutine,
+        task or future for the call. Must not be called from the client's
+        own loop. Raises the same errors as send().
+        """
+        wait = self._wait_time(method, params, timeout)
+        if wait is not None and wait <= 0:
+            self._loop.call_soon_threadsafe(self._count_timeout, method)
+            raise TimeoutError(f"Deadline exceeded before sending {method}")
+
+        msg_id, message = self._encode(method, params)
+        waiter = _Waiter()
+        self._loop.call_soon_threadsafe(self._submit, msg_id, method, message, waiter)
+        try:
+            done = waiter.wait(wait)
+        except BaseException:
+            self._loop.call_soon_threadsafe(self._release, msg_id)
+            raise
+        if not done:
+            self._loop.call_soon_threadsafe(self._abandon, msg_id, method)
+            raise TimeoutError(f"Timeout after {wait * 1000:.0f}ms waiting for {method}")
+
+        response = waiter.result()
+        error = self._error_from(response)
+        if error is not None:
+            raise error
+        return response.get("result")
+
+    def _submit(self, msg_id: int, method: str, message: str, waiter: _Waiter) -> None:
+        """Loop side of send_threadsafe(): track the command and queue its frame."""
+        if self.closed:
+            waiter.set_exception(ConnectionError(self._closed_message()))
+            return
+        self._track(msg_id, method, message, waiter)
+        self._queue_message(message)
+
+    def _abandon(self, msg_id: int, method: str) -> None:
+        """Drop a send_threadsafe() command whose caller stopped waiting."""
+        self._release(msg_id)
+        self._count_timeout(method)
+
+    def _count_timeout(self, method: str) -> None:
+        self._timed_out[method] += 1
+
+    async def send_many(
+        self,
+        commands: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        timeout: Optional[int] = None,
+    ) -> List[Any]:
+        """Send several commands back to back and wait for all responses.
+
+        Commands are written without waiting for each reply, so the whole
+        batch costs roughly one round trip. Results are returned in the same
+        order as ``commands``; a command that fails has its exception
+        (usually a BiDiError, or TimeoutError if it did not answer within
+        ``timeout`` ms) in its slot instead of a result.
+        """
+        ids: List[int] = []
+        futures: List[asyncio.Future] = []
+        methods: List[str] = []
+        wait: Optional[float] = 0.0
+
+        try:
+            if self._outbox:
+                await self._flush_outbox()
+            for method, params in commands:
+                command_wait = self._wait_time(method, params, timeout)
+                if wait is not None:
+                    wait = None if command_wait is None else max(wait, command_wait)
+                msg_id, message, future = self._register(method, params)
+                ids.append(msg_id)
+                futures.append(future)
+                methods.append(method)
+                await self._write(message)
+
+            if futures:
+                await asyncio.wait(futures, timeout=wait)
+        except asyncio.CancelledError:
+            for method in methods:
+                self._cancelled[method] += 1
+            raise
         finally:
-            self._pending.pop(msg_id, None)
+            for msg_id in ids:
+                self._release(msg_id)
+
+        results: List[Any] = []
+        for method, future in zip(methods, futures):
+            if not future.done():
+                future.cancel()
+                self._timed_out[method] += 1
+                results.append(TimeoutError(f"Timeout waiting for {method}"))
+                continue
+            if future.exception() is not None:
+                results.append(future.exception())
+                continue
+            response = future.result()
+            error = self._error_from(response)
+            results.append(error if error is not None else response.get("result"))
+        return results
+
+    async def send_streamed(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]],
+        sink: Union[str, os.PathLike, BinaryIO],
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> int:
+        """Send a command whose large result is read back in chunks.
+
+        The server holds the result and returns a stream handle; each chunk
+        is decoded and written to ``sink`` (a path or binary file object)
+        as it arrives, so the full base64 payload is never in memory.
+
+        Returns:
+            Number of bytes written.
+        """
+        result = await self.send(method, {**(params or {}), "stream": True})
+        stream = result["stream"]
+
+        if isinstance(sink, (str, os.PathLike)):
+            with open(sink, "wb") as f:
+                return await self._read_stream(stream, f, chunk_size)
+        return await self._read_stream(stream, sink, chunk_size)
+
+    async def _read_stream(self, stream: str, sink: BinaryIO, chunk_size: int) -> int:
+        written = 0
+        try:
+            while True:
+                chunk = await self.send("vibium:stream.read", {"stream": stream, "size": chunk_size})
+                data = base64.b64decode(chunk["data"])
+                sink.write(data)
+                written += len(data)
+                if chunk.get("eof"):
+                    return written
+        except BaseException:
+            # Release the server-side buffer if we stop early
+            asyncio.ensure_future(self._close_stream(stream))
+            raise
+
+    async def _close_stream(self, stream: str) -> None:
+        try:
+            await self.send("vibium:stream.close", {"stream": stream})
+        except Exception:
+            pass
 
     async def close(self) -> None:
         """Close the WebSocket connection."""
-        if self._receiver_task:
-            self._receiver_task.cancel()
-            try:
-                await self._receiver_task
-            except asyncio.CancelledError:
-                pass
+        self._resume_token = None
+        for task in (self._receiver_task, self._event_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._connected.set()
+        self._fail_pending()
 
         await self._ws.close()
@@ -1,14 +1,21 @@
 """Vibium sync API (internal re-exports)."""
 
+# Imported eagerly: importing the browser submodule would otherwise bind the
+# module, not the launcher, to the package attribute "browser"
 from .browser import browser, Browser
-from .page import Page, Keyboard, Mouse, Touch
-from .element import Element
-from .element_list import ElementList
-from .context import BrowserContext
-from .clock import Clock
-from .tracing import Tracing
-from .route import Route
-from .dialog import Dialog
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .page import Page, Keyboard, Mouse, Touch
+    from .element import Element
+    from .element_list import ElementList
+    from .context import BrowserContext
+    from .pool import BrowserPool
+    from ._parallel import parallel
+    from .clock import Clock
+    from .tracing import Tracing
+    from .route import Route
+    from .dialog import Dialog
 
 __all__ = [
     "browser",
@@ -20,8 +27,41 @@ __all__ = [
     "Element",
     "ElementList",
     "BrowserContext",
+    "BrowserPool",
+    "parallel",
     "Clock",
     "Tracing",
     "Route",
     "Dialog",
 ]
+
+# name -> defining module; imported on first access, see vibium/__init__.py
+_LAZY = {
+    "Page": ".page",
+    "Keyboard": ".page",
+    "Mouse": ".page",
+    "Touch": ".page",
+    "Element": ".element",
+    "ElementList": ".element_list",
+    "BrowserContext": ".context",
+    "BrowserPool": ".pool",
+    "parallel": "._parallel",
+    "Clock": ".clock",
+    "Tracing": ".tracing",
+    "Route": ".route",
+    "Dialog": ".dialog",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
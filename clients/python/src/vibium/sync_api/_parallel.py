@@ -0,0 +1,49 @@
+"""Drive several pages at once from the sync API."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Threads used when max_workers is not given, at most one per page. The
+# threads mostly wait on the browser, so this can exceed the CPU count.
+DEFAULT_MAX_WORKERS = 32
+
+
+def parallel(
+    pages: Iterable[T],
+    fn: Callable[[T], Any],
+    max_workers: Optional[int] = None,
+) -> List[Any]:
+    """Call fn(page) for every page from a thread pool and wait for all of them.
+
+    A sync call only blocks its own thread, so the pages (of one browser or
+    several) make progress together while the event loop threads handle
+    their I/O.
+
+    Usage:
+        def scrape(vibe):
+            vibe.go(url)
+            return vibe.title()
+
+        titles = vibium.parallel([bro.new_page() for _ in range(4)], scrape)
+
+    Args:
+        pages: The pages (or anything else) to pass to fn, one call each.
+        fn: A sync function taking one page.
+        max_workers: Threads to use (default: one per page, at most
+            DEFAULT_MAX_WORKERS); further pages wait for a free thread.
+
+    Returns:
+        One entry per page, in order: fn's result, or the exception it
+        raised, so one failing page does not lose the others' results.
+    """
+    pages = list(pages)
+    if not pages:
+        return []
+    workers = max_workers or min(len(pages), DEFAULT_MAX_WORKERS)
+    with ThreadPoolExecutor(workers, thread_name_prefix="vibium-parallel") as executor:
+        futures = [executor.submit(fn, page) for page in pages]
+    return [future.result() if future.exception() is None else future.exception() for future in futures]
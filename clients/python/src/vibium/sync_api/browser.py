@@ -2,66 +2,99 @@
 
 from __future__ import annotations
 
-from typing import Callable, List, Optional, TYPE_CHECKING
-
-from .page import Page
-from .context import BrowserContext
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Any
+    from .page import Page
+    from .context import BrowserContext
     from .._sync_base import _EventLoopThread
     from ..async_api.browser import Browser as AsyncBrowser
 
 
 class Browser:
-    """Synchronous wrapper for async Browser."""
+    """Synchronous wrapper for async Browser.
+
+    Sync browsers share a small set of event loop threads (see
+    vibium.set_loop_threads), and may be driven from several threads at once.
+    """
+
+    def __init__(self, async_browser: AsyncBrowser, loop_thread: _EventLoopThread, owns_loop: bool = True) -> None:
+        from .._sync_base import _SerialCallbacks
 
-    def __init__(self, async_browser: AsyncBrowser, loop_thread: _EventLoopThread) -> None:
         self._async = async_browser
         self._loop = loop_thread
+        # on_page/on_popup callbacks run here, off the loop thread
+        self._callbacks = _SerialCallbacks()
+        # Whether this browser holds a reference on the shared loop thread
+        # (False for BrowserPool browsers; the pool holds it)
+        self._owns_loop = owns_loop
+        self._closed = False
+
+    @property
+    def startup_timings(self) -> Dict[str, float]:
+        """Milliseconds from launch to each startup phase."""
+        return self._async.startup_timings
 
     def page(self) -> Page:
         """Get the default page (first browsing context)."""
+        from .page import Page
         async_page = self._loop.run(self._async.page())
-        return Page(async_page, self._loop)
+        return Page._wrap(async_page, self._loop)
 
     def new_page(self) -> Page:
         """Create a new page (tab) in the default context."""
+        from .page import Page
         async_page = self._loop.run(self._async.new_page())
-        return Page(async_page, self._loop)
+        return Page._wrap(async_page, self._loop)
 
     def new_context(self) -> BrowserContext:
         """Create a new browser context (isolated, incognito-like)."""
+        from .context import BrowserContext
         async_ctx = self._loop.run(self._async.new_context())
         return BrowserContext(async_ctx, self._loop)
 
     def pages(self) -> List[Page]:
         """Get all open pages."""
+        from .page import Page
         async_pages = self._loop.run(self._async.pages())
-        return [Page(p, self._loop) for p in async_pages]
+        return [Page._wrap(p, self._loop) for p in async_pages]
 
     def on_page(self, callback: Callable[[Page], None]) -> None:
-        """Register a callback for when a new page is created."""
+        """Register a callback for when a new page is created.
+
+        Callbacks run one at a time on a worker thread, not the event loop
+        thread, so they may use the sync API.
+        """
+        from .page import Page
+
         def _wrapper(async_page: Any) -> None:
-            sync_page = Page(async_page, self._loop)
-            callback(sync_page)
-        self._async.on_page(_wrapper)
+            self._callbacks.submit(callback, Page._wrap(async_page, self._loop))
+        self._loop.call(self._async.on_page, _wrapper)
 
     def on_popup(self, callback: Callable[[Page], None]) -> None:
-        """Register a callback for when a popup is opened."""
+        """Register a callback for when a popup is opened. See on_page."""
+        from .page import Page
+
         def _wrapper(async_page: Any) -> None:
-            sync_page = Page(async_page, self._loop)
-            callback(sync_page)
-        self._async.on_popup(_wrapper)
+            self._callbacks.submit(callback, Page._wrap(async_page, self._loop))
+        self._loop.call(self._async.on_popup, _wrapper)
 
     def remove_all_listeners(self, event: Optional[str] = None) -> None:
         """Remove all listeners for 'page', 'popup', or all."""
-        self._async.remove_all_listeners(event)
+        self._loop.call(self._async.remove_all_listeners, event)
 
     def close(self) -> None:
-        """Close the browser and clean up."""
-        self._loop.run(self._async.close())
-        self._loop.stop()
+        """Close the browser and clean up. Closing it again does nothing."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._loop.run(self._async.close())
+        finally:
+            if self._owns_loop:
+                from .._sync_base import _loop_threads
+                _loop_threads.release(self._loop)
 
 
 class _BrowserLauncher:
@@ -72,21 +105,104 @@ class _BrowserLauncher:
         headless: bool = False,
         port: Optional[int] = None,
         executable_path: Optional[str] = None,
+        command_timeout: Optional[int] = 60000,
+        max_frame_size: Optional[int] = 64 * 1024 * 1024,
+        connections: int = 1,
+        reconnect_timeout: Optional[int] = None,
+        startup_timeout: Optional[int] = 30000,
+        log_output: bool = False,
+        unix_socket: bool = False,
     ) -> Browser:
-        """Launch a new browser instance."""
-        from .._sync_base import _EventLoopThread
+        """Launch a new browser instance. See async_api browser.launch for options."""
+        from .._sync_base import _loop_threads
         from ..async_api.browser import browser as async_browser_launcher
 
-        loop_thread = _EventLoopThread()
-        loop_thread.start()
+        loop_thread = _loop_threads.acquire()
+
+        try:
+            async_browser = loop_thread.run(
+                async_browser_launcher.launch(
+                    headless=headless,
+                    port=port,
+                    executable_path=executable_path,
+                    command_timeout=command_timeout,
+                    max_frame_size=max_frame_size,
+                    connections=connections,
+                    reconnect_timeout=reconnect_timeout,
+                    startup_timeout=startup_timeout,
+                    log_output=log_output,
+                    unix_socket=unix_socket,
+                )
+            )
+        except BaseException:
+            _loop_threads.release(loop_thread)
+            raise
+        return Browser(async_browser, loop_thread)
+
+    def connect(
+        self,
+        url: str,
+        command_timeout: Optional[int] = 60000,
+        max_frame_size: Optional[int] = 64 * 1024 * 1024,
+        connections: int = 1,
+        reconnect_timeout: Optional[int] = None,
+        startup_timeout: Optional[int] = 30000,
+        unix_socket: Optional[str] = None,
+    ) -> Browser:
+        """Attach to a running vibium server. See async_api browser.connect."""
+        from .._sync_base import _loop_threads
+        from ..async_api.browser import browser as async_browser_launcher
+
+        loop_thread = _loop_threads.acquire()
+
+        try:
+            async_browser = loop_thread.run(
+                async_browser_launcher.connect(
+                    url,
+                    command_timeout=command_timeout,
+                    max_frame_size=max_frame_size,
+                    connections=connections,
+                    reconnect_timeout=reconnect_timeout,
+                    startup_timeout=startup_timeout,
+                    unix_socket=unix_socket,
+                )
+            )
+        except BaseException:
+            _loop_threads.release(loop_thread)
+            raise
+        return Browser(async_browser, loop_thread)
+
+    def launch_shared(
+        self,
+        headless: bool = False,
+        executable_path: Optional[str] = None,
+        idle_timeout: Optional[int] = 600000,
+        prewarm: int = 1,
+        command_timeout: Optional[int] = 60000,
+        max_frame_size: Optional[int] = 64 * 1024 * 1024,
+        startup_timeout: Optional[int] = 30000,
+    ) -> Browser:
+        """Attach to this user's shared vibium server. See async_api browser.launch_shared."""
+        from .._sync_base import _loop_threads
+        from ..async_api.browser import browser as async_browser_launcher
 
-        async_browser = loop_thread.run(
-            async_browser_launcher.launch(
-                headless=headless,
-                port=port,
-                executable_path=executable_path,
+        loop_thread = _loop_threads.acquire()
+
+        try:
+            async_browser = loop_thread.run(
+                async_browser_launcher.launch_shared(
+                    headless=headless,
+                    executable_path=executable_path,
+                    idle_timeout=idle_timeout,
+                    prewarm=prewarm,
+                    command_timeout=command_timeout,
+                    max_frame_size=max_frame_size,
+                    startup_timeout=startup_timeout,
+                )
             )
-        )
+        except BaseException:
+            _loop_threads.release(loop_thread)
+            raise
         return Browser(async_browser, loop_thread)
 
 
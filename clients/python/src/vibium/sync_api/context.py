@@ -4,10 +4,10 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
-from .._types import Cookie, SetCookieParam, StorageState
 from .tracing import Tracing
 
 if TYPE_CHECKING:
+    from .._types import Cookie, SetCookieParam, StorageState
     from .._sync_base import _EventLoopThread
     from ..async_api.context import BrowserContext as AsyncBrowserContext
     from .page import Page
@@ -34,7 +34,7 @@ class BrowserContext:
     def new_page(self) -> Page:
         from .page import Page
         async_page = self._loop.run(self._async.new_page())
-        return Page(async_page, self._loop)
+        return Page._wrap(async_page, self._loop)
 
     def close(self) -> None:
         self._loop.run(self._async.close())
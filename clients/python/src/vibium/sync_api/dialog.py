@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..async_api.dialog import Dialog as AsyncDialog
@@ -12,12 +12,28 @@ class Dialog:
     """Sync wrapper for a browser dialog.
 
     The user's handler calls accept() or dismiss() to set the decision.
-    If none is called, the default is 'dismiss'.
+    If none is called, the default is 'dismiss'. The first decision is sent
+    as soon as it is made, closing the dialog before the handler returns;
+    later calls are ignored.
     """
 
-    def __init__(self, async_dialog: AsyncDialog) -> None:
+    def __init__(
+        self,
+        async_dialog: AsyncDialog,
+        on_decision: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
         self._async = async_dialog
         self._decision: Dict[str, Any] = {"action": "dismiss"}
+        self._decided = False
+        self._on_decision = on_decision
+
+    def _decide(self, decision: Dict[str, Any]) -> None:
+        if self._decided:
+            return
+        self._decided = True
+        self._decision = decision
+        if self._on_decision is not None:
+            self._on_decision(decision)
 
     def type(self) -> str:
         return self._async.type()
@@ -29,7 +45,7 @@ class Dialog:
         return self._async.default_value()
 
     def accept(self, prompt_text: Optional[str] = None) -> None:
-        self._decision = {"action": "accept", "prompt_text": prompt_text}
+        self._decide({"action": "accept", "prompt_text": prompt_text})
 
     def dismiss(self) -> None:
-        self._decision = {"action": "dismiss"}
+        self._decide({"action": "dismiss"})
@@ -4,9 +4,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
-from .._types import BoundingBox
-
 if TYPE_CHECKING:
+    from .._types import BoundingBox
     from .._sync_base import _EventLoopThread
     from ..async_api.element import Element as AsyncElement
     from .element_list import ElementList
@@ -76,21 +75,26 @@ class Element:
         self._loop.run(self._async.set_files(files, timeout))
 
     # --- State ---
+    # Single-command getters go through _send, which skips the coroutine
+    # round trip; they are often called in tight polling loops.
+
+    def _send(self, name: str, extra: Optional[Dict[str, Any]] = None) -> Any:
+        return self._loop.send(self._async._client, self._async._state_command(name, extra))
 
     def text(self) -> str:
-        return self._loop.run(self._async.text())
+        return self._send("text")
 
     def inner_text(self) -> str:
-        return self._loop.run(self._async.inner_text())
+        return self._send("inner_text")
 
     def html(self) -> str:
-        return self._loop.run(self._async.html())
+        return self._send("html")
 
     def value(self) -> str:
-        return self._loop.run(self._async.value())
+        return self._send("value")
 
     def attr(self, name: str) -> Optional[str]:
-        return self._loop.run(self._async.attr(name))
+        return self._send("attr", {"name": name})
 
     def get_attribute(self, name: str) -> Optional[str]:
         return self.attr(name)
@@ -102,25 +106,25 @@ class Element:
         return self.bounds()
 
     def is_visible(self) -> bool:
-        return self._loop.run(self._async.is_visible())
+        return self._send("is_visible")
 
     def is_hidden(self) -> bool:
-        return self._loop.run(self._async.is_hidden())
+        return self._send("is_hidden")
 
     def is_enabled(self) -> bool:
-        return self._loop.run(self._async.is_enabled())
+        return self._send("is_enabled")
 
     def is_checked(self) -> bool:
-        return self._loop.run(self._async.is_checked())
+        return self._send("is_checked")
 
     def is_editable(self) -> bool:
-        return self._loop.run(self._async.is_editable())
+        return self._send("is_editable")
 
     def role(self) -> str:
-        return self._loop.run(self._async.role())
+        return self._send("role")
 
     def label(self) -> str:
-        return self._loop.run(self._async.label())
+        return self._send("label")
 
     def eval(self, fn: str) -> Any:
         return self._loop.run(self._async.eval(fn))
@@ -2,37 +2,53 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
+import os
+import threading
+import weakref
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
-from .._types import A11yNode
 from .element import Element
 from .element_list import ElementList
 from .clock import Clock
 from .route import Route
+from .._sync_base import _SerialCallbacks
 
 if TYPE_CHECKING:
+    from .._types import A11yNode, _Command
     from .._sync_base import _EventLoopThread
     from ..async_api.page import Page as AsyncPage
 
 
+# async Page -> its sync wrapper, while the wrapper is in use; see Page._wrap
+_wrappers: weakref.WeakValueDictionary[AsyncPage, Page] = weakref.WeakValueDictionary()
+_wrappers_lock = threading.Lock()
+
+
 class Keyboard:
-    """Sync keyboard input."""
+    """Sync keyboard input.
+
+    Input is often a long run of tiny commands, so these send directly
+    (see _EventLoopThread.send) instead of running the async methods.
+    """
 
     def __init__(self, async_keyboard: Any, loop_thread: _EventLoopThread) -> None:
         self._async = async_keyboard
         self._loop = loop_thread
 
+    def _send(self, command: _Command) -> None:
+        self._loop.send(self._async._client, command)
+
     def press(self, key: str) -> None:
-        self._loop.run(self._async.press(key))
+        self._send(self._async._key_command("press", key))
 
     def down(self, key: str) -> None:
-        self._loop.run(self._async.down(key))
+        self._send(self._async._key_command("down", key))
 
     def up(self, key: str) -> None:
-        self._loop.run(self._async.up(key))
+        self._send(self._async._key_command("up", key))
 
     def type(self, text: str) -> None:
-        self._loop.run(self._async.type(text))
+        self._send(self._async._type_command(text))
 
 
 class Mouse:
@@ -42,20 +58,23 @@ class Mouse:
         self._async = async_mouse
         self._loop = loop_thread
 
+    def _send(self, command: _Command) -> None:
+        self._loop.send(self._async._client, command)
+
     def click(self, x: float, y: float) -> None:
-        self._loop.run(self._async.click(x, y))
+        self._send(self._async._point_command("click", x, y))
 
     def move(self, x: float, y: float) -> None:
-        self._loop.run(self._async.move(x, y))
+        self._send(self._async._point_command("move", x, y))
 
     def down(self) -> None:
-        self._loop.run(self._async.down())
+        self._send(self._async._button_command("down"))
 
     def up(self) -> None:
-        self._loop.run(self._async.up())
+        self._send(self._async._button_command("up"))
 
     def wheel(self, delta_x: float, delta_y: float) -> None:
-        self._loop.run(self._async.wheel(delta_x, delta_y))
+        self._send(self._async._wheel_command(delta_x, delta_y))
 
 
 class Touch:
@@ -66,7 +85,7 @@ class Touch:
         self._loop = loop_thread
 
     def tap(self, x: float, y: float) -> None:
-        self._loop.run(self._async.tap(x, y))
+        self._loop.send(self._async._client, self._async._tap_command(x, y))
 
 
 class Page:
@@ -84,6 +103,21 @@ class Page:
         # Sync event state
         self._console_messages: List[Dict[str, str]] = []
         self._errors: List[Dict[str, str]] = []
+        # Route and dialog callbacks run here, off the loop thread
+        self._callbacks = _SerialCallbacks()
+
+    @classmethod
+    def _wrap(cls, async_page: AsyncPage, loop_thread: _EventLoopThread) -> Page:
+        """Return the sync Page for an async one, creating it on first use.
+
+        Async pages are unique per browsing context, and so are their
+        wrappers, which keep the page's collected events and callback order.
+        """
+        with _wrappers_lock:
+            page = _wrappers.get(async_page)
+            if page is None:
+                page = _wrappers[async_page] = cls(async_page, loop_thread)
+            return page
 
     @property
     def id(self) -> str:
@@ -105,14 +139,26 @@ class Page:
 
     # --- Info ---
 
+    # Single-command getters go through _send, which skips the coroutine
+    # round trip; they are often called in tight polling loops.
+
+    def _send(self, command: _Command) -> Any:
+        return self._loop.send(self._async._client, command)
+
     def url(self) -> str:
-        return self._loop.run(self._async.url())
+        return self._send(self._async._info_command("url"))
 
     def title(self) -> str:
-        return self._loop.run(self._async.title())
+        return self._send(self._async._info_command("title"))
+
+    def content(self, path: Optional[Union[str, os.PathLike, BinaryIO]] = None) -> Optional[str]:
+        return self._loop.run(self._async.content(path))
 
-    def content(self) -> str:
-        return self._loop.run(self._async.content())
+    # --- Batching ---
+
+    def batch(self, commands: Sequence[Union[str, Tuple[str, Dict[str, Any]]]]) -> List[Any]:
+        """Send several commands in one pipelined round trip. See async Page.batch."""
+        return self._loop.run(self._async.batch(commands))
 
     # --- Finding ---
 
@@ -202,16 +248,17 @@ class Page:
         self,
         full_page: Optional[bool] = None,
         clip: Optional[Dict[str, Any]] = None,
-    ) -> bytes:
-        return self._loop.run(self._async.screenshot(full_page=full_page, clip=clip))
+        path: Optional[Union[str, os.PathLike, BinaryIO]] = None,
+    ) -> Optional[bytes]:
+        return self._loop.run(self._async.screenshot(full_page=full_page, clip=clip, path=path))
 
-    def pdf(self) -> bytes:
-        return self._loop.run(self._async.pdf())
+    def pdf(self, path: Optional[Union[str, os.PathLike, BinaryIO]] = None) -> Optional[bytes]:
+        return self._loop.run(self._async.pdf(path))
 
     # --- Evaluation ---
 
     def eval(self, expression: str) -> Any:
-        return self._loop.run(self._async.eval(expression))
+        return self._send(self._async._eval_command(expression))
 
     def evaluate(self, script: str) -> Any:
         """Execute a JS script (multi-statement, use 'return' for values)."""
@@ -265,13 +312,13 @@ class Page:
 
     def frames(self) -> List[Page]:
         async_frames = self._loop.run(self._async.frames())
-        return [Page(f, self._loop) for f in async_frames]
+        return [Page._wrap(f, self._loop) for f in async_frames]
 
     def frame(self, name_or_url: str) -> Optional[Page]:
         async_frame = self._loop.run(self._async.frame(name_or_url))
         if async_frame is None:
             return None
-        return Page(async_frame, self._loop)
+        return Page._wrap(async_frame, self._loop)
 
     def main_frame(self) -> Page:
         return self
@@ -297,7 +344,13 @@ class Page:
           - 'continue' — pass through
           - 'abort' — block the request
           - dict — static fulfill ({status, body, headers})
-          - callable — handler function receiving Route
+          - callable — handler function receiving Route. It runs on a
+            worker thread, after this page's earlier callbacks; its decision
+            is sent as soon as it is made (or on return, by default).
+
+        A handler may call the sync API. While it waits on a call, this
+        page's later callbacks may start, so a handler can load another
+        routed URL, e.g. with evaluate(), without blocking behind itself.
         """
         if isinstance(action, str):
             if action == "abort":
@@ -316,19 +369,24 @@ class Page:
             self._loop.run(self._async.route(pattern, _fulfill_handler))
         else:
             # Callable handler — use sync decision pattern
-            def _sync_callback(async_route: Any) -> None:
-                sync_route = Route(async_route)
-                action(sync_route)
-                decision = sync_route._decision
-                import asyncio
-                if decision["action"] == "fulfill":
-                    opts = {k: v for k, v in decision.items() if k != "action" and v is not None}
-                    asyncio.ensure_future(async_route.fulfill(**opts))
-                elif decision["action"] == "abort":
-                    asyncio.ensure_future(async_route.abort())
-                else:
+            def _handle(async_route: Any) -> None:
+                def _apply(decision: Dict[str, Any]) -> None:
                     opts = {k: v for k, v in decision.items() if k != "action" and v is not None}
-                    asyncio.ensure_future(async_route.continue_(**opts))
+                    if decision["action"] == "fulfill":
+                        self._loop.spawn(async_route.fulfill(**opts))
+                    elif decision["action"] == "abort":
+                        self._loop.spawn(async_route.abort())
+                    else:
+                        self._loop.spawn(async_route.continue_(**opts))
+
+                sync_route = Route(async_route, _apply)
+                try:
+                    action(sync_route)
+                finally:
+                    sync_route._decide({"action": "continue"})  # unless the handler decided
+
+            def _sync_callback(async_route: Any) -> None:
+                self._callbacks.submit(_handle, async_route)
 
             self._loop.run(self._async.route(pattern, _sync_callback))
 
@@ -376,7 +434,13 @@ class Page:
         action can be:
           - 'accept' — auto-accept
           - 'dismiss' — auto-dismiss
-          - callable — handler function receiving Dialog (sync)
+          - callable — handler function receiving Dialog (sync). It runs
+            on a worker thread, like route handlers, and its decision is
+            sent as soon as it is made.
+
+        An open dialog pauses script on the page, so a handler should
+        accept() or dismiss() it before calling methods that run script
+        there, such as evaluate().
         """
         from .dialog import Dialog as SyncDialog
 
@@ -386,25 +450,31 @@ class Page:
                     await dialog.accept()
                 else:
                     await dialog.dismiss()
-            self._async.on_dialog(_simple_handler)
+            self._loop.call(self._async.on_dialog, _simple_handler)
         else:
+            def _handle(dialog: Any) -> None:
+                def _apply(decision: Dict[str, Any]) -> None:
+                    if decision["action"] == "accept":
+                        self._loop.spawn(dialog.accept(decision.get("prompt_text")))
+                    else:
+                        self._loop.spawn(dialog.dismiss())
+
+                sync_dialog = SyncDialog(dialog, _apply)
+                try:
+                    action(sync_dialog)
+                finally:
+                    sync_dialog._decide({"action": "dismiss"})  # unless the handler decided
+
             def _sync_callback(dialog: Any) -> None:
-                sync_dialog = SyncDialog(dialog)
-                action(sync_dialog)
-                decision = sync_dialog._decision
-                import asyncio
-                if decision["action"] == "accept":
-                    asyncio.ensure_future(dialog.accept(decision.get("prompt_text")))
-                else:
-                    asyncio.ensure_future(dialog.dismiss())
+                self._callbacks.submit(_handle, dialog)
 
-            self._async.on_dialog(_sync_callback)
+            self._loop.call(self._async.on_dialog, _sync_callback)
 
     def on_console(self, mode: str = "collect") -> None:
         """Start collecting console messages. Retrieve with console_messages()."""
         def _collector(msg: Any) -> None:
             self._console_messages.append({"type": msg.type(), "text": msg.text()})
-        self._async.on_console(_collector)
+        self._loop.call(self._async.on_console, _collector)
 
     def console_messages(self) -> List[Dict[str, str]]:
         """Return collected console messages."""
@@ -414,14 +484,14 @@ class Page:
         """Start collecting page errors. Retrieve with errors()."""
         def _collector(error: Exception) -> None:
             self._errors.append({"message": str(error)})
-        self._async.on_error(_collector)
+        self._loop.call(self._async.on_error, _collector)
 
     def errors(self) -> List[Dict[str, str]]:
         """Return collected errors."""
         return list(self._errors)
 
     def remove_all_listeners(self, event: Optional[str] = None) -> None:
-        self._async.remove_all_listeners(event)
+        self._loop.call(self._async.remove_all_listeners, event)
         if not event or event == "console":
             self._console_messages.clear()
         if not event or event == "error":
@@ -0,0 +1,103 @@
+"""Sync pool of pre-launched browsers."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+from .browser import Browser
+
+if TYPE_CHECKING:
+    from .._sync_base import _EventLoopThread
+
+
+class BrowserPool:
+    """Synchronous wrapper for the async BrowserPool.
+
+    Usage:
+        with BrowserPool(min_size=2, max_size=8, headless=True) as pool:
+            bro = pool.acquire()
+            try:
+                vibe = bro.page()
+                ...
+            finally:
+                pool.release(bro)
+
+    Pooled browsers run on the shared event loop threads, and the pool may
+    be used from several threads. Give browsers back with release(), not
+    close(). See async_api BrowserPool for the options.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 4,
+        idle_timeout: Optional[int] = 300000,
+        **launch_options: Any,
+    ) -> None:
+        from ..async_api.pool import BrowserPool as AsyncBrowserPool
+
+        self._async = AsyncBrowserPool(min_size, max_size, idle_timeout, **launch_options)
+        self._loop: Optional[_EventLoopThread] = None
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Browsers owned by the pool: idle, in use or launching."""
+        return self._async.size
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of idle, in-use and launching browsers."""
+        return self._async.stats()
+
+    def start(self) -> BrowserPool:
+        """Launch min_size browsers and wait until they are ready."""
+        from .._sync_base import _loop_threads
+
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+        if self._loop is not None:
+            raise RuntimeError("BrowserPool has already been started")
+        self._loop = _loop_threads.acquire()
+        try:
+            self._loop.run(self._async.start())
+        except BaseException:
+            _loop_threads.release(self._loop)
+            self._loop = None
+            raise
+        return self
+
+    def acquire(self, timeout: Optional[int] = None) -> Browser:
+        """Take a browser from the pool, waiting up to timeout ms if it is at max_size."""
+        loop = self._loop_thread()
+        async_browser = loop.run(self._async.acquire(timeout))
+        return Browser(async_browser, loop, owns_loop=False)
+
+    def release(self, browser: Browser) -> None:
+        """Give a browser back. It is reset in the background, then reused."""
+        self._loop_thread().run(self._async.release(browser._async))
+
+    def _loop_thread(self) -> _EventLoopThread:
+        if self._loop is None:
+            raise RuntimeError("BrowserPool is closed" if self._closed else "BrowserPool.start() has not been called")
+        return self._loop
+
+    def close(self) -> None:
+        """Close every browser, idle or in use. Safe to call more than once."""
+        from .._sync_base import _loop_threads
+
+        if self._closed:
+            return
+        self._closed = True
+        loop, self._loop = self._loop, None
+        if loop is None:
+            return  # never started: nothing launched, no loop thread held
+        try:
+            loop.run(self._async.close())
+        finally:
+            _loop_threads.release(loop)
+
+    def __enter__(self) -> BrowserPool:
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..async_api.route import Route as AsyncRoute
@@ -12,12 +12,28 @@ class Route:
     """Sync wrapper for an intercepted network request.
 
     The user's handler calls fulfill(), continue_(), or abort() to set the decision.
-    If none is called, the default is 'continue'.
+    If none is called, the default is 'continue'. The first decision is sent
+    as soon as it is made, so the request does not wait for the handler to
+    return; later calls are ignored.
     """
 
-    def __init__(self, async_route: AsyncRoute) -> None:
+    def __init__(
+        self,
+        async_route: AsyncRoute,
+        on_decision: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
         self._async = async_route
         self._decision: Dict[str, Any] = {"action": "continue"}
+        self._decided = False
+        self._on_decision = on_decision
+
+    def _decide(self, decision: Dict[str, Any]) -> None:
+        if self._decided:
+            return
+        self._decided = True
+        self._decision = decision
+        if self._on_decision is not None:
+            self._on_decision(decision)
 
     @property
     def request(self) -> Dict[str, Any]:
@@ -37,13 +53,13 @@ class Route:
         content_type: Optional[str] = None,
         body: Optional[str] = None,
     ) -> None:
-        self._decision = {
+        self._decide({
             "action": "fulfill",
             "status": status,
             "headers": headers,
             "content_type": content_type,
             "body": body,
-        }
+        })
 
     def continue_(
         self,
@@ -52,13 +68,13 @@ class Route:
         headers: Optional[Dict[str, str]] = None,
         post_data: Optional[str] = None,
     ) -> None:
-        self._decision = {
+        self._decide({
             "action": "continue",
             "url": url,
             "method": method,
             "headers": headers,
             "post_data": post_data,
-        }
+        })
 
     def abort(self) -> None:
-        self._decision = {"action": "abort"}
+        self._decide({"action": "abort"})
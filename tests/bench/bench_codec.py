@@ -0,0 +1,102 @@
+"""Benchmark the BiDi transport JSON codecs on a message stream.
+
+Usage:
+    python tests/bench/bench_codec.py                   # synthetic stream
+    python tests/bench/bench_codec.py --stream msgs.jsonl
+
+A recorded stream is a file with one raw BiDi message per line, e.g. captured
+from the receive loop. Without one, a synthetic stream is generated that
+mimics a page load: a burst of network.beforeRequestSent / responseCompleted
+events, console log entries, and a few base64 screenshot responses.
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "clients", "python", "src"))
+
+from vibium._codec import available_codecs  # noqa: E402
+
+
+def _headers(n):
+    return [{"name": f"x-header-{i}", "value": {"type": "string", "value": "v" * 40}} for i in range(n)]
+
+
+def synthetic_stream(requests=500, screenshots=5, screenshot_kb=512):
+    """Build a list of raw UTF-8 frames resembling a busy page."""
+    frames = []
+    for i in range(requests):
+        request = {
+            "request": f"req-{i}",
+            "url": f"https://example.com/assets/{i}.js?cache={i * 7919}",
+            "method": "GET",
+            "headers": _headers(12),
+            "cookies": [],
+            "headersSize": 512,
+            "bodySize": 0,
+            "timings": {k: float(i) for k in ("timeOrigin", "requestTime", "redirectStart",
+                                                "redirectEnd", "fetchStart", "dnsStart")},
+        }
+        base = {"context": "ctx-1", "navigation": "nav-1", "redirectCount": 0,
+                "timestamp": 1700000000000 + i, "isBlocked": False, "request": request}
+        frames.append({"type": "event", "method": "network.beforeRequestSent",
+                       "params": {**base, "initiator": {"type": "script"}}})
+        frames.append({"type": "event", "method": "network.responseCompleted",
+                       "params": {**base, "response": {"url": request["url"], "status": 200,
+                                                       "headers": _headers(10), "mimeType": "text/javascript"}}})
+        if i % 10 == 0:
+            frames.append({"type": "event", "method": "log.entryAdded",
+                           "params": {"type": "console", "level": "info", "text": f"loaded {i}",
+                                      "source": {"realm": "r", "context": "ctx-1"}}})
+    blob = base64.b64encode(os.urandom(screenshot_kb * 1024)).decode("ascii")
+    for i in range(screenshots):
+        frames.append({"id": 1000 + i, "type": "success", "result": {"data": blob}})
+    return [json.dumps(f).encode("utf-8") for f in frames]
+
+
+def load_stream(path):
+    with open(path, "rb") as f:
+        return [line.rstrip(b"\n") for line in f if line.strip()]
+
+
+def bench(codec, frames, rounds):
+    objs = [codec.decode(f) for f in frames[:200]]
+    best_decode = best_encode = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for f in frames:
+            codec.decode(f)
+        best_decode = min(best_decode, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for o in objs:
+            codec.encode(o)
+        best_encode = min(best_encode, time.perf_counter() - start)
+    return best_decode, best_encode
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stream", help="JSONL file of recorded BiDi messages")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    frames = load_stream(args.stream) if args.stream else synthetic_stream()
+    total_mb = sum(len(f) for f in frames) / (1024 * 1024)
+    print(f"{len(frames)} frames, {total_mb:.1f} MiB (best of {args.rounds})\n")
+    print(f"{'codec':<10} {'decode ms':>10} {'MiB/s':>8} {'encode ms':>10}")
+
+    for name, codec in available_codecs().items():
+        if codec is None:
+            print(f"{name:<10} {'not installed':>10}")
+            continue
+        decode_s, encode_s = bench(codec, frames, args.rounds)
+        print(f"{name:<10} {decode_s * 1000:>10.1f} {total_mb / decode_s:>8.0f} {encode_s * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark `import vibium` time with python -X importtime.
+
+Usage:
+    python tests/bench/bench_import.py
+    python tests/bench/bench_import.py --runs 20 --max-ms 15
+
+Each statement runs in a fresh interpreter; the time is the summed import
+time of every module it loads beyond a bare interpreter (the median over
+--runs). With --max-ms, exits non-zero if the first statement ("import
+vibium") is over budget, so it can guard against import-time regressions.
+It also fails if that import loads any of HEAVY_MODULES.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "..", "clients", "python", "src")
+
+STATEMENTS = [
+    "import vibium",
+    "from vibium import browser",
+    "from vibium import Page, BrowserPool",
+    "from vibium.async_api import browser",
+    "from vibium.async_api import browser; from vibium.client import BiDiClient",
+]
+
+# Must not be loaded by a bare `import vibium`
+HEAVY_MODULES = ("asyncio", "websockets", "vibium.sync_api", "vibium.client", "dataclasses")
+
+
+def import_times(statement):
+    """Return {module: self-time in microseconds} for one fresh import."""
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(SRC))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def measure(statement, baseline, runs):
+    """Median added import time (ms) and the modules added."""
+    totals = []
+    modules = set()
+    for _ in range(runs):
+        times = import_times(statement)
+        added = {m: t for m, t in times.items() if m not in baseline}
+        totals.append(sum(added.values()) / 1000)
+        modules = set(added)
+    return statistics.median(totals), modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, help="budget for `import vibium`")
+    args = parser.parse_args()
+
+    baseline = set(import_times("pass"))
+    print(f"{'statement':<75} {'ms':>7} {'modules':>8}")
+    results = {}
+    for statement in STATEMENTS:
+        ms, modules = measure(statement, baseline, args.runs)
+        results[statement] = (ms, modules)
+        print(f"{statement:<75} {ms:>7.1f} {len(modules):>8}")
+
+    ms, modules = results[STATEMENTS[0]]
+    heavy = sorted(m for m in modules if m.split(".")[0] in HEAVY_MODULES or m in HEAVY_MODULES)
+    failed = False
+    if heavy:
+        print(f"\n`import vibium` loads heavy modules: {', '.join(heavy)}")
+        failed = True
+    if args.max_ms is not None and ms > args.max_ms:
+        print(f"\n`import vibium` took {ms:.1f}ms, over the {args.max_ms}ms budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
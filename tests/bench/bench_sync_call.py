@@ -0,0 +1,100 @@
+"""Benchmark the per-call overhead of the sync API over async.
+
+Usage:
+    python tests/bench/bench_sync_call.py
+    python tests/bench/bench_sync_call.py --count 20000
+
+The fake server runs on its own loop thread and answers every command
+immediately, so the differences between rows are the cost of getting from a
+caller thread onto the client's loop and back:
+
+    async                     client.send() awaited on the loop itself
+    run_coroutine_threadsafe  what sync wrappers used to do for every call
+    _EventLoopThread.run      the coroutine bridge most sync wrappers use
+    _EventLoopThread.send     the direct path single-command getters use
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "clients", "python", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "py"))
+
+from vibium._sync_base import _EventLoopThread  # noqa: E402
+from vibium._types import _Command  # noqa: E402
+from vibium.client import BiDiClient  # noqa: E402
+
+
+def timed(call, count):
+    """Call call() count times; return per-call latencies in microseconds."""
+    for _ in range(min(count, 200)):  # warm up
+        call()
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+async def timed_async(client, count):
+    for _ in range(min(count, 200)):
+        await client.send("ping", {})
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        await client.send("ping", {})
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+def report(name, latencies, baseline):
+    latencies.sort()
+    mean = statistics.mean(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    extra = f"{mean - baseline:>+9.1f}" if baseline is not None else f"{'':>9}"
+    print(f"{name:<26} {mean:>9.1f} {statistics.median(latencies):>9.1f} {p99:>9.1f} {extra}")
+    return mean
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000, help="commands per row")
+    args = parser.parse_args()
+
+    from fake_bidi_server import FakeBiDiServer
+
+    server_loop = _EventLoopThread()
+    server_loop.start()
+    server = server_loop.run(FakeBiDiServer().start())
+    client_loop = _EventLoopThread()
+    loop = client_loop.start()
+    client = client_loop.run(BiDiClient.connect(server.url))
+    ping = _Command("ping", {})
+
+    print(f"{args.count} commands per row (latency in microseconds)\n")
+    print(f"{'':<26} {'mean':>9} {'p50':>9} {'p99':>9} {'vs async':>9}")
+    try:
+        baseline = report("async", client_loop.run(timed_async(client, args.count)), None)
+        report("run_coroutine_threadsafe", timed(
+            lambda: asyncio.run_coroutine_threadsafe(client.send("ping", {}), loop).result(), args.count,
+        ), baseline)
+        report("_EventLoopThread.run", timed(
+            lambda: client_loop.run(client.send("ping", {})), args.count,
+        ), baseline)
+        report("_EventLoopThread.send", timed(
+            lambda: client_loop.send(client, ping), args.count,
+        ), baseline)
+    finally:
+        client_loop.run(client.close())
+        client_loop.stop()
+        server_loop.run(server.stop())
+        server_loop.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark command round-trip latency over TCP loopback vs a Unix socket.
+
+Usage:
+    python tests/bench/bench_transport.py              # in-process fake server
+    python tests/bench/bench_transport.py --vibium     # real `vibium serve`
+
+The fake server answers every command immediately, so its numbers are the
+transport cost alone: client encode/decode, the socket round trip and the
+server's framing. With --vibium, a headless browser is launched over each
+transport and session.status is timed, which adds the vibium proxy and
+chromedriver hop.
+
+Commands are sent one at a time (the latency a sync caller sees) and, with
+--concurrency, as that many overlapping streams.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "clients", "python", "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "py"))
+
+from vibium.client import BiDiClient  # noqa: E402
+
+
+async def measure(client, method, count, concurrency):
+    """Return per-command latencies in microseconds and the elapsed seconds."""
+    latencies = []
+
+    async def stream(n):
+        for _ in range(n):
+            start = time.perf_counter()
+            await client.send(method, {})
+            latencies.append((time.perf_counter() - start) * 1e6)
+
+    for _ in range(min(count, 100)):  # warm up
+        await client.send(method, {})
+    start = time.perf_counter()
+    await asyncio.gather(*(stream(count // concurrency) for _ in range(concurrency)))
+    return latencies, time.perf_counter() - start
+
+
+def report(name, latencies, elapsed):
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{name:<6} {statistics.mean(latencies):>9.1f} {statistics.median(latencies):>9.1f} "
+          f"{p99:>9.1f} {len(latencies) / elapsed:>10.0f}")
+
+
+async def bench_fake(count, concurrency):
+    from fake_bidi_server import FakeBiDiServer
+
+    with tempfile.TemporaryDirectory(prefix="vibium-bench-") as tmp:
+        tcp = await FakeBiDiServer().start()
+        uds = await FakeBiDiServer().start(socket_path=os.path.join(tmp, "bench.sock"))
+        try:
+            for name, server in (("tcp", tcp), ("unix", uds)):
+                client = await BiDiClient.connect(server.url, unix_socket=server.socket_path)
+                try:
+                    report(name, *await measure(client, "ping", count, concurrency))
+                finally:
+                    await client.close()
+        finally:
+            await tcp.stop()
+            await uds.stop()
+
+
+async def bench_vibium(count, concurrency):
+    from vibium.async_api import browser
+
+    for name, unix_socket in (("tcp", False), ("unix", True)):
+        bro = await browser.launch(headless=True, unix_socket=unix_socket)
+        try:
+            report(name, *await measure(bro._client, "session.status", count, concurrency))
+        finally:
+            await bro.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vibium", action="store_true", help="benchmark a real vibium server")
+    parser.add_argument("--count", type=int, default=5000, help="commands per transport")
+    parser.add_argument("--concurrency", type=int, default=1, help="overlapping command streams")
+    args = parser.parse_args()
+    if sys.platform == "win32":
+        sys.exit("Unix sockets are not supported on Windows")
+
+    print(f"{args.count} commands, concurrency {args.concurrency} (latency in microseconds)\n")
+    print(f"{'':<6} {'mean':>9} {'p50':>9} {'p99':>9} {'cmds/s':>10}")
+    asyncio.run((bench_vibium if args.vibium else bench_fake)(args.count, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
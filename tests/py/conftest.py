@@ -104,3 +104,16 @@ async def ws_echo_server():
     yield f"ws://127.0.0.1:{port}"
     server.close()
     await server.wait_closed()
+
+
+# ---------------------------------------------------------------------------
+# Function-scoped: scriptable fake BiDi server (for test_transport.py)
+# ---------------------------------------------------------------------------
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def fake_bidi_server():
+    """Start a FakeBiDiServer. Returns the server (connect to server.url)."""
+    from fake_bidi_server import FakeBiDiServer
+    server = await FakeBiDiServer().start()
+    yield server
+    await server.stop()
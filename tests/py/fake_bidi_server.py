@@ -0,0 +1,99 @@
+"""Scriptable in-process BiDi server for transport tests.
+
+Speaks just enough of the vibium wire protocol to exercise BiDiClient
+without launching a browser: every command gets a success response whose
+result echoes the method and params, unless a handler is registered for
+that method.
+"""
+
+import asyncio
+import json
+
+import websockets
+
+
+class FakeBiDiServer:
+    """A websocket server that answers BiDi commands from a handler table."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.received = []
+        self.connections = []
+        self._server = None
+        self.url = None
+        self.socket_path = None
+
+    def on(self, method, handler):
+        """Register handler(params) -> result for a method.
+
+        Raise FakeBiDiError from the handler to send an error response.
+        Handlers may be coroutine functions.
+        """
+        self.handlers[method] = handler
+
+    async def emit(self, method, params):
+        """Broadcast an event to every connected client."""
+        message = json.dumps({"type": "event", "method": method, "params": params})
+        for ws in list(self.connections):
+            await ws.send(message)
+
+    def drop(self):
+        """Abort every client socket without a close frame, like a network failure."""
+        for ws in list(self.connections):
+            ws.transport.abort()
+
+    async def start(self, socket_path=None):
+        """Listen on a random TCP port, or on a Unix socket if socket_path is given."""
+        if socket_path:
+            self._server = await websockets.unix_serve(self._serve, socket_path, max_size=None)
+            self.socket_path = socket_path
+            self.url = "ws://localhost/"
+            return self
+        self._server = await websockets.serve(self._serve, "127.0.0.1", 0, max_size=None)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}"
+        return self
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self, ws):
+        self.connections.append(ws)
+        try:
+            async for message in ws:
+                command = json.loads(message)
+                self.received.append(command)
+                asyncio.ensure_future(self._respond(ws, command))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.connections.remove(ws)
+
+    async def _respond(self, ws, command):
+        method = command["method"]
+        params = command.get("params", {})
+        handler = self.handlers.get(method)
+        try:
+            if handler is None:
+                result = {"method": method, "params": params}
+            else:
+                result = handler(params)
+                if asyncio.iscoroutine(result):
+                    result = await result
+            response = {"id": command["id"], "type": "success", "result": result}
+        except FakeBiDiError as e:
+            response = {"id": command["id"], "type": "error", "error": e.error, "message": e.message}
+        try:
+            await ws.send(json.dumps(response))
+        except websockets.ConnectionClosed:
+            pass
+
+
+class FakeBiDiError(Exception):
+    """Raised by a handler to produce a BiDi error response."""
+
+    def __init__(self, error, message):
+        super().__init__(message)
+        self.error = error
+        self.message = message
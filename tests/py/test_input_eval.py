@@ -1,4 +1,4 @@
-"""Input & eval tests — keyboard, mouse, screenshot options, pdf, eval, addScript, expose (18 async tests)."""
+"""Input & eval tests — keyboard, mouse, screenshot options, pdf, eval, addScript, expose (20 async tests)."""
 
 import pytest
 
@@ -83,6 +83,21 @@ async def test_pdf(async_page, test_server):
     assert data[:2] == b"%P"
 
 
+async def test_screenshot_streamed_to_path(async_page, test_server, tmp_path):
+    await async_page.go(test_server)
+    path = tmp_path / "full.png"
+    assert await async_page.screenshot(full_page=True, path=path) is None
+    assert path.read_bytes()[:4] == b"\x89PNG"
+
+
+async def test_pdf_streamed_to_buffer(async_page, test_server):
+    import io
+    await async_page.go(test_server)
+    buffer = io.BytesIO()
+    await async_page.pdf(path=buffer)
+    assert buffer.getvalue()[:2] == b"%P"
+
+
 # --- Eval ---
 
 async def test_eval_expression(async_page, test_server):
@@ -1,4 +1,4 @@
-"""Object model tests — verify Browser/Page/Context isinstance and API shape (8 tests)."""
+"""Object model tests — verify Browser/Page/Context isinstance and API shape (10 tests)."""
 
 from vibium import browser, Browser, Page, BrowserContext
 
@@ -86,3 +86,40 @@ def test_page_close(test_server):
         assert all(p.id != vibe.id for p in pages)
     finally:
         bro.close()
+
+
+def test_sharded_connections(test_server):
+    bro = browser.launch(headless=True, connections=2)
+    try:
+        ctx_a = bro.new_context()
+        ctx_b = bro.new_context()
+        assert ctx_a._async._client is not ctx_b._async._client
+        vibe = ctx_b.new_page()
+        vibe.go(test_server)
+        assert vibe.title() == "Test App"
+        assert any(p.id == vibe.id for p in bro.pages())
+    finally:
+        bro.close()
+
+
+def test_import_is_lazy():
+    """`import vibium` defers the API modules until a name is used."""
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, vibium\n"
+        "assert 'vibium.sync_api' not in sys.modules\n"
+        "assert 'asyncio' not in sys.modules\n"
+        "from vibium import browser, Page\n"
+        "assert type(browser).__name__ == '_BrowserLauncher'\n"
+        "assert 'websockets' not in sys.modules\n"
+        # Loading a name must not let its submodule shadow it afterwards
+        "assert callable(vibium.parallel)\n"
+        "from vibium.sync_api import parallel\n"
+        "assert callable(parallel), parallel\n"
+    )
+    import vibium
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(vibium.__file__)))
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
@@ -0,0 +1,147 @@
+"""Browser pool tests — reuse and reset, double release, sync close, page state reset, max_size waits, refill, idle eviction (7 tests).
+
+Pooled browsers attach to a fake BiDi server instead of launching one.
+"""
+
+import asyncio
+
+import pytest
+
+from vibium.async_api import BrowserPool
+
+
+@pytest.fixture
+def pool_server(fake_bidi_server, monkeypatch):
+    """Make BrowserPool launches connect to the fake server and answer reset commands."""
+    from vibium.async_api import pool as pool_module
+
+    launches = []
+
+    async def launch(**options):
+        launches.append(options)
+        return await pool_module._launcher.connect(fake_bidi_server.url)
+
+    monkeypatch.setattr(pool_module._launcher, "launch", launch)
+    fake_bidi_server.on("browser.getUserContexts", lambda params: {
+        "userContexts": [{"userContext": "default"}, {"userContext": "uc-1"}],
+    })
+    fake_bidi_server.on("vibium:browser.pages", lambda params: {
+        "pages": [{"context": "ctx-1", "url": "https://a"}, {"context": "ctx-2", "url": "https://b"}],
+    })
+    fake_bidi_server.launches = launches
+    return fake_bidi_server
+
+
+async def _settle(pool):
+    while pool._tasks:
+        await asyncio.gather(*pool._tasks)
+
+
+async def test_release_resets_and_reuses(pool_server):
+    async with BrowserPool(min_size=1, max_size=2, headless=True) as pool:
+        bro = await pool.acquire()
+        await _settle(pool)  # refill back to one idle browser
+        assert pool.stats() == {"idle": 1, "in_use": 1, "launching": 0}
+        assert pool_server.launches == [{"headless": True}] * 2
+
+        await pool.release(bro)
+        await _settle(pool)
+        assert pool.stats() == {"idle": 2, "in_use": 0, "launching": 0}
+        reset = [(c["method"], c["params"]) for c in pool_server.received[-6:]]
+        assert ("browser.removeUserContext", {"userContext": "uc-1"}) in reset
+        assert ("browsingContext.close", {"context": "ctx-2"}) in reset
+        assert ("vibium:context.clearCookies", {"userContext": "default"}) in reset
+        assert pool_server.received[-1]["method"] == "vibium:context.clearCookies"
+
+        assert await pool.acquire() is bro  # most recently released first
+        with pytest.raises(ValueError):
+            await pool.release(object())
+
+
+async def test_double_release_is_rejected(pool_server):
+    async with BrowserPool(min_size=0, max_size=2) as pool:
+        bro = await pool.acquire()
+        await pool.release(bro)
+        with pytest.raises(ValueError, match="already released"):
+            await pool.release(bro)  # still being reset
+        await _settle(pool)
+        assert [b for b, _ in pool._idle] == [bro]
+        with pytest.raises(ValueError):
+            await pool.release(bro)  # idle again
+        assert await pool.acquire() is bro
+        assert await pool.acquire() is not bro
+
+
+def test_sync_close_is_idempotent():
+    """A sync pool can be closed without being started, and twice, releasing its loop thread once."""
+    import vibium
+    from vibium._sync_base import _loop_threads
+
+    before = dict(_loop_threads._users)
+    vibium.BrowserPool(min_size=0).close()
+    pool = vibium.BrowserPool(min_size=0).start()
+    assert _loop_threads._users[pool._loop] == before.get(pool._loop, 0) + 1
+    pool.close()
+    pool.close()
+    assert dict(_loop_threads._users) == before
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.acquire()
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.start()
+
+
+async def test_release_clears_page_state(pool_server):
+    pool_server.on("vibium:browser.page", lambda params: {"context": "ctx-1"})
+    pool_server.on("vibium:page.route", lambda params: {"intercept": "i-1"})
+    async with BrowserPool(min_size=0, max_size=1) as pool:
+        bro = await pool.acquire()
+        page = await bro.page()
+        await page.route("**", lambda route: None)
+        page.on_console(lambda msg: None)
+        await pool.release(bro)
+        await _settle(pool)
+
+        assert await pool.acquire() is bro
+        assert ("network.removeIntercept", {"intercept": "i-1"}) in [
+            (c["method"], c["params"]) for c in pool_server.received
+        ]
+        assert not page._routes and not page._console_callbacks and not page._subscriptions
+        assert page._event_handler not in bro._client._handler_keys
+        assert await bro.page() is not page
+
+
+async def test_acquire_waits_at_max_size(pool_server):
+    async with BrowserPool(min_size=0, max_size=1) as pool:
+        bro = await pool.acquire()
+        with pytest.raises(TimeoutError):
+            await pool.acquire(timeout=50)
+
+        waiter = asyncio.ensure_future(pool.acquire(timeout=5000))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        await pool.release(bro)
+        assert await waiter is bro
+        assert len(pool_server.launches) == 1
+
+
+async def test_dead_browser_is_replaced(pool_server):
+    async with BrowserPool(min_size=1, max_size=1) as pool:
+        first = await pool.acquire()
+        await pool.release(first)
+        await _settle(pool)
+        await first._client.close()
+        second = await pool.acquire()
+        assert second is not first
+        assert len(pool_server.launches) == 2
+
+
+async def test_idle_browsers_are_evicted_down_to_min_size(pool_server):
+    async with BrowserPool(min_size=1, max_size=3, idle_timeout=100) as pool:
+        browsers = [await pool.acquire() for _ in range(3)]
+        for bro in browsers:
+            await pool.release(bro)
+        await _settle(pool)
+        assert pool.stats()["idle"] == 3
+        await asyncio.sleep(0.4)
+        await _settle(pool)
+        assert pool.stats() == {"idle": 1, "in_use": 0, "launching": 0}
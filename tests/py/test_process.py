@@ -1,7 +1,40 @@
-"""Process tests — cleanup, multiple sessions (3 tests)."""
+"""Process tests — cleanup, multiple sessions, concurrent startup, readiness, Chrome check cache, install lock, output draining, unix socket, connect errors, shared server (14 tests)."""
+
+import asyncio
+import os
+import signal
+import sys
+import time
 
 import pytest
 
+# Stand-in for the vibium binary: reports an installed Chrome, and 'serve'
+# takes a while to come up before printing the usual banner.
+FAKE_VIBIUM = """#!{python}
+import sys, time
+with open({log!r}, "a") as log:
+    log.write(sys.argv[1] + "\\n")
+if sys.argv[1] == "paths":
+    print("Chrome: {chrome}")
+elif sys.argv[1] == "install":
+    time.sleep(0.5)
+    open({chrome!r}, "w").close()
+elif sys.argv[1] == "serve":
+    if "{mode}" == "crash":
+        sys.exit("boom")
+    time.sleep({delay})
+    print("Starting Clicker proxy server on port 0", flush=True)
+    if "--socket" in sys.argv:
+        print("Server listening on ws+unix://" + sys.argv[sys.argv.index("--socket") + 1], flush=True)
+    else:
+        print("Server listening on ws://localhost:12345", flush=True)
+    if "{mode}" == "chatty":
+        for i in range(20000):
+            print("[router] line %d" % i)
+        sys.stdout.flush()
+    time.sleep(30)
+"""
+
 
 def test_sync_cleanup(test_server):
     """Sync browser closes cleanly."""
@@ -50,3 +83,220 @@ def test_multiple_sessions(test_server):
     finally:
         bro1.close()
         bro2.close()
+
+
+@pytest.fixture
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep the Chrome check cache out of the real cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+
+
+def _fake_vibium(tmp_path, mode="ok", delay=0.5, chrome=sys.executable):
+    fake = tmp_path / "vibium"
+    log = tmp_path / "calls.log"
+    fake.write_text(FAKE_VIBIUM.format(python=sys.executable, mode=mode, delay=delay, log=str(log), chrome=chrome))
+    fake.chmod(0o755)
+    return fake
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a script as the vibium binary")
+async def test_concurrent_starts_overlap(tmp_path, isolated_cache):
+    """Process startup does not block the event loop, so launches run in parallel."""
+    from vibium.binary import VibiumProcess
+
+    fake = _fake_vibium(tmp_path)
+    start = time.monotonic()
+    processes = await asyncio.gather(*(VibiumProcess.start(executable_path=str(fake)) for _ in range(4)))
+    elapsed = time.monotonic() - start
+    try:
+        assert [p.port for p in processes] == [12345] * 4
+        assert elapsed < 1.5  # one startup is 0.5s; four serial ones would be 2s+
+        assert list(processes[0].startup_timings) == ["binary_found", "chrome_checked", "server_listening"]
+    finally:
+        await asyncio.gather(*(p.stop() for p in processes))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a script as the vibium binary")
+async def test_early_exit_fails_fast(tmp_path, isolated_cache):
+    from vibium.binary import VibiumProcess
+
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="boom"):
+        await VibiumProcess.start(executable_path=str(_fake_vibium(tmp_path, mode="crash")), startup_timeout=10000)
+    assert time.monotonic() - start < 5
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a script as the vibium binary")
+async def test_startup_timeout(tmp_path, isolated_cache):
+    from vibium.binary import VibiumProcess
+
+    with pytest.raises(TimeoutError):
+        await VibiumProcess.start(executable_path=str(_fake_vibium(tmp_path, delay=10)), startup_timeout=300)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a script as the vibium binary")
+async def test_chrome_check_is_cached(tmp_path, isolated_cache):
+    """Only the first start runs 'vibium paths'; the cache is revalidated by mtime."""
+    from vibium.binary import VibiumProcess
+
+    fake = _fake_vibium(tmp_path, delay=0)
+    for _ in range(2):
+        await (await VibiumProcess.start(executable_path=str(fake))).stop()
+    calls = (tmp_path / "calls.log").read_text().split()
+    assert calls == ["paths", "serve", "serve"]
+
+    # A changed binary invalidates the entry
+    os.utime(fake, ns=(0, 0))
+    await (await VibiumProcess.start(executable_path=str(fake))).stop()
+    assert (tmp_path / "calls.log").read_text().split()[3:] == ["paths", "serve"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a script as the vibium binary")
+async def test_concurrent_installs_are_serialized(tmp_path, isolated_cache):
+    """Launches on a machine without Chrome run 'vibium install' once."""
+    from vibium.binary import ensure_browser_installed_async
+
+    fake = _fake_vibium(tmp_path, chrome=str(tmp_path / "chrome"))
+    await asyncio.gather(*(ensure_browser_installed_async(str(fake)) for _ in range(3)))
+    assert (tmp_path / "calls.log").read_text().split().count("install") == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a script as the vibium binary")
+async def test_output_is_drained_into_ring_buffer(tmp_path, isolated_cache, caplog):
+    """Server output never fills the pipe; recent lines are kept and optionally logged."""
+    import logging
+    from vibium.binary import OUTPUT_BUFFER_LINES, VibiumProcess
+
+    caplog.set_level(logging.INFO, logger="vibium.server")
+    process = await VibiumProcess.start(
+        executable_path=str(_fake_vibium(tmp_path, mode="chatty", delay=0)), log_output=True,
+    )
+    try:
+        for _ in range(100):
+            if process.recent_output(1)[0].text == "[router] line 19999":
+                break
+            await asyncio.sleep(0.05)
+        recent = process.recent_output()
+        assert len(recent) == OUTPUT_BUFFER_LINES
+        assert recent[-1].text == "[router] line 19999"
+        assert recent[-1].source == "router" and recent[-1].stream == "stdout"
+        assert any(r.name == "vibium.server" and r.getMessage() == "[router] line 0" for r in caplog.records)
+        assert "[stdout] [router] line 19999" in process.describe()
+    finally:
+        await process.stop()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a script as the vibium binary")
+async def test_unix_socket_start(tmp_path, isolated_cache):
+    """unix_socket=True serves on a private socket path, removed on stop."""
+    from vibium.binary import VibiumProcess
+
+    fake = _fake_vibium(tmp_path, delay=0)
+    process = await VibiumProcess.start(executable_path=str(fake), unix_socket=True)
+    socket_dir = os.path.dirname(process.socket_path)
+    assert process.port == 0
+    assert process.socket_path.endswith("vibium.sock")
+    assert os.path.isdir(socket_dir)
+    await process.stop()
+    assert not os.path.exists(socket_dir)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a script as the vibium binary")
+async def test_connect_failure_keeps_error_and_adds_output(tmp_path, isolated_cache):
+    """A server that cannot be reached fails with its own error, plus the server's output."""
+    from vibium.async_api.browser import browser
+
+    fake = _fake_vibium(tmp_path, delay=0)  # prints the banner, but nothing listens
+    with pytest.raises(OSError) as info:
+        await browser.launch(executable_path=str(fake), unix_socket=True, startup_timeout=500)
+    text = str(info.value) + "".join(getattr(info.value, "__notes__", []))
+    assert "Server listening on ws+unix://" in text
+    if sys.version_info >= (3, 11):
+        assert info.value.errno is not None  # the original OSError, not a copy
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a script as the vibium binary")
+async def test_shared_server_is_reused(tmp_path, isolated_cache):
+    """The shared server is started once, recorded, and replaced when stale."""
+    from vibium._shared_server import read_state, shared_server, stop_shared_server
+
+    fake = _fake_vibium(tmp_path, delay=0)
+    first = await shared_server(headless=True, executable_path=str(fake))
+    try:
+        assert first["url"] == "ws://localhost/"
+        assert first["socket"].endswith("server-headless.sock")
+        assert read_state(headless=True) == first
+        assert await shared_server(headless=True, executable_path=str(fake)) == first
+        assert read_state(headless=False) is None
+
+        second = await shared_server(headless=True, executable_path=str(fake), stale=first)
+        assert second["pid"] != first["pid"]
+        _wait_for_exit(first["pid"])  # the stale server is not left running
+        serves = [line for line in (tmp_path / "calls.log").read_text().split() if line == "serve"]
+        assert len(serves) == 2
+        assert stop_shared_server(headless=True)
+        _wait_for_exit(second["pid"])
+        assert read_state(headless=True) is None
+    finally:
+        stop_shared_server(headless=True)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a script as the vibium binary")
+async def test_shared_server_long_cache_dir(tmp_path, isolated_cache, monkeypatch):
+    """A socket path too long for sun_path moves to a private temp dir, removed on stop."""
+    from vibium._shared_server import shared_server, stop_shared_server
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ("c" * 100)))
+    state = await shared_server(headless=True, executable_path=str(_fake_vibium(tmp_path, delay=0)))
+    try:
+        assert len(state["socket"]) < 100
+        assert os.path.dirname(state["socket"]) == state["socket_dir"]
+        assert os.path.isdir(state["socket_dir"])
+    finally:
+        assert stop_shared_server(headless=True)
+    _wait_for_exit(state["pid"])
+    assert not os.path.exists(state["socket_dir"])
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a script as the vibium binary")
+async def test_stale_server_pid_reused(tmp_path, isolated_cache):
+    """A recorded pid that now belongs to another process is never signalled."""
+    import subprocess
+    from vibium._shared_server import _process_started, _write_state, shared_server, stop_shared_server
+    from vibium.binary import get_cache_dir
+
+    get_cache_dir().mkdir(parents=True)
+    other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        reused = {"pid": other.pid, "pid_started": "0", "url": "ws://localhost/",
+                  "socket": str(tmp_path / "gone.sock"), "socket_dir": None, "started": 0}
+        assert _process_started(other.pid) not in (None, "0")
+        _write_state(True, reused)
+        state = await shared_server(headless=True, executable_path=str(_fake_vibium(tmp_path, delay=0)))
+        assert state["pid"] != other.pid
+
+        # Without a start time to compare, a stale pid is not trusted either
+        unverified = dict(state, pid=other.pid, pid_started=None)
+        _write_state(True, unverified)
+        await shared_server(headless=True, executable_path=str(_fake_vibium(tmp_path, delay=0)), stale=unverified)
+        assert other.poll() is None
+        os.kill(state["pid"], signal.SIGTERM)
+        _wait_for_exit(state["pid"])
+    finally:
+        stop_shared_server(headless=True)
+        other.kill()
+        other.wait()
+
+
+def _wait_for_exit(pid, timeout=5):
+    """Wait until a detached server started by this process has exited and been reaped."""
+    from vibium._shared_server import _alive
+
+    deadline = time.monotonic() + timeout
+    while _alive(pid):
+        if time.monotonic() > deadline:
+            os.kill(pid, signal.SIGKILL)
+            raise AssertionError(f"process {pid} is still running")
+        time.sleep(0.05)
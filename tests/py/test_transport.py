@@ -0,0 +1,962 @@
+"""Transport tests — BiDiClient against a fake BiDi server (37 tests)."""
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from fake_bidi_server import FakeBiDiError
+from vibium.client import BiDiClient, BiDiError
+
+
+async def _drain(client):
+    """Wait until every queued event has been delivered."""
+    while client._event_queue:
+        await asyncio.sleep(0)
+
+
+async def test_send_many_preserves_order(fake_bidi_server):
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    try:
+        results = await client.send_many([("a", {"n": 1}), ("b", {"n": 2}), ("c", None)])
+        assert [r["method"] for r in results] == ["a", "b", "c"]
+        assert results[1]["params"] == {"n": 2}
+        assert not client._pending
+    finally:
+        await client.close()
+
+
+async def test_send_many_reports_errors_per_command(fake_bidi_server):
+    def fail(params):
+        raise FakeBiDiError("no such element", "boom")
+
+    fake_bidi_server.on("bad", fail)
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    try:
+        ok, bad, ok2 = await client.send_many([("good", {}), ("bad", {}), ("good", {})])
+        assert ok["method"] == "good"
+        assert isinstance(bad, BiDiError)
+        assert bad.error == "no such element"
+        assert ok2["method"] == "good"
+        with pytest.raises(BiDiError):
+            await client.send("bad")
+    finally:
+        await client.close()
+
+
+async def test_page_batch_adds_context(fake_bidi_server):
+    from vibium.async_api.page import Page
+
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    try:
+        page = Page(client, "ctx-1")
+        title, attr = await page.batch([
+            "vibium:page.title",
+            ("vibium:el.attr", {"selector": "a", "name": "href"}),
+        ])
+        assert title["params"] == {"context": "ctx-1"}
+        assert attr["params"] == {"context": "ctx-1", "selector": "a", "name": "href"}
+    finally:
+        await client.close()
+
+
+@pytest.mark.parametrize("codec", ["json", None])
+async def test_codec_round_trip(fake_bidi_server, codec):
+    client = await BiDiClient.connect(fake_bidi_server.url, codec=codec)
+    try:
+        result = await client.send("echo", {"text": "h\u00e9llo \u2603", "n": [1, 2.5, None]})
+        assert result["params"] == {"text": "h\u00e9llo \u2603", "n": [1, 2.5, None]}
+    finally:
+        await client.close()
+
+
+async def test_events_dispatch_by_method_and_context(fake_bidi_server):
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    seen = []
+    try:
+        def on_a(event):
+            seen.append(("a", event["method"]))
+
+        def on_b(event):
+            seen.append(("b", event["method"]))
+
+        def on_any(event):
+            seen.append(("any", event["method"]))
+
+        client.on_event(on_a, ["log.entryAdded", "network.beforeRequestSent"], "ctx-a")
+        client.on_event(on_b, ["log.entryAdded"], "ctx-b")
+        client.on_event(on_any)
+
+        await fake_bidi_server.emit("log.entryAdded", {"source": {"context": "ctx-a"}})
+        await fake_bidi_server.emit("network.beforeRequestSent", {"context": "ctx-b"})
+        await fake_bidi_server.emit("log.entryAdded", {})
+        await client.send("sync")
+        await _drain(client)
+
+        assert seen == [
+            ("a", "log.entryAdded"),
+            ("any", "log.entryAdded"),
+            ("any", "network.beforeRequestSent"),
+            ("a", "log.entryAdded"),
+            ("b", "log.entryAdded"),
+            ("any", "log.entryAdded"),
+        ]
+    finally:
+        await client.close()
+
+
+async def test_remove_event_handler_clears_index(fake_bidi_server):
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    seen = []
+    try:
+        handler = seen.append
+        client.on_event(handler, ["log.entryAdded"], "ctx-a")
+        client.remove_event_handler(handler)
+        assert client._event_handlers == {}
+
+        await fake_bidi_server.emit("log.entryAdded", {"source": {"context": "ctx-a"}})
+        await client.send("sync")
+        await _drain(client)
+        assert seen == []
+    finally:
+        await client.close()
+
+
+async def test_slow_event_handler_does_not_delay_replies(fake_bidi_server):
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    delivered = []
+    try:
+        def slow(event):
+            time.sleep(0.01)
+            delivered.append(event)
+
+        client.on_event(slow)
+        for i in range(50):
+            await fake_bidi_server.emit("log.entryAdded", {"n": i})
+        start = time.perf_counter()
+        await client.send("ping")
+        assert time.perf_counter() - start < 0.25
+        assert len(delivered) < 50
+        await _drain(client)
+        assert [e["params"]["n"] for e in delivered] == list(range(50))
+    finally:
+        await client.close()
+
+
+async def test_event_overflow_policies(fake_bidi_server):
+    client = await BiDiClient.connect(
+        fake_bidi_server.url,
+        event_queue_size=2,
+        event_policies={"log.entryAdded": "drop_oldest", "vibium:ws.message": "coalesce"},
+    )
+    try:
+        # Park the consumer so events stay queued
+        client._event_task.cancel()
+
+        def event(method, n, context="ctx"):
+            return {"method": method, "params": {"context": context, "n": n}}
+
+        client._enqueue_event(event("vibium:ws.message", 1))
+        client._enqueue_event(event("vibium:ws.message", 2))
+        client._enqueue_event(event("log.entryAdded", 1))
+        client._enqueue_event(event("log.entryAdded", 2))
+
+        stats = client.event_queue_stats()
+        assert stats["depth"] == 2
+        assert stats["coalesced"] == {"vibium:ws.message": 1}
+        assert stats["dropped"] == {"vibium:ws.message": 1}
+        assert [e[0]["params"]["n"] for e in client._event_queue] == [1, 2]
+    finally:
+        await client.close()
+
+
+async def test_full_event_queue_does_not_delay_replies(fake_bidi_server):
+    """"block" events wait for room in order, while command responses keep flowing."""
+    client = await BiDiClient.connect(fake_bidi_server.url, event_queue_size=2)
+    delivered = []
+    try:
+        client.on_event(delivered.append)
+        client._event_task.cancel()  # park the consumer so the queue fills up
+        for i in range(10):
+            await fake_bidi_server.emit("log.entryAdded", {"n": i})
+        assert (await asyncio.wait_for(client.send("ping"), 1))["method"] == "ping"
+        stats = client.event_queue_stats()
+        assert (stats["depth"], stats["waiting"], stats["dropped"]) == (2, 8, {})
+
+        client._event_task = asyncio.create_task(client._event_loop())
+        await _drain(client)
+        assert [e["params"]["n"] for e in delivered] == list(range(10))
+        assert client.event_queue_stats()["waiting"] == 0
+    finally:
+        await client.close()
+
+
+def test_unknown_event_policy_rejected():
+    with pytest.raises(ValueError):
+        BiDiClient(None, event_policies={"log.entryAdded": "ignore"})
+
+
+async def test_send_timeout_cleans_up(fake_bidi_server):
+    async def stall(params):
+        await asyncio.sleep(1)
+
+    fake_bidi_server.on("stall", stall)
+    client = await BiDiClient.connect(fake_bidi_server.url, command_timeout=50)
+    try:
+        with pytest.raises(TimeoutError):
+            await client.send("stall")
+        assert not client._pending
+        assert client.command_stats()["timed_out"] == {"stall": 1}
+        # The connection is still usable afterwards
+        assert (await client.send("ping"))["method"] == "ping"
+    finally:
+        await client.close()
+
+
+async def test_server_side_timeout_extends_wait(fake_bidi_server):
+    async def slow(params):
+        await asyncio.sleep(0.1)
+        return {"ok": True}
+
+    fake_bidi_server.on("slow", slow)
+    client = await BiDiClient.connect(fake_bidi_server.url, command_timeout=20)
+    try:
+        assert await client.send("slow", {"timeout": 1000}) == {"ok": True}
+        with pytest.raises(TimeoutError):
+            await client.send("slow", {"timeout": 1000}, timeout=20)
+    finally:
+        await client.close()
+
+
+async def test_page_wait_extends_wait(fake_bidi_server):
+    """page.wait(ms) is not cut short by a shorter command timeout."""
+    async def wait(params):
+        await asyncio.sleep(params["ms"] / 1000)
+        return {}
+
+    fake_bidi_server.on("vibium:page.wait", wait)
+    client = await BiDiClient.connect(fake_bidi_server.url, command_timeout=50)
+    try:
+        assert await client.send("vibium:page.wait", {"context": "ctx-1", "ms": 200}) == {}
+        assert client.command_stats()["timed_out"] == {}
+    finally:
+        await client.close()
+
+
+async def test_deadline_spans_command_chain(fake_bidi_server):
+    async def slow(params):
+        await asyncio.sleep(0.06)
+
+    fake_bidi_server.on("slow", slow)
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    try:
+        with client.deadline(100):
+            await client.send("slow")
+            with pytest.raises(TimeoutError):
+                await client.send("slow")
+            with pytest.raises(TimeoutError):
+                await client.send("ping")
+        assert client.command_stats()["timed_out"] == {"slow": 1, "ping": 1}
+        await client.send("slow")
+    finally:
+        await client.close()
+
+
+async def test_cancelled_send_cleans_up(fake_bidi_server):
+    async def stall(params):
+        await asyncio.sleep(1)
+
+    fake_bidi_server.on("stall", stall)
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    try:
+        task = asyncio.ensure_future(client.send("stall"))
+        await asyncio.sleep(0.05)
+        assert client.command_stats()["in_flight"] == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not client._pending
+        assert client.command_stats()["cancelled"] == {"stall": 1}
+    finally:
+        await client.close()
+
+
+async def test_send_streamed_writes_chunks(fake_bidi_server):
+    import base64
+    import io
+
+    payload = bytes(range(256)) * 40
+    streams = {}
+
+    def screenshot(params):
+        assert params["stream"] is True
+        streams["s1"] = 0
+        return {"stream": "s1", "size": len(payload)}
+
+    def read(params):
+        offset = streams[params["stream"]]
+        end = min(offset + params["size"], len(payload))
+        streams[params["stream"]] = end
+        return {"data": base64.b64encode(payload[offset:end]).decode(), "eof": end == len(payload)}
+
+    fake_bidi_server.on("vibium:page.screenshot", screenshot)
+    fake_bidi_server.on("vibium:stream.read", read)
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    try:
+        buffer = io.BytesIO()
+        written = await client.send_streamed("vibium:page.screenshot", {"context": "c"}, buffer, chunk_size=3000)
+        assert written == len(payload)
+        assert buffer.getvalue() == payload
+        reads = [c for c in fake_bidi_server.received if c["method"] == "vibium:stream.read"]
+        assert len(reads) == 4
+    finally:
+        await client.close()
+
+
+async def test_frame_over_max_size_fails_pending(fake_bidi_server):
+    fake_bidi_server.on("big", lambda params: {"data": "x" * 4096})
+    client = await BiDiClient.connect(fake_bidi_server.url, max_frame_size=1024)
+    try:
+        with pytest.raises(ConnectionError):
+            await client.send("big")
+    finally:
+        await client.close()
+
+
+async def test_contexts_are_spread_across_shards(fake_bidi_server):
+    from vibium.async_api.browser import Browser
+
+    counter = iter(range(100))
+    fake_bidi_server.on("vibium:browser.newContext", lambda params: {"userContext": f"uc-{next(counter)}"})
+    fake_bidi_server.on("vibium:browser.pages", lambda params: {"pages": [{"context": f"p-{next(counter)}"}]})
+    primary = await BiDiClient.connect(fake_bidi_server.url)
+    shard = await BiDiClient.connect(fake_bidi_server.url)
+    bro = Browser(primary, None, [shard])
+    try:
+        contexts = [await bro.new_context() for _ in range(3)]
+        assert [c._client for c in contexts] == [primary, shard, primary]
+        pages = await bro.pages()
+        assert [p._client for p in pages] == [primary, shard]
+    finally:
+        await bro.close()
+
+
+async def test_subscribe_is_sent_before_next_command(fake_bidi_server):
+    fake_bidi_server.on("vibium:session.subscribe", lambda params: {"subscription": "sub-1"})
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    try:
+        subscription = client.subscribe_soon(["log.entryAdded"], ["ctx-1"])
+        await client.send("ping")
+        assert [c["method"] for c in fake_bidi_server.received] == ["vibium:session.subscribe", "ping"]
+        assert fake_bidi_server.received[0]["params"] == {"events": ["log.entryAdded"], "contexts": ["ctx-1"]}
+        assert await subscription == "sub-1"
+
+        client.unsubscribe_soon(subscription)
+        await client.send("ping")
+        assert fake_bidi_server.received[-2]["method"] == "vibium:session.unsubscribe"
+        assert fake_bidi_server.received[-2]["params"] == {"subscription": "sub-1"}
+        assert not client._pending
+
+        # Also safe to call from another thread
+        other = await asyncio.to_thread(client.subscribe_soon, ["network.responseCompleted"])
+        assert await other == "sub-1"
+    finally:
+        await client.close()
+
+
+async def test_page_subscribes_per_listener_group(fake_bidi_server):
+    from vibium.async_api.page import Page
+
+    ids = iter(range(100))
+    fake_bidi_server.on("vibium:session.subscribe", lambda params: {"subscription": f"sub-{next(ids)}"})
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    try:
+        page = Page(client, "ctx-1")
+        page.on_console(lambda msg: None)
+        page.on_error(lambda err: None)
+        await client.send("ping")
+
+        subscribes = [c for c in fake_bidi_server.received if c["method"] == "vibium:session.subscribe"]
+        assert [c["params"] for c in subscribes] == [{"events": ["log.entryAdded"], "contexts": ["ctx-1"]}]
+        await page._subscriptions["log"]
+
+        page.remove_all_listeners("console")
+        await client.send("ping")
+        assert fake_bidi_server.received[-2]["method"] != "vibium:session.unsubscribe"
+
+        page.remove_all_listeners("error")
+        await client.send("ping")
+        assert fake_bidi_server.received[-2]["method"] == "vibium:session.unsubscribe"
+        assert fake_bidi_server.received[-2]["params"] == {"subscription": "sub-0"}
+    finally:
+        await client.close()
+
+
+async def test_metrics_snapshot_and_exporter(fake_bidi_server):
+    def fail(params):
+        raise FakeBiDiError("no such element", "boom")
+
+    fake_bidi_server.on("bad", fail)
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    observed = []
+    client.metrics.add_exporter(lambda name, method, value: observed.append((name, method)))
+    client.on_event(lambda event: time.sleep(0.002), ["log.entryAdded"])
+    try:
+        await client.send_many([("vibium:find", {}), ("vibium:find", {})])
+        with pytest.raises(BiDiError):
+            await client.send("bad")
+        await fake_bidi_server.emit("log.entryAdded", {"type": "console"})
+        await client.send("ping")
+        await _drain(client)
+
+        snapshot = client.metrics_snapshot()
+        assert snapshot["commands"]["vibium:find"]["count"] == 2
+        assert snapshot["commands"]["bad"]["errors"] == 1
+        assert snapshot["commands"]["ping"]["p50"] > 0
+        assert snapshot["events"]["log.entryAdded"]["count"] == 1
+        assert snapshot["handlers"]["log.entryAdded"]["max"] >= 2
+        assert snapshot["bytes_sent"] > 0 and snapshot["bytes_received"] > snapshot["bytes_sent"]
+        assert snapshot["in_flight"] == 0
+        assert ("command.error", "bad") in observed
+        assert ("event", "log.entryAdded") in observed
+        assert ("bytes.received", None) in observed
+    finally:
+        await client.close()
+
+
+async def test_bytes_sent_counts_utf8(fake_bidi_server):
+    pytest.importorskip("orjson")
+    client = await BiDiClient.connect(fake_bidi_server.url, codec="orjson")
+    try:
+        params = {"text": "héllo ✓"}
+        await client.send("input.type", params)
+        command = {"id": fake_bidi_server.received[-1]["id"], "method": "input.type", "params": params}
+        assert client.metrics.bytes_sent == len(client._codec.encode(command).encode())
+    finally:
+        await client.close()
+
+
+async def test_reconnect_replays_read_only_commands(fake_bidi_server):
+    fake_bidi_server.on("vibium:session.resumable", lambda params: {"token": "tok"})
+    calls = []
+
+    def title(params):
+        calls.append(params)
+        if len(calls) == 1:
+            fake_bidi_server.drop()  # lose the connection instead of answering
+        return {"title": "ok"}
+
+    fake_bidi_server.on("vibium:page.title", title)
+    fake_bidi_server.on("vibium:click", lambda params: asyncio.sleep(0.2))
+    client = await BiDiClient.connect(fake_bidi_server.url, reconnect_timeout=5000)
+    try:
+        click = asyncio.ensure_future(client.send("vibium:click", {}))
+        await asyncio.sleep(0.05)
+        assert await client.send("vibium:page.title", {"context": "ctx-1"}) == {"title": "ok"}
+        assert len(calls) == 2
+        with pytest.raises(ConnectionError):
+            await click
+        assert (await client.send("ping"))["method"] == "ping"
+        assert client.command_stats()["reconnects"] == 1
+    finally:
+        await client.close()
+
+
+async def test_late_reply_to_failed_command_is_ignored(fake_bidi_server):
+    """After a resume, the server's reply to a failed non-replayable command must not break the client."""
+    import json
+
+    resumes = []
+
+    def resumable(params):
+        resumes.append(params)
+        if len(resumes) == 2:
+            # Answer the lost click on the new socket, right after the resume
+            click_id = next(c["id"] for c in fake_bidi_server.received if c["method"] == "vibium:click")
+            reply = json.dumps({"id": click_id, "type": "success", "result": {}})
+            asyncio.get_running_loop().call_soon(
+                lambda: asyncio.ensure_future(fake_bidi_server.connections[-1].send(reply))
+            )
+        return {"token": "tok"}
+
+    fake_bidi_server.on("vibium:session.resumable", resumable)
+    fake_bidi_server.on("vibium:click", lambda params: fake_bidi_server.drop())
+    client = await BiDiClient.connect(fake_bidi_server.url, reconnect_timeout=5000)
+    try:
+        with pytest.raises(ConnectionError):
+            await client.send("vibium:click", {})
+        await asyncio.sleep(0.05)
+        assert (await client.send("ping", timeout=2000))["method"] == "ping"
+        assert client.command_stats()["in_flight"] == 0
+    finally:
+        await client.close()
+
+
+async def test_reconnect_fails_when_session_is_gone(fake_bidi_server):
+    tokens = iter(["tok", "other"])
+    fake_bidi_server.on("vibium:session.resumable", lambda params: {"token": next(tokens)})
+    client = await BiDiClient.connect(fake_bidi_server.url, reconnect_timeout=5000)
+    try:
+        fake_bidi_server.on("vibium:page.title", lambda params: fake_bidi_server.drop())
+        with pytest.raises(ConnectionError):
+            await client.send("vibium:page.title", {})
+        assert client.command_stats()["reconnects"] == 0
+    finally:
+        await client.close()
+
+
+async def test_connect_attaches_without_owning_server(fake_bidi_server):
+    from vibium.async_api.browser import browser
+
+    bro = await browser.connect(fake_bidi_server.url, connections=2)
+    assert bro._process is None
+    assert bro.startup_timings == {}
+    await bro.close()
+    methods = [c["method"] for c in fake_bidi_server.received]
+    assert methods.count("session.status") == 2
+    assert methods.count("vibium:browser.close") == 2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="asyncio has no Unix sockets on Windows")
+async def test_unix_socket_transport(tmp_path):
+    from fake_bidi_server import FakeBiDiServer
+
+    server = await FakeBiDiServer().start(socket_path=str(tmp_path / "vibium.sock"))
+    server.on("vibium:session.resumable", lambda params: {"token": "tok"})
+    client = await BiDiClient.connect(server.url, unix_socket=server.socket_path, reconnect_timeout=5000)
+    try:
+        assert (await client.send("ping"))["method"] == "ping"
+        server.drop()
+
+        async def reconnected():
+            while client.command_stats()["reconnects"] == 0:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(reconnected(), 5)
+        assert (await client.send("ping"))["method"] == "ping"
+    finally:
+        await client.close()
+        await server.stop()
+
+
+def test_sync_browsers_share_loop_threads():
+    """Sync browsers share loop threads and serve several caller threads at once."""
+    import threading
+
+    from fake_bidi_server import FakeBiDiServer
+    from vibium import browser
+    from vibium._sync_base import _EventLoopThread, _loop_threads
+
+    async def slow_pages(params):
+        await asyncio.sleep(0.2)
+        return {"pages": []}
+
+    # The server needs a loop of its own, since this test blocks in sync calls
+    server_loop = _EventLoopThread()
+    server_loop.start()
+    server = server_loop.run(FakeBiDiServer().start())
+    server.on("vibium:browser.pages", slow_pages)
+    try:
+        browsers = [browser.connect(server.url) for _ in range(3)]
+        assert len({id(b._loop) for b in browsers}) == 1
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=b.pages) for b in browsers]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert time.monotonic() - start < 0.5  # serially it would take 0.6s+
+
+        loop_thread = browsers[0]._loop
+        for b in browsers:
+            b.close()
+        browsers[0].close()  # closing twice is harmless
+        assert loop_thread not in _loop_threads._users
+        assert loop_thread._thread is None  # stopped with its last browser
+    finally:
+        server_loop.run(server.stop())
+        server_loop.stop()
+
+
+def test_loop_thread_pool_spreads_browsers():
+    from vibium._sync_base import _LoopThreadPool
+
+    pool = _LoopThreadPool(size=2)
+    a, b, c = pool.acquire(), pool.acquire(), pool.acquire()
+    try:
+        assert a is not b and c in (a, b)
+        with pytest.raises(RuntimeError):
+            a.run(_call_run_on(a))
+    finally:
+        for thread in (a, b, c):
+            pool.release(thread)
+    assert not pool._threads
+
+
+async def _call_run_on(thread):
+    """Call the sync bridge from inside its own loop, like a sync callback would."""
+    return thread.run(asyncio.sleep(0))
+
+
+async def test_close_fails_commands_still_waiting(fake_bidi_server):
+    """Closing the client fails sync and async callers at once instead of leaving them to time out."""
+    import threading
+
+    answer = asyncio.Event()
+
+    async def stall(params):
+        await answer.wait()
+
+    fake_bidi_server.on("stall", stall)
+    client = await BiDiClient.connect(fake_bidi_server.url, command_timeout=None)
+    errors = []
+
+    def call():
+        try:
+            client.send_threadsafe("stall")
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=call)
+    thread.start()
+    pending = asyncio.ensure_future(client.send("stall"))
+    try:
+        while len(client._pending) < 2:
+            await asyncio.sleep(0.01)
+        await client.close()
+        with pytest.raises(ConnectionError):
+            await pending
+        await asyncio.get_running_loop().run_in_executor(None, thread.join, 5)
+        assert [type(e) for e in errors] == [ConnectionError]
+        assert not client._pending
+    finally:
+        answer.set()
+
+
+def test_send_threadsafe_from_caller_thread():
+    """Sync getters send straight from the caller thread; errors and timeouts still apply."""
+    from fake_bidi_server import FakeBiDiServer
+    from vibium import browser
+    from vibium._sync_base import _EventLoopThread, _loop_threads
+    from vibium._types import _Command
+
+    def fail(params):
+        raise FakeBiDiError("no such element", "gone")
+
+    async def slow(params):
+        await asyncio.sleep(0.1)
+        return {}
+
+    server_loop = _EventLoopThread()
+    server_loop.start()
+    server = server_loop.run(FakeBiDiServer().start())
+    server.on("vibium:browser.page", lambda params: {"context": "ctx-1"})
+    server.on("vibium:page.url", lambda params: {"url": "https://a/"})
+    server.on("vibium:el.text", fail)
+    server.on("slow", slow)
+    try:
+        bro = browser.connect(server.url)
+        vibe = bro.page()
+        assert bro.page() is vibe
+        assert vibe.url() == "https://a/"
+        assert server.received[-1]["params"] == {"context": "ctx-1"}
+        vibe.keyboard.press("Enter")
+        assert server.received[-1]["params"] == {"context": "ctx-1", "key": "Enter"}
+
+        client = bro._async._client
+        with pytest.raises(BiDiError, match="no such element"):
+            bro._loop.send(client, _Command("vibium:el.text", {}))
+        with pytest.raises(TimeoutError):
+            bro._loop.send(client, _Command("slow", {}), timeout=20)
+        time.sleep(0.2)  # the late response is ignored
+        assert bro._loop.send(client, _Command("echo", {"n": 1}, "params")) == {"n": 1}
+        stats = bro._loop.run(_command_stats(client))
+        assert stats["in_flight"] == 0 and stats["timed_out"] == {"slow": 1}
+
+        # A failed close still gives back the loop thread
+        server.on("vibium:browser.close", fail)
+        loop_thread = bro._loop
+        with pytest.raises(BiDiError):
+            bro.close()
+        assert loop_thread not in _loop_threads._users
+        bro.close()
+    finally:
+        server_loop.run(server.stop())
+        server_loop.stop()
+
+
+async def _command_stats(client):
+    return client.command_stats()
+
+
+def test_parallel_drives_pages_concurrently():
+    """vibium.parallel runs a sync function per page from a thread pool."""
+    import itertools
+    import threading
+
+    import vibium
+    from fake_bidi_server import FakeBiDiServer
+    from vibium._sync_base import _EventLoopThread
+
+    contexts = itertools.count(1)
+
+    async def slow_title(params):
+        await asyncio.sleep(0.2)
+        if params["context"] == "ctx-2":
+            raise FakeBiDiError("no such frame", "closed")
+        return {"title": params["context"]}
+
+    server_loop = _EventLoopThread()
+    server_loop.start()
+    server = server_loop.run(FakeBiDiServer().start())
+    server.on("vibium:browser.newPage", lambda params: {"context": f"ctx-{next(contexts)}"})
+    server.on("vibium:page.title", slow_title)
+    try:
+        bro = vibium.browser.connect(server.url)
+        pages = [bro.new_page() for _ in range(4)]
+        start = time.monotonic()
+        results = vibium.parallel(pages, lambda vibe: vibe.title())
+        assert time.monotonic() - start < 0.6  # serially it would take 0.8s+
+        assert results[0] == "ctx-1" and results[2:] == ["ctx-3", "ctx-4"]
+        assert isinstance(results[1], BiDiError)
+        assert vibium.parallel([], lambda vibe: vibe.title()) == []
+
+        # Registering callbacks from a worker thread happens on the loop thread
+        seen = []
+        bro._loop.call(lambda: seen.append(threading.current_thread().name))
+        assert seen[0].startswith("vibium-loop-")
+        vibium.parallel(pages, lambda vibe: vibe.on_console(), max_workers=2)
+        vibium.parallel(pages, lambda vibe: vibe.remove_all_listeners())
+        bro.close()
+    finally:
+        server_loop.run(server.stop())
+        server_loop.stop()
+
+
+def test_parallel_bounds_its_threads():
+    import threading
+
+    import vibium
+    from vibium.sync_api._parallel import DEFAULT_MAX_WORKERS
+
+    def name(i):
+        time.sleep(0.001)
+        return threading.current_thread().name
+
+    names = vibium.parallel(range(DEFAULT_MAX_WORKERS * 3), name)
+    assert len(names) == DEFAULT_MAX_WORKERS * 3
+    assert 1 < len(set(names)) <= DEFAULT_MAX_WORKERS
+    assert len(set(vibium.parallel(range(10), name, max_workers=2))) <= 2
+
+
+def test_sync_callbacks_run_off_the_loop_thread():
+    """Sync route and dialog callbacks run on a worker, in order, and may use the sync API."""
+    import threading
+
+    import vibium
+    from fake_bidi_server import FakeBiDiServer
+    from vibium._sync_base import _EventLoopThread
+
+    server_loop = _EventLoopThread()
+    server_loop.start()
+    server = server_loop.run(FakeBiDiServer().start())
+    server.on("vibium:browser.page", lambda params: {"context": "ctx-1"})
+    server.on("vibium:page.route", lambda params: {"intercept": "i-1"})
+    server.on("vibium:page.url", lambda params: {"url": "https://a/"})
+    calls = []
+
+    def on_dialog(dialog):
+        calls.append(("dialog", threading.current_thread().name))
+        time.sleep(0.3)  # a slow handler must not stall the loop
+        dialog.accept()
+
+    def on_route(route):
+        calls.append(("route", route.request["url"], vibe.url()))  # re-entering the sync API is fine
+        route.fulfill(status=204)
+
+    try:
+        bro = vibium.browser.connect(server.url)
+        vibe = bro.page()
+        vibe.on_dialog(on_dialog)
+        vibe.route("**/api", on_route)
+        server_loop.run(server.emit("browsingContext.userPromptOpened", {
+            "context": "ctx-1", "type": "alert", "message": "hi",
+        }))
+        server_loop.run(server.emit("network.beforeRequestSent", {
+            "context": "ctx-1", "isBlocked": True,
+            "request": {"request": "r-1", "url": "https://a/api", "method": "GET", "headers": []},
+        }))
+
+        start = time.monotonic()
+        assert vibe.url() == "https://a/"
+        assert time.monotonic() - start < 0.2  # answered while the dialog handler sleeps
+
+        deadline = time.monotonic() + 5
+        while not any(c["method"] == "vibium:network.fulfill" for c in server.received):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert calls[0][0] == "dialog" and calls[0][1].startswith("vibium-callback")
+        assert calls[1] == ("route", "https://a/api", "https://a/")  # after the dialog, per page
+        methods = [c["method"] for c in server.received]
+        assert methods.index("browsingContext.handleUserPrompt") < methods.index("vibium:network.fulfill")
+        bro.close()
+    finally:
+        server_loop.run(server.stop())
+        server_loop.stop()
+
+
+def test_callbacks_may_wait_on_their_own_page():
+    """A route handler can load another URL routed on its page; a dialog handler can evaluate once it decided."""
+    import asyncio
+
+    import vibium
+    from fake_bidi_server import FakeBiDiServer
+    from vibium._sync_base import _EventLoopThread
+
+    server_loop = _EventLoopThread()
+    server_loop.start()
+    server = server_loop.run(FakeBiDiServer().start())
+    server.on("vibium:browser.page", lambda params: {"context": "ctx-1"})
+    server.on("vibium:page.route", lambda params: {"intercept": "i-1"})
+
+    def request(request_id, url):
+        return server.emit("network.beforeRequestSent", {
+            "context": "ctx-1", "isBlocked": True,
+            "request": {"request": request_id, "url": url, "method": "GET", "headers": []},
+        })
+
+    def fulfilled():
+        return [c["params"]["request"] for c in server.received if c["method"] == "vibium:network.fulfill"]
+
+    def received(method):
+        return any(c["method"] == method for c in server.received)
+
+    async def run_script(params):
+        # Like a browser: script waits while a dialog is open, and a fetch()
+        # only finishes once its intercepted request has been decided
+        while not received("browsingContext.handleUserPrompt"):
+            await asyncio.sleep(0.01)
+        if "fetch" in params["functionDeclaration"]:
+            await request("r-2", "https://a/api/2")
+            while "r-2" not in fulfilled():
+                await asyncio.sleep(0.01)
+        return {"result": {"type": "string", "value": "done"}}
+
+    server.on("script.callFunction", run_script)
+    calls = []
+
+    def on_dialog(dialog):
+        dialog.accept()
+        calls.append(("dialog", vibe.evaluate("return 1")))
+
+    def on_route(route):
+        url = route.request["url"]
+        if url.endswith("/1"):
+            calls.append(("fetch", vibe.evaluate("await fetch('/api/2')")))
+        calls.append(url)
+        route.fulfill(status=204)
+
+    try:
+        bro = vibium.browser.connect(server.url, command_timeout=2000)
+        vibe = bro.page()
+        vibe.on_dialog(on_dialog)
+        vibe.route("**/api/*", on_route)
+        server_loop.run(server.emit("browsingContext.userPromptOpened", {
+            "context": "ctx-1", "type": "alert", "message": "hi",
+        }))
+        server_loop.run(request("r-1", "https://a/api/1"))
+
+        deadline = time.monotonic() + 5
+        while sorted(fulfilled()) != ["r-1", "r-2"] or len(calls) < 4:
+            assert time.monotonic() < deadline, calls
+            time.sleep(0.01)
+        assert calls.index("https://a/api/2") < calls.index(("fetch", "done"))
+        assert ("dialog", "done") in calls
+        assert fulfilled() == ["r-2", "r-1"]
+        assert bro._async._client.command_stats()["timed_out"] == {}
+        bro.close()
+    finally:
+        server_loop.run(server.stop())
+        server_loop.stop()
+
+
+async def test_pages_are_unique_per_context_and_detach_when_destroyed(fake_bidi_server):
+    from vibium.async_api.browser import Browser
+
+    fake_bidi_server.on("vibium:browser.pages", lambda params: {
+        "pages": [{"context": "ctx-1"}, {"context": "ctx-2"}],
+    })
+    fake_bidi_server.on("vibium:page.frames", lambda params: {"frames": [{"context": "frame-1"}]})
+    client = await BiDiClient.connect(fake_bidi_server.url)
+    bro = Browser(client, None)
+    try:
+        first, second = await bro.pages()
+        assert await bro.pages() == [first, second]
+        (frame,) = await first.frames()
+        assert (await first.frames())[0] is frame
+        handlers = len(client._handler_keys)
+
+        # Destroying a page also destroys its frames
+        await fake_bidi_server.emit("browsingContext.contextDestroyed", {
+            "context": "ctx-1", "children": [{"context": "frame-1", "children": []}],
+        })
+        await client.send("ping")  # events are delivered by now
+        await asyncio.sleep(0.01)
+        assert len(client._handler_keys) == handlers - 2
+        assert first._event_handler not in client._handler_keys
+        assert (await bro.pages())[0] is not first
+
+        await second.close()
+        assert second._event_handler not in client._handler_keys
+        assert (await bro.pages())[1] is not second
+    finally:
+        await bro.close()
+
+
+def test_sync_fast_paths_send_the_same_payload_as_async():
+    """Sync wrappers that send directly build their commands with the async classes."""
+    from fake_bidi_server import FakeBiDiServer
+    from vibium import browser
+    from vibium._sync_base import _EventLoopThread
+    from vibium.async_api.element import Element as AsyncElement
+    from vibium.sync_api.element import Element
+
+    server_loop = _EventLoopThread()
+    server_loop.start()
+    server = server_loop.run(FakeBiDiServer().start())
+    server.on("vibium:browser.page", lambda params: {"context": "ctx-1"})
+    # Answer with every result field the getters read
+    fields = {"url": "u", "title": "t", "value": 1, "text": "x", "visible": True, "role": "r"}
+    for method in ("vibium:page.url", "vibium:page.title", "vibium:page.eval",
+                   "vibium:el.text", "vibium:el.attr", "vibium:el.isVisible", "vibium:el.role"):
+        server.on(method, lambda params: fields)
+    try:
+        bro = browser.connect(server.url)
+        vibe = bro.page()
+        el = Element(AsyncElement(vibe._async._client, "ctx-1", "#a", None, 2), bro._loop)
+        page_calls = [
+            lambda p: p.url(), lambda p: p.title(), lambda p: p.eval("1"),
+            lambda p: p.keyboard.press("a"), lambda p: p.keyboard.type("ab"),
+            lambda p: p.mouse.click(1, 2), lambda p: p.mouse.down(), lambda p: p.mouse.wheel(0, 5),
+            lambda p: p.touch.tap(3, 4),
+        ]
+        element_calls = [lambda e: e.text(), lambda e: e.attr("href"), lambda e: e.is_visible(), lambda e: e.role()]
+
+        for target, calls in ((vibe, page_calls), (el, element_calls)):
+            for call in calls:
+                sync_result = call(target)
+                sync_sent = server.received[-1]
+                async_result = bro._loop.run(_await(call(target._async)))
+                async_sent = server.received[-1]
+                assert (sync_sent["method"], sync_sent["params"]) == (async_sent["method"], async_sent["params"])
+                assert sync_result == async_result
+        bro.close()
+    finally:
+        server_loop.run(server.stop())
+        server_loop.stop()
+
+
+async def _await(awaitable):
+    return await awaitable